@@ -14,71 +14,155 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .ace2 import ACE2ERA5Data
-from .arco import ARCO
+from typing import TYPE_CHECKING
+
+from earth2studio.utils.imports import lazy_import_attributes
+
 from .base import DataSource, ForecastSource
-from .cams import CAMS_FX
-from .cbottle import CBottle3D
-from .cds import CDS
-from .cfs import CFS_FX, CFS_FX_Flux
-from .cfs_reforecast import CFS_Reforecast_FX, CFS_Reforecast_FX_Flux
-from .cmip6 import CMIP6, CMIP6MultiRealm
-from .const import Constant, Constant_FX
-from .dynamical import (
-    DynamicalAIFS_FX,
-    DynamicalAIFSENS_FX,
-    DynamicalGEFS,
-    DynamicalGEFS_FX,
-    DynamicalGFS,
-    DynamicalGFS_FX,
-    DynamicalIFSENS_FX,
-)
-from .earthmover import (
-    EarthMoverBrightBandIFS,
-    EarthMoverBrightBandIFS_FX,
-    EarthMoverERA5,
-)
-from .ecmwf import AIFS_ENS_FX, AIFS_FX, IFS, IFS_ENS, IFS_ENS_FX, IFS_FX
-from .gdas import NomadsGDASObsConv
-from .gefs import GEFS_FX, GEFS_FX_721x1440
-from .gfs import GFS, GFS_FX
-from .ghcn import GHCNDaily, GHCNHourly
-from .goes import GOES
-from .goes_glm import GOESGLM, GOESGLMGrid
-from .himawari_ahi import HimawariAHI
-from .hrrr import HRRR, HRRR_FX
-from .ibtracs import IBTrACS
-from .isd import ISD
-from .jpss import JPSS
-from .jpss_atms import JPSS_ATMS
-from .jpss_cris import JPSS_CRIS
-from .meteosat_fci import MeteosatFCI
-from .metop_amsua import MetOpAMSUA
-from .metop_avhrr import MetOpAVHRR
-from .metop_iasi import MetOpIASI
-from .metop_mhs import MetOpMHS
-from .mrms import MRMS
-from .ncar import NCAR_ERA5
-from .nclimgrid import NClimGridDaily
-from .nnja import NNJAObsConv
-from .opera import OPERA
-from .planetary_computer import (
-    PlanetaryComputerECMWFOpenDataIFS,
-    PlanetaryComputerGOES,
-    PlanetaryComputerMODISFire,
-    PlanetaryComputerOISST,
-    PlanetaryComputerSentinel3AOD,
-)
-from .rand import Random, Random_FX, RandomDataFrame
-from .rx import CosineSolarZenith, LandSeaMask, SurfaceGeoPotential
-from .time_window import TimeWindow
-from .ufs import UFSObsConv, UFSObsSat
-from .utils import datasource_to_file, fetch_data, fetch_dataframe, prep_data_array
-from .wb2 import WB2ERA5, WB2Climatology, WB2ERA5_32x64, WB2ERA5_121x240
-from .xr import (
-    DataArrayDirectory,
-    DataArrayFile,
-    DataArrayPathList,
-    DataSetFile,
-    InferenceOutputSource,
-)
+
+if TYPE_CHECKING:
+    from .ace2 import ACE2ERA5Data
+    from .arco import ARCO
+    from .cams import CAMS_FX
+    from .cbottle import CBottle3D
+    from .cds import CDS
+    from .cfs import CFS_FX, CFS_FX_Flux
+    from .cfs_reforecast import CFS_Reforecast_FX, CFS_Reforecast_FX_Flux
+    from .cmip6 import CMIP6, CMIP6MultiRealm
+    from .const import Constant, Constant_FX
+    from .dynamical import (
+        DynamicalAIFS_FX,
+        DynamicalAIFSENS_FX,
+        DynamicalGEFS,
+        DynamicalGEFS_FX,
+        DynamicalGFS,
+        DynamicalGFS_FX,
+        DynamicalIFSENS_FX,
+    )
+    from .earthmover import (
+        EarthMoverBrightBandIFS,
+        EarthMoverBrightBandIFS_FX,
+        EarthMoverERA5,
+    )
+    from .ecmwf import AIFS_ENS_FX, AIFS_FX, IFS, IFS_ENS, IFS_ENS_FX, IFS_FX
+    from .gdas import NomadsGDASObsConv
+    from .gefs import GEFS_FX, GEFS_FX_721x1440
+    from .gfs import GFS, GFS_FX
+    from .ghcn import GHCNDaily, GHCNHourly
+    from .goes import GOES
+    from .goes_glm import GOESGLM, GOESGLMGrid
+    from .himawari_ahi import HimawariAHI
+    from .hrrr import HRRR, HRRR_FX
+    from .ibtracs import IBTrACS
+    from .isd import ISD
+    from .jpss import JPSS
+    from .jpss_atms import JPSS_ATMS
+    from .jpss_cris import JPSS_CRIS
+    from .meteosat_fci import MeteosatFCI
+    from .metop_amsua import MetOpAMSUA
+    from .metop_avhrr import MetOpAVHRR
+    from .metop_iasi import MetOpIASI
+    from .metop_mhs import MetOpMHS
+    from .mrms import MRMS
+    from .ncar import NCAR_ERA5
+    from .nclimgrid import NClimGridDaily
+    from .nnja import NNJAObsConv
+    from .opera import OPERA
+    from .planetary_computer import (
+        PlanetaryComputerECMWFOpenDataIFS,
+        PlanetaryComputerGOES,
+        PlanetaryComputerMODISFire,
+        PlanetaryComputerOISST,
+        PlanetaryComputerSentinel3AOD,
+    )
+    from .rand import Random, Random_FX, RandomDataFrame
+    from .rx import CosineSolarZenith, LandSeaMask, SurfaceGeoPotential
+    from .time_window import TimeWindow
+    from .ufs import UFSObsConv, UFSObsSat
+    from .utils import datasource_to_file, fetch_data, fetch_dataframe, prep_data_array
+    from .wb2 import WB2ERA5, WB2Climatology, WB2ERA5_32x64, WB2ERA5_121x240
+    from .xr import (
+        DataArrayDirectory,
+        DataArrayFile,
+        DataArrayPathList,
+        DataSetFile,
+        InferenceOutputSource,
+    )
+
+# Data sources (and their optional dependencies) are imported on first attribute
+# access
+_LAZY_IMPORTS = {
+    ".ace2": ["ACE2ERA5Data"],
+    ".arco": ["ARCO"],
+    ".cams": ["CAMS_FX"],
+    ".cbottle": ["CBottle3D"],
+    ".cds": ["CDS"],
+    ".cfs": ["CFS_FX", "CFS_FX_Flux"],
+    ".cfs_reforecast": ["CFS_Reforecast_FX", "CFS_Reforecast_FX_Flux"],
+    ".cmip6": ["CMIP6", "CMIP6MultiRealm"],
+    ".const": ["Constant", "Constant_FX"],
+    ".dynamical": [
+        "DynamicalAIFS_FX",
+        "DynamicalAIFSENS_FX",
+        "DynamicalGEFS",
+        "DynamicalGEFS_FX",
+        "DynamicalGFS",
+        "DynamicalGFS_FX",
+        "DynamicalIFSENS_FX",
+    ],
+    ".earthmover": [
+        "EarthMoverBrightBandIFS",
+        "EarthMoverBrightBandIFS_FX",
+        "EarthMoverERA5",
+    ],
+    ".ecmwf": ["AIFS_ENS_FX", "AIFS_FX", "IFS", "IFS_ENS", "IFS_ENS_FX", "IFS_FX"],
+    ".gdas": ["NomadsGDASObsConv"],
+    ".gefs": ["GEFS_FX", "GEFS_FX_721x1440"],
+    ".gfs": ["GFS", "GFS_FX"],
+    ".ghcn": ["GHCNDaily", "GHCNHourly"],
+    ".goes": ["GOES"],
+    ".goes_glm": ["GOESGLM", "GOESGLMGrid"],
+    ".himawari_ahi": ["HimawariAHI"],
+    ".hrrr": ["HRRR", "HRRR_FX"],
+    ".ibtracs": ["IBTrACS"],
+    ".isd": ["ISD"],
+    ".jpss": ["JPSS"],
+    ".jpss_atms": ["JPSS_ATMS"],
+    ".jpss_cris": ["JPSS_CRIS"],
+    ".meteosat_fci": ["MeteosatFCI"],
+    ".metop_amsua": ["MetOpAMSUA"],
+    ".metop_avhrr": ["MetOpAVHRR"],
+    ".metop_iasi": ["MetOpIASI"],
+    ".metop_mhs": ["MetOpMHS"],
+    ".mrms": ["MRMS"],
+    ".ncar": ["NCAR_ERA5"],
+    ".nclimgrid": ["NClimGridDaily"],
+    ".nnja": ["NNJAObsConv"],
+    ".opera": ["OPERA"],
+    ".planetary_computer": [
+        "PlanetaryComputerECMWFOpenDataIFS",
+        "PlanetaryComputerGOES",
+        "PlanetaryComputerMODISFire",
+        "PlanetaryComputerOISST",
+        "PlanetaryComputerSentinel3AOD",
+    ],
+    ".rand": ["Random", "Random_FX", "RandomDataFrame"],
+    ".rx": ["CosineSolarZenith", "LandSeaMask", "SurfaceGeoPotential"],
+    ".time_window": ["TimeWindow"],
+    ".ufs": ["UFSObsConv", "UFSObsSat"],
+    ".utils": [
+        "datasource_to_file",
+        "fetch_data",
+        "fetch_dataframe",
+        "prep_data_array",
+    ],
+    ".wb2": ["WB2ERA5", "WB2Climatology", "WB2ERA5_32x64", "WB2ERA5_121x240"],
+    ".xr": [
+        "DataArrayDirectory",
+        "DataArrayFile",
+        "DataArrayPathList",
+        "DataSetFile",
+        "InferenceOutputSource",
+    ],
+}
+__getattr__, __dir__ = lazy_import_attributes(__name__, _LAZY_IMPORTS)
@@ -35,13 +35,15 @@ from tqdm.asyncio import tqdm
 from earth2studio.data.utils import (
     _sync_async,
     async_retry,
-    cancellable_to_thread,
+    cached_grib_index,
     datasource_cache_root,
     gather_with_concurrency,
+    obstore_fetch_ranges_to_cache,
     obstore_fetch_to_cache,
     obstore_store_from_url,
     prep_forecast_inputs,
     resolve_async_workers,
+    run_grib_decode,
 )
 from earth2studio.lexicon import CFSFluxLexicon, CFSLexicon
 from earth2studio.utils.type import LeadTimeArray, TimeArray, VariableArray
@@ -157,6 +159,9 @@ class CFS_FX:
     # Generous safety bound on a single grib message byte range; CFS pgbf
     # records (181 x 360 floats, simple-packed) are typically <2 MB.
     MAX_BYTE_SIZE = 5_000_000
+    # Adjacent grib messages are fetched with one request up to this span size
+    RANGE_MAX_GAP = 0
+    RANGE_MAX_SPAN = 64_000_000
 
     LEXICON: Any = CFSLexicon
 
@@ -324,6 +329,7 @@ class CFS_FX:
         )
 
         tasks = await self._create_tasks(time, lead_time, variable)
+        await self._prefetch_tasks(tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in tasks]
         await gather_with_concurrency(
             coros,
@@ -425,6 +431,45 @@ class CFS_FX:
                     )
         return tasks
 
+    async def _prefetch_tasks(self, tasks: list[CFSAsyncTask]) -> None:
+        """Download the grib messages of all tasks into the cache, fetching
+        adjacent messages of the same grib file with a single byte range request.
+
+        Parameters
+        ----------
+        tasks : list[CFSAsyncTask]
+            Download tasks.
+        """
+        # Ordered de-duplication, sibling tasks share one grib message
+        files: dict[str, dict[tuple[int, int], None]] = {}
+        for task in tasks:
+            # Open ranges (last record of a file) are left to fetch_wrapper
+            if task.cfs_byte_length is None or task.cfs_byte_length < 0:
+                continue
+            files.setdefault(task.cfs_file_uri, {})[
+                (task.cfs_byte_offset, task.cfs_byte_length)
+            ] = None
+
+        coros = [
+            async_retry(
+                self._fetch_remote_ranges,
+                uri,
+                list(ranges),
+                retries=self._retries,
+                backoff=1.0,
+                task_timeout=120.0,
+                exceptions=(OSError, IOError, TimeoutError, ConnectionError),
+            )
+            for uri, ranges in files.items()
+        ]
+        await gather_with_concurrency(
+            coros,
+            max_workers=resolve_async_workers(self._async_workers, len(coros)),
+            task_timeout=240.0,
+            desc="Prefetching CFS grib files",
+            verbose=(not self._verbose),
+        )
+
     async def fetch_wrapper(
         self,
         task: CFSAsyncTask,
@@ -466,9 +511,9 @@ class CFS_FX:
             byte_length=task.cfs_byte_length,
         )
 
-        # pygrib is sync-only.  Use cancellable_to_thread so a hung decode can
-        # be abandoned without holding the event loop.
-        values = await cancellable_to_thread(
+        # pygrib is sync-only.  Use run_grib_decode so a hung decode can be
+        # abandoned without holding the event loop.
+        values = await run_grib_decode(
             _decode_cfs_grib,
             grib_file,
             task.cfs_submsg_index,
@@ -562,6 +607,21 @@ class CFS_FX:
                 f"The specified data index, {index_uri}, does not exist. "
                 "Data seems to be missing."
             )
+        return cached_grib_index(local_path, self._parse_index, managed=self._cache)
+
+    def _parse_index(self, local_path: str) -> dict[str, tuple[int, int | None, int]]:
+        """Parse a local CFS index file
+
+        Parameters
+        ----------
+        local_path : str
+            Path to local grib index file
+
+        Returns
+        -------
+        dict[str, tuple[int, int | None, int]]
+            Parsed index table
+        """
         with open(local_path) as fh:
             index_lines = [line.rstrip() for line in fh if line.strip()]
 
@@ -655,6 +715,49 @@ class CFS_FX:
             byte_offset=byte_offset,
             byte_length=byte_length,
             cache_key=filename,
+            managed=self._cache,
+        )
+
+    async def _fetch_remote_ranges(
+        self, path: str, ranges: list[tuple[int, int]]
+    ) -> list[str]:
+        """Fetch byte ranges of a remote file into the local cache, coalescing
+        adjacent ranges into single requests.
+
+        Parameters
+        ----------
+        path : str
+            Remote URI (``bucket/key`` style for AWS or HTTPS URL for NOMADS).
+        ranges : list[tuple[int, int]]
+            Byte ranges as (offset, length) pairs.
+
+        Returns
+        -------
+        list[str]
+            Paths to the cached files on local disk, one per range.
+        """
+        if self.store is None:
+            raise ValueError("Object store is not initialized")
+
+        # Same cache file names as _fetch_remote_file
+        cache_keys = [
+            hashlib.sha256((path + str(offset)).encode()).hexdigest()
+            for offset, _ in ranges
+        ]
+        key = path.removeprefix(self.CFS_AWS_BUCKET + "/").removeprefix(
+            self.CFS_NOMADS_HOST + "/"
+        )
+        return await obstore_fetch_ranges_to_cache(
+            self.store,
+            key,
+            self.cache,
+            ranges,
+            cache_keys=cache_keys,
+            max_gap=self.RANGE_MAX_GAP,
+            max_span=self.RANGE_MAX_SPAN,
+            managed=self._cache,
+            # Prefetched files are counted when read by fetch_wrapper
+            record=False,
         )
 
     def _grib_uri(self, time: datetime, lead_time: timedelta) -> str:
@@ -34,13 +34,15 @@ from tqdm.asyncio import tqdm
 from earth2studio.data.utils import (
     _sync_async,
     async_retry,
-    cancellable_to_thread,
+    cached_grib_index,
     datasource_cache_root,
     gather_with_concurrency,
+    obstore_fetch_ranges_to_cache,
     obstore_fetch_to_cache,
     obstore_store_from_url,
     prep_forecast_inputs,
     resolve_async_workers,
+    run_grib_decode,
 )
 from earth2studio.lexicon import GEFSLexicon, GEFSLexiconSel
 from earth2studio.utils.type import LeadTimeArray, TimeArray, VariableArray
@@ -114,6 +116,9 @@ class GEFS_FX:
 
     GEFS_BUCKET_NAME = "noaa-gefs-pds"
     MAX_BYTE_SIZE = 5000000
+    # Adjacent grib messages are fetched with one request up to this span size
+    RANGE_MAX_GAP = 0
+    RANGE_MAX_SPAN = 64000000
 
     GEFS_LAT = np.linspace(90, -90, 361)
     GEFS_LON = np.linspace(0, 359.5, 720)
@@ -256,6 +261,7 @@ class GEFS_FX:
         )
 
         async_tasks = await self._create_tasks(time, lead_time, variable)
+        await self._prefetch_tasks(async_tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in async_tasks]
 
         await gather_with_concurrency(
@@ -353,6 +359,45 @@ class GEFS_FX:
                     )
         return tasks
 
+    async def _prefetch_tasks(self, tasks: list[GEFSAsyncTask]) -> None:
+        """Download the grib messages of all tasks into the cache, fetching adjacent
+        messages of the same grib file with a single byte range request
+
+        Parameters
+        ----------
+        tasks : list[GEFSAsyncTask]
+            Download tasks
+        """
+        # Ordered de-duplication, several variables can share one grib message
+        files: dict[str, dict[tuple[int, int], None]] = {}
+        for task in tasks:
+            # Last record of a file has an open range and is read by fetch_wrapper
+            if task.gefs_byte_length is None:
+                continue
+            files.setdefault(task.gefs_file_uri, {})[
+                (task.gefs_byte_offset, task.gefs_byte_length)
+            ] = None
+
+        coros = [
+            async_retry(
+                self._fetch_remote_ranges,
+                uri,
+                list(ranges),
+                retries=self._retries,
+                backoff=1.0,
+                task_timeout=120.0,
+                exceptions=(OSError, IOError, TimeoutError, ConnectionError),
+            )
+            for uri, ranges in files.items()
+        ]
+        await gather_with_concurrency(
+            coros,
+            max_workers=resolve_async_workers(self._async_workers, len(coros)),
+            task_timeout=240.0,
+            desc="Prefetching GEFS grib files",
+            verbose=(not self._verbose),
+        )
+
     async def fetch_wrapper(
         self,
         task: GEFSAsyncTask,
@@ -406,7 +451,7 @@ class GEFS_FX:
             byte_length=byte_length,
         )
         # pygrib decode is blocking and GIL-bound; run in a thread with timeout
-        values = await cancellable_to_thread(_decode_gefs_grib, grib_file, timeout=30.0)
+        values = await run_grib_decode(_decode_gefs_grib, grib_file, timeout=30.0)
         return modifier(values)
 
     def _validate_time(self, times: list[datetime]) -> None:
@@ -469,6 +514,21 @@ class GEFS_FX:
         """
         # Grab index file
         index_file = await self._fetch_remote_file(index_uri)
+        return cached_grib_index(index_file, self._parse_index, managed=self._cache)
+
+    def _parse_index(self, index_file: str) -> dict[str, tuple[int, int | None]]:
+        """Parse a local GEFS index file
+
+        Parameters
+        ----------
+        index_file : str
+            Path to local grib index file
+
+        Returns
+        -------
+        dict[str, tuple[int, int | None]]
+            Parsed index table
+        """
         with open(index_file) as file:
             records = [
                 lsplit for line in file if len(lsplit := line.rstrip().split(":")) >= 7
@@ -514,6 +574,34 @@ class GEFS_FX:
             byte_offset=byte_offset,
             byte_length=byte_length,
             cache_key=filename,
+            managed=self._cache,
+        )
+
+    async def _fetch_remote_ranges(
+        self, path: str, ranges: list[tuple[int, int]]
+    ) -> list[str]:
+        """Fetches byte ranges of a remote file into cache, coalescing adjacent
+        ranges"""
+        if self.store is None:
+            raise ValueError("Object store is not initialized")
+
+        # Same cache file names as _fetch_remote_file
+        cache_keys = [
+            hashlib.sha256((path + str(offset)).encode()).hexdigest()
+            for offset, _ in ranges
+        ]
+        key = path.removeprefix(self.GEFS_BUCKET_NAME + "/")
+        return await obstore_fetch_ranges_to_cache(
+            self.store,
+            key,
+            self.cache,
+            ranges,
+            cache_keys=cache_keys,
+            max_gap=self.RANGE_MAX_GAP,
+            max_span=self.RANGE_MAX_SPAN,
+            managed=self._cache,
+            # Prefetched files are counted when read by fetch_wrapper
+            record=False,
         )
 
     def _grib_uri(
@@ -34,14 +34,16 @@ from tqdm.asyncio import tqdm
 from earth2studio.data.utils import (
     _sync_async,
     async_retry,
-    cancellable_to_thread,
+    cached_grib_index,
     datasource_cache_root,
     gather_with_concurrency,
+    obstore_fetch_ranges_to_cache,
     obstore_fetch_to_cache,
     obstore_store_from_url,
     prep_data_inputs,
     prep_forecast_inputs,
     resolve_async_workers,
+    run_grib_decode,
 )
 from earth2studio.lexicon import GFSLexicon
 from earth2studio.utils.type import LeadTimeArray, TimeArray, VariableArray
@@ -109,6 +111,9 @@ class GFS:
 
     GFS_BUCKET_NAME = "noaa-gfs-bdp-pds"
     MAX_BYTE_SIZE = 5000000
+    # Adjacent grib messages are fetched with one request up to this span size
+    RANGE_MAX_GAP = 0
+    RANGE_MAX_SPAN = 64000000
 
     GFS_LAT = np.linspace(90, -90, 721)
     GFS_LON = np.linspace(0, 359.75, 1440)
@@ -255,6 +260,7 @@ class GFS:
         )
 
         async_tasks = await self._create_tasks(time, [timedelta(hours=0)], variable)
+        await self._prefetch_tasks(async_tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in async_tasks]
 
         await gather_with_concurrency(
@@ -338,6 +344,39 @@ class GFS:
                     )
         return tasks
 
+    async def _prefetch_tasks(self, tasks: list[GFSAsyncTask]) -> None:
+        """Download the grib messages of all tasks into the cache, fetching adjacent
+        messages of the same grib file with a single byte range request
+
+        Parameters
+        ----------
+        tasks : list[GFSAsyncTask]
+            Download tasks
+        """
+        files: dict[str, list[GFSAsyncTask]] = {}
+        for task in tasks:
+            files.setdefault(task.gfs_file_uri, []).append(task)
+
+        coros = [
+            async_retry(
+                self._fetch_remote_ranges,
+                uri,
+                [(t.gfs_byte_offset, t.gfs_byte_length) for t in file_tasks],
+                retries=self._retries,
+                backoff=1.0,
+                task_timeout=120.0,
+                exceptions=(OSError, IOError, TimeoutError, ConnectionError),
+            )
+            for uri, file_tasks in files.items()
+        ]
+        await gather_with_concurrency(
+            coros,
+            max_workers=resolve_async_workers(self._async_workers, len(coros)),
+            task_timeout=240.0,
+            desc="Prefetching GFS grib files",
+            verbose=(not self._verbose),
+        )
+
     async def fetch_wrapper(
         self,
         task: GFSAsyncTask,
@@ -391,7 +430,7 @@ class GFS:
             byte_length=byte_length,
         )
         # pygrib decode is blocking and GIL-bound; run in a thread with timeout
-        values = await cancellable_to_thread(_decode_gfs_grib, grib_file, timeout=30.0)
+        values = await run_grib_decode(_decode_gfs_grib, grib_file, timeout=30.0)
         return modifier(values)
 
     def _validate_time(self, times: list[datetime]) -> None:
@@ -430,6 +469,21 @@ class GFS:
             raise FileNotFoundError(
                 f"The specified data index, {index_uri}, does not exist. Data seems to be missing."
             )
+        return cached_grib_index(index_file, self._parse_index, managed=self._cache)
+
+    def _parse_index(self, index_file: str) -> dict[str, tuple[int, int]]:
+        """Parse a local GFS index file
+
+        Parameters
+        ----------
+        index_file : str
+            Path to local grib index file
+
+        Returns
+        -------
+        dict[str, tuple[int, int]]
+            Parsed index table
+        """
         with open(index_file) as file:
             index_lines = [line.rstrip() for line in file]
 
@@ -475,6 +529,34 @@ class GFS:
             byte_offset=byte_offset,
             byte_length=byte_length,
             cache_key=filename,
+            managed=self._cache,
+        )
+
+    async def _fetch_remote_ranges(
+        self, path: str, ranges: list[tuple[int, int]]
+    ) -> list[str]:
+        """Fetches byte ranges of a remote file into cache, coalescing adjacent
+        ranges"""
+        if self.store is None:
+            raise ValueError("Object store is not initialized")
+
+        # Same cache file names as _fetch_remote_file
+        cache_keys = [
+            hashlib.sha256((path + str(offset)).encode()).hexdigest()
+            for offset, _ in ranges
+        ]
+        key = path.removeprefix(self.GFS_BUCKET_NAME + "/")
+        return await obstore_fetch_ranges_to_cache(
+            self.store,
+            key,
+            self.cache,
+            ranges,
+            cache_keys=cache_keys,
+            max_gap=self.RANGE_MAX_GAP,
+            max_span=self.RANGE_MAX_SPAN,
+            managed=self._cache,
+            # Prefetched files are counted when read by fetch_wrapper
+            record=False,
         )
 
     def _grib_uri(self, time: datetime, lead_time: timedelta) -> str:
@@ -678,6 +760,7 @@ class GFS_FX(GFS):
         )
 
         async_tasks = await self._create_tasks(time, lead_time, variable)
+        await self._prefetch_tasks(async_tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in async_tasks]
 
         await gather_with_concurrency(
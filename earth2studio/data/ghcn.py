@@ -38,7 +38,10 @@ from earth2studio.data.utils import (
     datasource_cache_root,
     gather_with_concurrency,
     managed_session,
+    plan_partition_fetches,
     prep_data_inputs,
+    sort_by_time,
+    time_window_slice,
 )
 from earth2studio.lexicon.ghcn import GHCNDailyLexicon, GHCNHourlyLexicon
 from earth2studio.utils.time import normalize_time_tolerance
@@ -496,17 +499,15 @@ class GHCNDaily(_GHCNBase):
                 self._station_meta = self.get_station_metadata()
 
             # Build unique (year, product) pairs needed. Tolerance windows can
-            # span year boundaries, so enumerate every year in [tmin, tmax].
-            year_product_pairs: set[tuple[int, str]] = set()
-            for dt in time:
-                tmin = dt + self._tolerance_lower
-                tmax = dt + self._tolerance_upper
-                for product in products:
-                    for yr in range(tmin.year, tmax.year + 1):
-                        year_product_pairs.add((yr, product))
+            # span year boundaries, so every year in [tmin, tmax] is planned.
+            pair_list = sorted(
+                (year, product)
+                for product, year in plan_partition_fetches(
+                    products, time, self._tolerance_lower, self._tolerance_upper
+                )
+            )
 
             # Fetch all required parquet partitions in parallel
-            pair_list = sorted(year_product_pairs)
             coros = [
                 async_retry(
                     self._fetch_year_element,
@@ -527,9 +528,9 @@ class GHCNDaily(_GHCNBase):
                 verbose=(not self._verbose),
             )
 
-            # Index partitions by (year, product)
+            # Index partitions by (year, product), sorted by DATE for window slicing
             partition_map: dict[tuple[int, str], pd.DataFrame] = {
-                (year, product): df
+                (year, product): sort_by_time(df)
                 for (year, product), df in zip(pair_list, partition_dfs)
             }
 
@@ -558,12 +559,10 @@ class GHCNDaily(_GHCNBase):
                         if df is None or df.empty:
                             continue
 
+                        # Cut the date range (DATE is string YYYYMMDD, sorted)
+                        df = time_window_slice(df, date_min, date_max)
                         # Filter to requested stations
                         mask = df["ID"].isin(station_set)
-                        # Filter by date range (DATE is string YYYYMMDD)
-                        mask = (
-                            mask & (df["DATE"] >= date_min) & (df["DATE"] <= date_max)
-                        )
                         # Filter by quality flag: None/NaN means passed all QC
                         mask = mask & df["Q_FLAG"].isna()
 
@@ -953,16 +952,8 @@ class GHCNHourly(_GHCNBase):
             # Build unique (station, year) pairs, covering all years touched by
             # the tolerance window so cross-year windows (e.g. Jan 1 - 72h)
             # don't silently drop observations from the previous year.
-            station_year_pairs = sorted(
-                {
-                    (s, yr)
-                    for s in self.stations
-                    for dt in time
-                    for yr in range(
-                        (dt + self._tolerance_lower).year,
-                        (dt + self._tolerance_upper).year + 1,
-                    )
-                }
+            station_year_pairs = plan_partition_fetches(
+                self.stations, time, self._tolerance_lower, self._tolerance_upper
             )
 
             coros = [
@@ -985,9 +976,10 @@ class GHCNHourly(_GHCNBase):
                 verbose=(not self._verbose),
             )
 
-        # Map results back to (station, year)
+        # Map results back to (station, year), sorted by DATE for window slicing
         partition_map: dict[tuple[str, int], pd.DataFrame] = {
-            pair: df for pair, df in zip(station_year_pairs, station_year_dfs)
+            pair: sort_by_time(df)
+            for pair, df in zip(station_year_pairs, station_year_dfs)
         }
 
         filtered_df = []
@@ -1000,7 +992,7 @@ class GHCNHourly(_GHCNBase):
                     df = partition_map.get((station, yr))
                     if df is None or df.empty:
                         continue
-                    df_window = df[(df["DATE"] >= tmin) & (df["DATE"] <= tmax)]
+                    df_window = time_window_slice(df, tmin, tmax)
                     if not df_window.empty:
                         filtered_df.append(df_window)
 
@@ -33,14 +33,16 @@ from tqdm.asyncio import tqdm
 from earth2studio.data.utils import (
     _sync_async,
     async_retry,
-    cancellable_to_thread,
+    cached_grib_index,
     datasource_cache_root,
     gather_with_concurrency,
+    obstore_fetch_ranges_to_cache,
     obstore_fetch_to_cache,
     obstore_store_from_url,
     prep_data_inputs,
     prep_forecast_inputs,
     resolve_async_workers,
+    run_grib_decode,
 )
 from earth2studio.lexicon import HRRRFXLexicon, HRRRLexicon
 from earth2studio.utils.imports import (
@@ -133,6 +135,9 @@ class HRRR:
     HRRR_BUCKET_NAME = "noaa-hrrr-bdp-pds"
     HRRR_BUCKET_ANON = True  # S3 / GCS anon access
     MAX_BYTE_SIZE = 5000000
+    # Adjacent grib messages are fetched with one request up to this span size
+    RANGE_MAX_GAP = 0
+    RANGE_MAX_SPAN = 64000000
 
     # Native LCC coordinates from the HRRR Zarr archive managed by the University of Utah
     # https://registry.opendata.aws/noaa-hrrr-pds/
@@ -322,6 +327,7 @@ class HRRR:
         xr_array["hrrr_x"].attrs = {"standard_name": "longitude", "axis": "X"}
 
         async_tasks = await self._create_tasks(time, [timedelta(hours=0)], variable)
+        await self._prefetch_tasks(async_tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in async_tasks]
 
         await gather_with_concurrency(
@@ -437,6 +443,42 @@ class HRRR:
                     )
         return tasks
 
+    async def _prefetch_tasks(self, tasks: list[HRRRAsyncTask]) -> None:
+        """Download the grib messages of all tasks into the cache, fetching adjacent
+        messages of the same grib file with a single byte range request
+
+        Parameters
+        ----------
+        tasks : list[HRRRAsyncTask]
+            Download tasks
+        """
+        # Ordered de-duplication, several variables can share one grib message
+        files: dict[str, dict[tuple[int, int], None]] = {}
+        for task in tasks:
+            files.setdefault(task.hrrr_file_uri, {})[
+                (task.hrrr_byte_offset, task.hrrr_byte_length)
+            ] = None
+
+        coros = [
+            async_retry(
+                self._fetch_remote_ranges,
+                uri,
+                list(ranges),
+                retries=self._retries,
+                backoff=1.0,
+                task_timeout=120.0,
+                exceptions=(OSError, IOError, TimeoutError, ConnectionError),
+            )
+            for uri, ranges in files.items()
+        ]
+        await gather_with_concurrency(
+            coros,
+            max_workers=resolve_async_workers(self._async_workers, len(coros)),
+            task_timeout=240.0,
+            desc="Prefetching HRRR grib files",
+            verbose=(not self._verbose),
+        )
+
     async def fetch_wrapper(
         self,
         task: HRRRAsyncTask,
@@ -490,7 +532,7 @@ class HRRR:
             byte_length=byte_length,
         )
         # pygrib decode is blocking and GIL-bound; run in a thread with timeout
-        values = await cancellable_to_thread(_decode_hrrr_grib, grib_file, timeout=30.0)
+        values = await run_grib_decode(_decode_hrrr_grib, grib_file, timeout=30.0)
         return modifier(values)
 
     def _validate_time(self, times: list[datetime]) -> None:
@@ -529,6 +571,21 @@ class HRRR:
             raise FileNotFoundError(
                 f"The specified data index, {index_uri}, does not exist. Data seems to be missing."
             )
+        return cached_grib_index(index_file, self._parse_index, managed=self._cache)
+
+    def _parse_index(self, index_file: str) -> dict[str, tuple[int, int]]:
+        """Parse a local HRRR index file
+
+        Parameters
+        ----------
+        index_file : str
+            Path to local grib index file
+
+        Returns
+        -------
+        dict[str, tuple[int, int]]
+            Parsed index table
+        """
         with open(index_file) as file:
             index_lines = [line.rstrip() for line in file]
 
@@ -576,11 +633,39 @@ class HRRR:
                 byte_offset=byte_offset,
                 byte_length=byte_length,
                 cache_key=filename,
+                managed=self._cache,
             )
         except FileNotFoundError as e:
             logger.error(f"Failed to download file {path}, not found")
             raise e
 
+    async def _fetch_remote_ranges(
+        self, path: str, ranges: list[tuple[int, int]]
+    ) -> list[str]:
+        """Fetches byte ranges of a remote file into cache, coalescing adjacent
+        ranges"""
+        if self.store is None:
+            raise ValueError("Object store is not initialized")
+
+        # Same cache file names as _fetch_remote_file
+        cache_keys = [
+            hashlib.sha256((path + str(offset)).encode()).hexdigest()
+            for offset, _ in ranges
+        ]
+        key = path.removeprefix(self.uri_prefix).lstrip("/")
+        return await obstore_fetch_ranges_to_cache(
+            self.store,
+            key,
+            self.cache,
+            ranges,
+            cache_keys=cache_keys,
+            max_gap=self.RANGE_MAX_GAP,
+            max_span=self.RANGE_MAX_SPAN,
+            managed=self._cache,
+            # Prefetched files are counted when read by fetch_wrapper
+            record=False,
+        )
+
     def _grib_uri(
         self, time: datetime, lead_time: timedelta, product: str = "wrfsfc"
     ) -> str:
@@ -861,6 +946,7 @@ class HRRR_FX(HRRR):
         xr_array["hrrr_x"].attrs = {"standard_name": "longitude", "axis": "X"}
 
         async_tasks = await self._create_tasks(time, lead_time, variable)
+        await self._prefetch_tasks(async_tasks)
         coros = [self.fetch_wrapper(task, xr_array=xr_array) for task in async_tasks]
 
         await gather_with_concurrency(
@@ -35,7 +35,10 @@ from tqdm.asyncio import tqdm
 from earth2studio.data.utils import (
     _sync_async,
     datasource_cache_root,
+    plan_partition_fetches,
     prep_data_inputs,
+    sort_by_time,
+    time_window_slice,
 )
 from earth2studio.lexicon import ISDLexicon
 from earth2studio.utils.time import normalize_time_tolerance
@@ -238,36 +241,36 @@ class ISD:
                 logger.error(f"variable id {v} not found in ISD lexicon")
                 raise e
 
-        # Load dataframes for each station-year (cached parquet if available)
-        func_map: list[Any] = []
-        for station in self.stations:
-            for dt in time:
-                func_map.append(  # noqa: PERF401
-                    self._fetch_station_year(station, dt.year)
-                )
+        # Load dataframes for each unique station-year (cached parquet if available)
+        station_year_pairs = plan_partition_fetches(
+            self.stations, time, self._tolerance_lower, self._tolerance_upper
+        )
+        func_map: list[Any] = [
+            self._fetch_station_year(station, year)
+            for station, year in station_year_pairs
+        ]
 
         # Launch all fetch requests
         station_year_dfs = await tqdm.gather(
             *func_map, desc="Fetching NOAA ISD data", disable=(not self._verbose)
         )
+        partition_map: dict[tuple[str, int], pd.DataFrame] = {
+            pair: sort_by_time(df)
+            for pair, df in zip(station_year_pairs, station_year_dfs)
+        }
 
-        # Gather all dataframes by station and by year
+        # Cut the tolerance window of each time from the station-year frames
         filtered_df = []
-        index = 0
         for station in self.stations:
             for dt in time:
-                df = station_year_dfs[index]
-                index += 1
-
                 tmin = dt + self._tolerance_lower
                 tmax = dt + self._tolerance_upper
 
-                if df.empty:
-                    continue
-
-                df_window = df[(df["DATE"] >= tmin) & (df["DATE"] <= tmax)]
-                if not df_window.empty:
-                    filtered_df.append(df_window)
+                for year in range(tmin.year, tmax.year + 1):
+                    df = partition_map[(station, year)]
+                    df_window = time_window_slice(df, tmin, tmax)
+                    if not df_window.empty:
+                        filtered_df.append(df_window)
 
         if len(filtered_df) == 0:
             return pd.DataFrame(columns=schema.names)
@@ -181,6 +181,7 @@ class _UFSObsBase:
                 byte_offset=byte_offset,
                 byte_length=byte_length,
                 cache_key=os.path.basename(cache_path),
+                managed=self._cache,
             )
         except FileNotFoundError:
             self._handle_missing_file(key)
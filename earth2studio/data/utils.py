@@ -17,17 +17,25 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import multiprocessing
 import os
 import random
+import sqlite3
 import tempfile
+import threading
+import time as pytime
 from collections import OrderedDict
-from collections.abc import Callable
-from contextlib import asynccontextmanager
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from hashlib import sha256
 from inspect import signature
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
-from typing import Any, ClassVar, Literal, TypeVar
+from typing import Any, ClassVar, Literal, NamedTuple, TypeVar
 
 import fsspec.asyn
 import numpy as np
@@ -50,7 +58,7 @@ from earth2studio.data.base import (
     ForecastFrameSource,
     ForecastSource,
 )
-from earth2studio.utils.interp import LatLonInterpolation
+from earth2studio.utils.interp import LatLonInterpolation, RegularGridInterpolation
 from earth2studio.utils.time import (
     leadtimearray_to_timedelta,
     timearray_to_datetime,
@@ -126,16 +134,21 @@ def fetch_data(
         da = source(time, lead_time, variable)  # type: ignore
 
     else:
-        da = []
-        for lead in lead_time:
-            adjust_times = np.array([t + lead for t in time], dtype="datetime64[ns]")
-            da0 = source(adjust_times, variable)  # type: ignore
-            da0 = da0.expand_dims(dim={"lead_time": 1}, axis=1)
-            da0 = da0.assign_coords(lead_time=np.array([lead], dtype="timedelta64[ns]"))
-            da0 = da0.assign_coords(time=time)
-            da.append(da0)
-
-        da = xr.concat(da, "lead_time")
+        # Collapse all adjusted times into a single deduplicated request, then gather
+        # the [time, lead_time] output in one indexing op
+        time_ns = np.asarray(time, dtype="datetime64[ns]")
+        lead_ns = np.asarray(lead_time, dtype="timedelta64[ns]")
+        adjust_times = (time_ns[:, None] + lead_ns[None, :]).ravel()
+        unique_times, inverse = np.unique(adjust_times, return_inverse=True)
+        da = source(unique_times, variable)  # type: ignore
+
+        tdim = da.dims[0]
+        indexer = xr.DataArray(
+            inverse.reshape(len(time_ns), len(lead_ns)), dims=["time", "lead_time"]
+        )
+        da = da.rename({tdim: "_fetch_time"}).isel(_fetch_time=indexer)
+        da = da.drop_vars("_fetch_time", errors="ignore")
+        da = da.assign_coords(time=time, lead_time=lead_ns)
 
     if legacy:
         return prep_data_array(
@@ -245,7 +258,9 @@ def prep_data_array(
         If provided, the fetched data will be interpolated to the coordinates
         specified by lat/lon arrays in this CoordSystem
     interp_method : str
-        Interpolation method to use with xarray (by default 'nearest')
+        Interpolation method to use (by default 'nearest'). Linear and nearest
+        interpolation from regular lat/lon grids is applied on the target device
+        with precomputed weights, other methods use xarray
 
     Returns
     -------
@@ -287,6 +302,29 @@ def prep_data_array(
                 del out_coords["hrrr_y"]
             if "hrrr_x" in out_coords:
                 del out_coords["hrrr_x"]
+        elif (
+            interp_method in RegularGridInterpolation.METHODS
+            and da.dims[-2:] == ("lat", "lon")
+            and da["lat"].ndim == 1
+            and da["lon"].ndim == 1
+        ):
+            # Regular source grid: precomputed sparse weights applied to all
+            # leading (time, lead_time, variable) slices in one batched gather
+            if len(interp_to["_lat"].shape) > 1 or len(interp_to["_lon"].shape) > 1:
+                target_lat, target_lon = interp_to["_lat"], interp_to["_lon"]
+            else:
+                target_lat, target_lon = np.meshgrid(
+                    interp_to["_lat"], interp_to["_lon"], indexing="ij"
+                )
+            interp = RegularGridInterpolation(
+                lat_in=da["lat"].values,
+                lon_in=da["lon"].values,
+                lat_out=target_lat,
+                lon_out=target_lon,
+                method=interp_method,
+            ).to(device)
+            data = torch.Tensor(da.values).to(device)
+            out = interp(data)
         else:
             if len(interp_to["_lat"].shape) > 1 or len(interp_to["_lon"].shape) > 1:
                 # Target grid uses curvilinear coordinates: define internal dims y, x
@@ -429,6 +467,9 @@ def datasource_to_file(
     chunks: dict[str, int] = {"variable": 1},
     dtype: np.dtype | None = None,
     backend_kwargs: dict[str, Any] = {},
+    fetch_chunks: dict[str, int] | None = None,
+    max_workers: int = 1,
+    resume: bool = True,
 ) -> None:
     """Utility function that can be used for building a local data store needed
     for an inference request. This file can then be used with the
@@ -457,7 +498,21 @@ def datasource_to_file(
     backend_kwargs : dict[str, Any], optional
         Dictionary of keyword arguments forwarded to the underlying
         ``xarray.DataArray.to_netcdf`` / ``xarray.DataArray.to_zarr``
-        call depending on the selected backend.
+        call depending on the selected backend. When streaming, these are only
+        used when creating the Zarr store.
+    fetch_chunks : dict[str, int] | None, optional
+        Number of times and / or variables fetched per data source call, for
+        example {"time": 4}. When provided, data is streamed chunk by chunk into a
+        pre-created Zarr store instead of being fetched in a single call, which
+        requires the zarr backend. Storage chunks along time and variable must
+        divide these sizes, by default None
+    max_workers : int, optional
+        Number of chunks fetched and written concurrently when streaming, by
+        default 1
+    resume : bool, optional
+        When streaming, skip chunks recorded as complete in the manifest
+        ``<file_name>.manifest.json`` of a previous, interrupted run with the same
+        inputs, by default True
     """
     if isinstance(time, datetime):
         time = [time]
@@ -474,6 +529,23 @@ def datasource_to_file(
         time = np.concatenate([time, adjust_times], axis=0)
     time = np.unique(time)
 
+    if fetch_chunks is not None:
+        if backend != "zarr":
+            raise ValueError("Chunked fetching requires the zarr backend")
+        _datasource_to_zarr_stream(
+            file_name,
+            source,
+            time,
+            np.asarray(variable),
+            chunks,
+            fetch_chunks,
+            dtype,
+            backend_kwargs,
+            max_workers,
+            resume,
+        )
+        return
+
     # Fetch
     da = source(time, variable)
     da = da.assign_coords(time=time)
@@ -491,6 +563,165 @@ def datasource_to_file(
             raise ValueError(f"Unsupported backend {backend}")
 
 
+def _datasource_to_zarr_stream(
+    file_name: str,
+    source: DataSource,
+    time: np.ndarray,
+    variable: np.ndarray,
+    chunks: dict[str, int],
+    fetch_chunks: dict[str, int],
+    dtype: np.dtype | None,
+    backend_kwargs: dict[str, Any],
+    max_workers: int,
+    resume: bool,
+) -> None:
+    """Streams a data source into a Zarr store one (time, variable) chunk at a time.
+    The store is created up front from the first fetched chunk and every chunk is
+    written into its own region as soon as it is fetched, so memory use is bounded
+    by the number of workers. Completed chunks are recorded in a manifest next to
+    the store which allows interrupted runs to resume.
+
+    Parameters
+    ----------
+    file_name : str
+        Zarr store path
+    source : DataSource
+        The original data source to fetch from
+    time : np.ndarray
+        Sorted unique times to fetch
+    variable : np.ndarray
+        Variables to fetch
+    chunks : dict[str, int]
+        Storage chunk sizes along each dimension
+    fetch_chunks : dict[str, int]
+        Number of times and variables fetched per data source call
+    dtype : np.dtype | None
+        Data type for storing data
+    backend_kwargs : dict[str, Any]
+        Keyword arguments used when creating the Zarr store
+    max_workers : int
+        Number of chunks fetched and written concurrently
+    resume : bool
+        Skip chunks completed by a previous run with the same inputs
+    """
+    unknown = set(fetch_chunks) - {"time", "variable"}
+    if unknown:
+        raise ValueError(f"Unsupported fetch chunk dimensions {sorted(unknown)}")
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer")
+
+    sizes = {"time": len(time), "variable": len(variable)}
+    fetch_sizes = {dim: fetch_chunks.get(dim, sizes[dim]) for dim in sizes}
+    storage_chunks = {**fetch_sizes, **chunks}
+    for dim, size in fetch_sizes.items():
+        if size < 1:
+            raise ValueError(f"Fetch chunk size along {dim} must be positive")
+        # Regions must align with storage chunks so parallel writes never share one
+        if size % storage_chunks[dim] != 0:
+            raise ValueError(
+                f"Fetch chunk size {size} along {dim} must be a multiple of the "
+                f"storage chunk size {storage_chunks[dim]}"
+            )
+
+    regions = {
+        f"{t}:{v}": (
+            slice(t, min(t + fetch_sizes["time"], sizes["time"])),
+            slice(v, min(v + fetch_sizes["variable"], sizes["variable"])),
+        )
+        for t in range(0, sizes["time"], fetch_sizes["time"])
+        for v in range(0, sizes["variable"], fetch_sizes["variable"])
+    }
+
+    # Manifest of completed regions, tied to the request it was written for
+    manifest_path = f"{file_name}.manifest.json"
+    signature = sha256(
+        json.dumps(
+            {
+                "time": [str(t) for t in time],
+                "variable": [str(v) for v in variable],
+                "fetch_chunks": fetch_sizes,
+                "dtype": None if dtype is None else np.dtype(dtype).str,
+            }
+        ).encode()
+    ).hexdigest()
+    completed: set[str] = set()
+    if resume and os.path.exists(manifest_path) and os.path.exists(file_name):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("signature") != signature:
+            raise ValueError(
+                f"Manifest {manifest_path} was written for a different request, "
+                "remove it or set resume=False"
+            )
+        completed = set(manifest["completed"]) & set(regions)
+
+    def _write_manifest() -> None:
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".json", dir=Path(manifest_path).parent.resolve()
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump({"signature": signature, "completed": sorted(completed)}, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _fetch(region: tuple[slice, slice]) -> xr.DataArray:
+        da = source(time[region[0]], variable[region[1]])
+        if dtype is not None:
+            da = da.astype(dtype=dtype)
+        return da
+
+    def _write(region: tuple[slice, slice], da: xr.DataArray) -> None:
+        # Coordinates are stored with the template, only write the values
+        da = da.drop_vars(list(da.coords))
+        da.name = name
+        da.to_zarr(file_name, region={"time": region[0], "variable": region[1]})
+
+    pending = [key for key in regions if key not in completed]
+    name = None
+    if not completed:
+        # Create the store from the first chunk, without writing any data
+        key = pending.pop(0)
+        first = _fetch(regions[key])
+        name = first.name
+        template = (
+            xr.zeros_like(first.isel(time=0, variable=0, drop=True))
+            .expand_dims({"time": time, "variable": variable})
+            .transpose(*first.dims)
+            .chunk(chunks=storage_chunks)
+        )
+        template.to_zarr(file_name, mode="w", compute=False, **backend_kwargs)
+        _write(regions[key], first)
+        del first
+        completed.add(key)
+        _write_manifest()
+    else:
+        name = xr.open_dataarray(file_name, engine="zarr").name
+
+    def _fetch_and_write(key: str) -> str:
+        _write(regions[key], _fetch(regions[key]))
+        return key
+
+    # On failure, cancel queued chunks but still record those that finish so a
+    # resumed run does not fetch them again
+    error: BaseException | None = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_fetch_and_write, key) for key in pending]
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc="Writing chunks"
+        ):
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                if error is None:
+                    error = future.exception()
+                    for other in futures:
+                        other.cancel()
+                continue
+            completed.add(future.result())
+            _write_manifest()
+    if error is not None:
+        raise error
+
+
 def datasource_cache_root() -> str:
     """Returns the root directory for data sources"""
     default_cache = os.path.join(os.path.expanduser("~"), ".cache", "earth2studio")
@@ -508,6 +739,93 @@ def datasource_cache_root() -> str:
     return default_cache
 
 
+def plan_partition_fetches(
+    keys: Iterable[Any],
+    time: list[datetime],
+    tolerance_lower: timedelta,
+    tolerance_upper: timedelta,
+) -> list[tuple[Any, int]]:
+    """Plans the unique (key, year) partitions to fetch for a set of request times.
+
+    Observation sources are typically partitioned by a key (station, product, ...)
+    and year. Each partition is returned once, regardless of how many request times
+    fall into it, and covers every year touched by the tolerance windows so that
+    windows crossing a year boundary do not drop observations.
+
+    Parameters
+    ----------
+    keys : Iterable[Any]
+        Partition keys, such as station ids
+    time : list[datetime]
+        Request timestamps
+    tolerance_lower : timedelta
+        Lower bound of the tolerance window relative to each time (typically <= 0)
+    tolerance_upper : timedelta
+        Upper bound of the tolerance window relative to each time (typically >= 0)
+
+    Returns
+    -------
+    list[tuple[Any, int]]
+        Sorted unique (key, year) pairs
+    """
+    years: set[int] = set()
+    for t in time:
+        years.update(range((t + tolerance_lower).year, (t + tolerance_upper).year + 1))
+    return sorted((key, year) for key in set(keys) for year in years)
+
+
+def sort_by_time(df: pd.DataFrame, column: str = "DATE") -> pd.DataFrame:
+    """Sorts a data frame by its time column so time windows can be selected with
+    `time_window_slice`. Frames already in order are returned unchanged.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input data frame
+    column : str, optional
+        Time column, by default "DATE"
+
+    Returns
+    -------
+    pd.DataFrame
+        Data frame sorted by time
+    """
+    if column not in df.columns or df[column].is_monotonic_increasing:
+        return df
+    return df.sort_values(column, kind="stable", ignore_index=True)
+
+
+def time_window_slice(
+    df: pd.DataFrame, tmin: Any, tmax: Any, column: str = "DATE"
+) -> pd.DataFrame:
+    """Selects the rows of a time sorted data frame with tmin <= time <= tmax using
+    binary search instead of a full boolean mask.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data frame sorted by the time column, see `sort_by_time`
+    tmin : Any
+        Inclusive lower bound, comparable with the time column
+    tmax : Any
+        Inclusive upper bound, comparable with the time column
+    column : str, optional
+        Time column, by default "DATE"
+
+    Returns
+    -------
+    pd.DataFrame
+        Rows inside the window
+    """
+    if df.empty:
+        return df
+    if isinstance(tmin, datetime):
+        tmin, tmax = pd.Timestamp(tmin), pd.Timestamp(tmax)
+    start = df[column].searchsorted(tmin, side="left")
+    stop = df[column].searchsorted(tmax, side="right")
+    return df.iloc[start:stop]
+
+
 # =============================================================================
 # Async Utilities for Data Sources
 # =============================================================================
@@ -771,6 +1089,139 @@ async def cancellable_to_thread(
         raise
 
 
+_GRIB_DECODE_POOL: ProcessPoolExecutor | None = None
+_GRIB_DECODE_POOL_CONFIGURED = False
+_GRIB_DECODE_POOL_LOCK = threading.Lock()
+
+
+def configure_grib_decode_pool(
+    max_workers: int = 0, start_method: str | None = None
+) -> None:
+    """Configure the process pool shared by all grib data sources for decoding.
+
+    pygrib decoding holds the GIL, so concurrent decodes in threads serialize.
+    With a process pool, messages are decoded in worker processes and the decoded
+    arrays are returned through shared memory instead of being pickled. When not
+    configured explicitly, the pool is set up on first use from the
+    ``EARTH2STUDIO_GRIB_DECODE_WORKERS`` and
+    ``EARTH2STUDIO_GRIB_DECODE_START_METHOD`` environment variables.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of decode worker processes, 0 decodes in threads, by default 0
+    start_method : str | None, optional
+        Multiprocessing start method of the workers, such as "spawn" or
+        "forkserver", by default None (platform default)
+    """
+    global _GRIB_DECODE_POOL, _GRIB_DECODE_POOL_CONFIGURED
+    if max_workers < 0:
+        raise ValueError("max_workers must be non-negative")
+    with _GRIB_DECODE_POOL_LOCK:
+        if _GRIB_DECODE_POOL is not None:
+            _GRIB_DECODE_POOL.shutdown(wait=True, cancel_futures=True)
+        _GRIB_DECODE_POOL = None
+        if max_workers > 0:
+            _GRIB_DECODE_POOL = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        _GRIB_DECODE_POOL_CONFIGURED = True
+
+
+def _grib_decode_pool() -> ProcessPoolExecutor | None:
+    """Get the grib decode process pool, configuring it from the environment on
+    first use"""
+    if not _GRIB_DECODE_POOL_CONFIGURED:
+        configure_grib_decode_pool(
+            int(os.environ.get("EARTH2STUDIO_GRIB_DECODE_WORKERS", "0")),
+            os.environ.get("EARTH2STUDIO_GRIB_DECODE_START_METHOD"),
+        )
+    return _GRIB_DECODE_POOL
+
+
+class _SharedArray(NamedTuple):
+    """Reference to a decoded array in shared memory"""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _decode_to_shared_memory(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a decode function in a worker process, moving array results into a
+    shared memory block that the parent process reads and unlinks"""
+    out = func(*args)
+    if type(out) is not np.ndarray or out.nbytes == 0:
+        return out
+    shm = shared_memory.SharedMemory(create=True, size=out.nbytes)
+    try:
+        np.ndarray(out.shape, dtype=out.dtype, buffer=shm.buf)[...] = out
+        # The parent owns the block, stop tracking it in the worker
+        name = shm._name  # type: ignore[attr-defined]
+        resource_tracker.unregister(name, "shared_memory")
+        return _SharedArray(shm.name, out.shape, out.dtype.str)
+    finally:
+        shm.close()
+
+
+def _read_shared_memory(result: Any) -> Any:
+    """Copy a decode result out of shared memory and release the block"""
+    if not isinstance(result, _SharedArray):
+        return result
+    shm = shared_memory.SharedMemory(name=result.name)
+    try:
+        return np.ndarray(result.shape, dtype=result.dtype, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _release_abandoned_decode(future: asyncio.Future) -> None:
+    """Release the shared memory of a decode whose caller stopped waiting"""
+    if not future.cancelled() and future.exception() is None:
+        _read_shared_memory(future.result())
+
+
+async def run_grib_decode(
+    func: Callable[..., T],
+    *args: Any,
+    timeout: float = 30.0,
+) -> T:
+    """Run a blocking grib decode function, in the shared decode process pool when
+    configured with :py:func:`configure_grib_decode_pool` and otherwise in a thread
+    with :py:func:`cancellable_to_thread`.
+
+    Parameters
+    ----------
+    func : Callable[..., T]
+        Module level (picklable) decode function
+    *args : Any
+        Picklable positional arguments for func
+    timeout : float, optional
+        Timeout in seconds, by default 30.0
+
+    Returns
+    -------
+    T
+        Return value of func
+    """
+    pool = _grib_decode_pool()
+    if pool is None:
+        return await cancellable_to_thread(func, *args, timeout=timeout)
+
+    future = asyncio.get_running_loop().run_in_executor(
+        pool, _decode_to_shared_memory, func, *args
+    )
+    try:
+        result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        future.add_done_callback(_release_abandoned_decode)
+        logger.warning(f"Grib decode {func.__name__} abandoned, worker keeps running")
+        raise
+    return _read_shared_memory(result)
+
+
 def resolve_async_workers(
     async_workers: int | None, n_tasks: int, cap: int = 64
 ) -> int:
@@ -901,6 +1352,313 @@ async def obstore_read_range(
     return bytes(data)
 
 
+def _atomic_write(path: str, data: bytes, prefix: str = ".tmp-") -> None:
+    """Write a file through a temporary file in the same directory and an atomic
+    rename, so concurrent readers never observe partial files"""
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=prefix, dir=os.path.dirname(os.path.abspath(path))
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class CacheManager:
+    """Byte budgeted manager of cache files shared by all data sources of the
+    process.
+
+    Only files written through :py:meth:`CacheManager.write` are tracked; other
+    files in the cache root (e.g. Zarr stores or parquet caches of other data
+    sources) are never touched. Tracked files are recorded in a persistent SQLite
+    index inside the cache root which stores their size, last access time and hit
+    count, together with global hit, miss and eviction counters. The index is
+    shared by every process using the same cache root. Files are written to a
+    temporary file and atomically renamed, so concurrent readers never observe
+    partial files. When the total size of tracked files exceeds the byte budget,
+    files are evicted in least recently used (``"lru"``) or least frequently used
+    (``"lfu"``) order. Files accessed within the grace period are never evicted
+    since they may be about to be read.
+
+    Accesses recorded by :py:meth:`CacheManager.lookup` are buffered in memory and
+    written to the index in batches, on the next write, eviction or statistics
+    query, so cache hits do not touch the index.
+
+    Use :py:meth:`CacheManager.get` to obtain the process-wide manager of a
+    directory. The budget and policy of managers created this way default to the
+    ``EARTH2STUDIO_CACHE_MAX_BYTES`` and ``EARTH2STUDIO_CACHE_POLICY`` environment
+    variables.
+
+    Parameters
+    ----------
+    root : str
+        Cache root directory
+    max_bytes : int | None, optional
+        Byte budget of the cache, by default None (unbounded)
+    policy : Literal["lru", "lfu"], optional
+        Eviction policy, by default "lru"
+    grace_period : float, optional
+        Seconds after an access during which a file is not evicted, by default 60.0
+    """
+
+    INDEX_NAME = ".e2s_cache_index.sqlite"
+    TMP_PREFIX = ".tmp-"
+    MAX_PENDING_ACCESSES = 4096
+    RECONCILE_INTERVAL = 300.0
+    _EVICTION_QUERIES: ClassVar[dict[str, str]] = {
+        "lru": "SELECT path, size FROM entries WHERE last_access < ? "
+        "ORDER BY last_access",
+        "lfu": "SELECT path, size FROM entries WHERE last_access < ? "
+        "ORDER BY hits, last_access",
+    }
+
+    _managers: ClassVar[dict[str, CacheManager]] = {}
+    _managers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int | None = None,
+        policy: Literal["lru", "lfu"] = "lru",
+        grace_period: float = 60.0,
+    ) -> None:
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unsupported cache eviction policy {policy}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("Cache byte budget must be non-negative")
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.grace_period = grace_period
+        os.makedirs(self.root, exist_ok=True)
+        self._index_path = os.path.join(self.root, self.INDEX_NAME)
+        self._lock = threading.Lock()
+        self._accesses: dict[str, tuple[float, int]] = {}
+        self._counts = {"hits": 0, "misses": 0}
+        self._reconciled = 0.0
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL, "
+                "hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters "
+                "(name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    @classmethod
+    def get(cls, root: str) -> CacheManager:
+        """Get the process-wide cache manager of a directory
+
+        Parameters
+        ----------
+        root : str
+            Cache root directory
+
+        Returns
+        -------
+        CacheManager
+            Cache manager
+        """
+        root = os.path.abspath(root)
+        with cls._managers_lock:
+            if root not in cls._managers:
+                max_bytes = os.environ.get("EARTH2STUDIO_CACHE_MAX_BYTES")
+                policy = os.environ.get("EARTH2STUDIO_CACHE_POLICY", "lru")
+                cls._managers[root] = cls(
+                    root,
+                    max_bytes=int(max_bytes) if max_bytes else None,
+                    policy=policy,  # type: ignore[arg-type]
+                )
+            return cls._managers[root]
+
+    @classmethod
+    def for_path(cls, cache_dir: str) -> CacheManager:
+        """Get the cache manager responsible for a cache directory. Directories
+        inside the data source cache root share its manager, and hence its budget.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Cache directory of a data source
+
+        Returns
+        -------
+        CacheManager
+            Cache manager
+        """
+        root = os.path.abspath(datasource_cache_root())
+        cache_dir = os.path.abspath(cache_dir)
+        if os.path.commonpath([root, cache_dir]) == root:
+            return cls.get(root)
+        return cls.get(cache_dir)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._index_path, timeout=60)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.root)
+
+    @staticmethod
+    def _increment(conn: sqlite3.Connection, name: str, value: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, value),
+        )
+
+    def _flush_accesses(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            accesses, self._accesses = self._accesses, {}
+            counts, self._counts = self._counts, {"hits": 0, "misses": 0}
+        # Only update files tracked by the index, other files are never adopted
+        conn.executemany(
+            "UPDATE entries SET last_access = MAX(last_access, ?), hits = hits + ? "
+            "WHERE path = ?",
+            [(last, hits, key) for key, (last, hits) in accesses.items()],
+        )
+        for name, value in counts.items():
+            if value:
+                self._increment(conn, name, value)
+
+    def lookup(self, path: str, record: bool = True) -> bool:
+        """Check if a file is cached, recording the access as a hit or miss
+
+        Parameters
+        ----------
+        path : str
+            Cache file path
+        record : bool, optional
+            Record the access in the hit / miss counters and access times, disable
+            for prefetches that are looked up again when read, by default True
+
+        Returns
+        -------
+        bool
+            True if the file is cached
+        """
+        hit = os.path.isfile(path)
+        if not record:
+            return hit
+        with self._lock:
+            if hit:
+                key = self._key(path)
+                hits = self._accesses.get(key, (0.0, 0))[1]
+                self._accesses[key] = (pytime.time(), hits + 1)
+                self._counts["hits"] += 1
+            else:
+                self._counts["misses"] += 1
+            flush = len(self._accesses) >= self.MAX_PENDING_ACCESSES
+        if flush:
+            with self._connect() as conn:
+                self._flush_accesses(conn)
+        return hit
+
+    def write(self, path: str, data: bytes) -> None:
+        """Atomically write a cache file, then evict files over the byte budget
+
+        Parameters
+        ----------
+        path : str
+            Cache file path
+        data : bytes
+            File content
+        """
+        _atomic_write(path, data, prefix=self.TMP_PREFIX)
+        with self._connect() as conn:
+            self._flush_accesses(conn)
+            conn.execute(
+                "INSERT INTO entries (path, size, last_access, hits) "
+                "VALUES (?, ?, ?, 0) ON CONFLICT(path) DO UPDATE SET "
+                "size = excluded.size, last_access = excluded.last_access",
+                (self._key(path), len(data), pytime.time()),
+            )
+        self.evict()
+
+    def _reconcile(self, conn: sqlite3.Connection) -> None:
+        # Drop entries of files removed outside of the manager so their size does
+        # not count against the budget
+        missing = [
+            (key,)
+            for (key,) in conn.execute("SELECT path FROM entries").fetchall()
+            if not os.path.isfile(os.path.join(self.root, key))
+        ]
+        conn.executemany("DELETE FROM entries WHERE path = ?", missing)
+        self._reconciled = pytime.time()
+
+    def evict(self) -> int:
+        """Evict cache files until the cache fits in the byte budget
+
+        Entries of tracked files which no longer exist are dropped from the index
+        without counting as evictions.
+
+        Returns
+        -------
+        int
+            Number of evicted files
+        """
+        if self.max_bytes is None:
+            return 0
+        evicted = 0
+        with self._connect() as conn:
+            self._flush_accesses(conn)
+            total = conn.execute("SELECT SUM(size) FROM entries").fetchone()[0] or 0
+            if total <= self.max_bytes:
+                return 0
+            if pytime.time() - self._reconciled > self.RECONCILE_INTERVAL:
+                self._reconcile(conn)
+                total = conn.execute("SELECT SUM(size) FROM entries").fetchone()[0] or 0
+            candidates = conn.execute(
+                self._EVICTION_QUERIES[self.policy],
+                (pytime.time() - self.grace_period,),
+            ).fetchall()
+            for key, size in candidates:
+                if total <= self.max_bytes:
+                    break
+                path = Path(self.root, key)
+                if path.is_file():
+                    path.unlink(missing_ok=True)
+                    evicted += 1
+                conn.execute("DELETE FROM entries WHERE path = ?", (key,))
+                total -= size
+            self._increment(conn, "evictions", evicted)
+        return evicted
+
+    def stats(self) -> dict[str, int]:
+        """Cache statistics
+
+        Returns
+        -------
+        dict[str, int]
+            Hit, miss and eviction counters together with the number and total size
+            of tracked files
+        """
+        with self._connect() as conn:
+            self._flush_accesses(conn)
+            stats = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, size = conn.execute(
+                "SELECT COUNT(*), SUM(size) FROM entries"
+            ).fetchone()
+        return {
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+            "evictions": stats.get("evictions", 0),
+            "entries": entries,
+            "bytes": size or 0,
+        }
+
+
 async def obstore_fetch_to_cache(
     store: obstore.store.ObjectStore,
     key: str,
@@ -908,6 +1666,7 @@ async def obstore_fetch_to_cache(
     byte_offset: int = 0,
     byte_length: int | None = None,
     cache_key: str | None = None,
+    managed: bool = True,
 ) -> str:
     """Fetches a byte range of an object into a local cache file.
 
@@ -915,7 +1674,11 @@ async def obstore_fetch_to_cache(
     file name defaults to ``sha256(key + str(byte_offset))``; callers
     migrating from fsspec-based fetching should pass an explicit ``cache_key``
     hashed from their historical (e.g. bucket-prefixed) path so existing warm
-    caches remain valid.
+    caches remain valid. Cache files are managed by the :py:class:`CacheManager`
+    of the cache directory, which writes them atomically and keeps the cache
+    within its byte budget. Temporary cache directories removed by the caller
+    should pass ``managed=False`` so their files are written atomically but not
+    tracked.
 
     Parameters
     ----------
@@ -931,6 +1694,9 @@ async def obstore_fetch_to_cache(
         Number of bytes to read, by default None (read to end)
     cache_key : str | None, optional
         Explicit cache file name, by default None (sha256 of key + offset)
+    managed : bool, optional
+        Track the cache file with the :py:class:`CacheManager` of the cache
+        directory, by default True
 
     Returns
     -------
@@ -940,15 +1706,226 @@ async def obstore_fetch_to_cache(
     if cache_key is None:
         cache_key = sha256((key + str(byte_offset)).encode()).hexdigest()
     cache_path = os.path.join(cache_dir, cache_key)
-    if Path(cache_path).is_file():
+    if managed:
+        manager = CacheManager.for_path(cache_dir)
+        if await asyncio.to_thread(manager.lookup, cache_path):
+            return cache_path
+    elif os.path.isfile(cache_path):
         return cache_path
     data = await obstore_read_range(
         store, key, byte_offset=byte_offset, byte_length=byte_length
     )
-    await asyncio.to_thread(Path(cache_path).write_bytes, data)
+    if managed:
+        await asyncio.to_thread(manager.write, cache_path, data)
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        await asyncio.to_thread(_atomic_write, cache_path, data)
     return cache_path
 
 
+_GRIB_INDEX_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+_GRIB_INDEX_CACHE_SIZE = 256
+_GRIB_INDEX_CACHE_VERSION = 1
+IndexEntry = TypeVar("IndexEntry", bound=tuple)
+
+
+def cached_grib_index(
+    index_file: str,
+    parse: Callable[[str], dict[str, IndexEntry]],
+    managed: bool = True,
+) -> dict[str, IndexEntry]:
+    """Parses a local GRIB index file, caching the parsed table.
+
+    Parsed tables are kept in an in-memory LRU and in a compact JSON file next to
+    the index file (``<index_file>.parsed.json``), both keyed by the index file path
+    and validated against its modification time and size. Repeated requests of the
+    same index file, also across processes sharing the cache, therefore parse it
+    only once. The returned table is a copy and can be modified by the caller.
+
+    Parameters
+    ----------
+    index_file : str
+        Path to the local index file
+    parse : Callable[[str], dict[str, IndexEntry]]
+        Parser of the index file into a table of tuples of JSON serializable values,
+        such as (byte offset, byte length)
+    managed : bool, optional
+        Track the parsed index file with the :py:class:`CacheManager` of its
+        directory, by default True
+
+    Returns
+    -------
+    dict[str, IndexEntry]
+        Parsed index table
+    """
+    stat = os.stat(index_file)
+    key = (os.path.abspath(index_file), stat.st_mtime_ns, stat.st_size)
+    table: dict[str, Any] | None = _GRIB_INDEX_CACHE.get(key)
+    if table is not None:
+        _GRIB_INDEX_CACHE.move_to_end(key)
+        return dict(table)
+
+    parsed_file = f"{index_file}.parsed.json"
+    try:
+        with open(parsed_file) as f:
+            data = json.load(f)
+        if data["version"] != _GRIB_INDEX_CACHE_VERSION or data["stat"] != list(
+            key[1:]
+        ):
+            raise ValueError("Stale parsed index")
+        table = {k: tuple(v) for k, v in zip(data["keys"], data["values"])}
+    except (OSError, ValueError, KeyError):
+        table = parse(index_file)
+        data = {
+            "version": _GRIB_INDEX_CACHE_VERSION,
+            "stat": list(key[1:]),
+            "keys": list(table),
+            "values": [list(v) for v in table.values()],
+        }
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        try:
+            if managed:
+                CacheManager.for_path(
+                    os.path.dirname(os.path.abspath(index_file))
+                ).write(parsed_file, payload)
+            else:
+                _atomic_write(parsed_file, payload)
+        except OSError as e:
+            logger.warning(f"Failed to write parsed index {parsed_file}: {e}")
+
+    _GRIB_INDEX_CACHE[key] = table
+    while len(_GRIB_INDEX_CACHE) > _GRIB_INDEX_CACHE_SIZE:
+        _GRIB_INDEX_CACHE.popitem(last=False)
+    return dict(table)
+
+
+def coalesce_byte_ranges(
+    ranges: list[tuple[int, int]],
+    max_gap: int = 0,
+    max_span: int | None = None,
+) -> list[tuple[int, int, list[int]]]:
+    """Plans merged byte range requests for a set of byte ranges of one object.
+
+    Ranges are sorted by offset and merged into a span while the gap to the
+    previous range is at most ``max_gap`` bytes and the span stays within
+    ``max_span`` bytes. Ranges contained in the current span are always merged and
+    a single range larger than ``max_span`` gets its own span.
+
+    Parameters
+    ----------
+    ranges : list[tuple[int, int]]
+        List of (byte offset, byte length) ranges
+    max_gap : int, optional
+        Largest number of unrequested bytes between two ranges of a span, by
+        default 0 (only adjacent ranges are merged)
+    max_span : int | None, optional
+        Largest span size in bytes, by default None (unbounded)
+
+    Returns
+    -------
+    list[tuple[int, int, list[int]]]
+        List of (byte offset, byte length, range indices) spans, sorted by offset
+    """
+    spans: list[tuple[int, int, list[int]]] = []
+    for i in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+        offset, length = ranges[i]
+        end = offset + length
+        if spans:
+            span_offset, span_end, members = spans[-1]
+            merged_end = max(span_end, end)
+            if end <= span_end or (
+                offset - span_end <= max_gap
+                and (max_span is None or merged_end - span_offset <= max_span)
+            ):
+                members.append(i)
+                spans[-1] = (span_offset, merged_end, members)
+                continue
+        spans.append((offset, end, [i]))
+    return [(offset, end - offset, members) for offset, end, members in spans]
+
+
+async def obstore_fetch_ranges_to_cache(
+    store: obstore.store.ObjectStore,
+    key: str,
+    cache_dir: str,
+    ranges: list[tuple[int, int]],
+    cache_keys: list[str] | None = None,
+    max_gap: int = 0,
+    max_span: int | None = None,
+    managed: bool = True,
+    record: bool = True,
+) -> list[str]:
+    """Fetches multiple byte ranges of an object into local cache files, coalescing
+    adjacent ranges into single requests.
+
+    Each range is cached in its own file, identical to fetching it with
+    :py:func:`obstore_fetch_to_cache`. Ranges that are not cached yet are merged
+    with :py:func:`coalesce_byte_ranges`, every merged span is read once and the
+    individual ranges are sliced out of it.
+
+    Parameters
+    ----------
+    store : obstore.store.ObjectStore
+        Object store to read from
+    key : str
+        Object key (bucket-relative path)
+    cache_dir : str
+        Directory to place the cache files in
+    ranges : list[tuple[int, int]]
+        List of (byte offset, byte length) ranges to fetch
+    cache_keys : list[str] | None, optional
+        Explicit cache file name of each range, by default None (sha256 of key +
+        offset)
+    max_gap : int, optional
+        Largest number of unrequested bytes fetched between two ranges of a merged
+        request, by default 0
+    max_span : int | None, optional
+        Largest merged request size in bytes, by default None (unbounded)
+    managed : bool, optional
+        Track the cache files with the :py:class:`CacheManager` of the cache
+        directory, by default True
+    record : bool, optional
+        Record the cache lookups in the :py:class:`CacheManager` hit / miss
+        counters, disable when prefetching ranges that are read again later, by
+        default True
+
+    Returns
+    -------
+    list[str]
+        Paths to the local cache file of each range
+    """
+    if cache_keys is None:
+        cache_keys = [
+            sha256((key + str(offset)).encode()).hexdigest() for offset, _ in ranges
+        ]
+    if len(cache_keys) != len(ranges):
+        raise ValueError("Number of cache keys must match the number of ranges")
+    paths = [os.path.join(cache_dir, cache_key) for cache_key in cache_keys]
+    if managed:
+        manager = CacheManager.for_path(cache_dir)
+        lookup: Callable[[str], bool] = partial(manager.lookup, record=record)
+        write: Callable[[str, bytes], None] = manager.write
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        lookup, write = os.path.isfile, _atomic_write
+
+    cached = await asyncio.to_thread(lambda: [lookup(p) for p in paths])
+    missing = [i for i, hit in enumerate(cached) if not hit]
+
+    async def _fetch_span(offset: int, length: int, members: list[int]) -> None:
+        data = await obstore_read_range(
+            store, key, byte_offset=offset, byte_length=length
+        )
+        for member in members:
+            i = missing[member]
+            start = ranges[i][0] - offset
+            await asyncio.to_thread(write, paths[i], data[start : start + ranges[i][1]])
+
+    spans = coalesce_byte_ranges([ranges[i] for i in missing], max_gap, max_span)
+    await asyncio.gather(*(_fetch_span(*span) for span in spans))
+    return paths
+
+
 class LocalCachingStore(zarr.storage.WrapperStore):
     """Wraps a read-only zarr store with a local on-disk cache backed by a zarr
     LocalStore, intended for append-only immutable archive stores.
@@ -13,15 +13,23 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import contextlib
+import hashlib
+import json
 import os
+import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any
 
 import numpy as np
+import pandas as pd
 import xarray as xr
+from loguru import logger
 from numpy import ndarray
 from pandas import to_datetime
 
+from earth2studio.data.utils import datasource_cache_root
 from earth2studio.utils.type import TimeArray, VariableArray
 
 
@@ -266,30 +274,53 @@ class DataArrayDirectory:
         |___2021_01.nc
         |___...
 
+    Files are opened lazily on first access and at most `max_open_files` handles are
+    kept open. The time coordinate of each opened file is recorded in a time to file
+    index persisted in the data source cache once per request, so later instances
+    resolve requested times without opening files up front.
+
     Parameters
     ----------
     file_path : str
         Path to xarray data array compatible file.
+    max_open_files : int, optional
+        Maximum number of open file handles, least recently used files are closed
+        first, by default 16
     xr_args : Any
         Keyword arguments to send to the xarray opening method.
     """
 
-    def __init__(self, dir_path: str, **xr_args: Any):
+    INDEX_VERSION = 1
+
+    def __init__(self, dir_path: str, max_open_files: int = 16, **xr_args: Any):
+        if max_open_files < 1:
+            raise ValueError("max_open_files must be a positive integer")
         self.dir_path = dir_path
-        self.das: dict[str, dict[str, xr.DataArray]] = {}
-        for yr in os.listdir(self.dir_path):
+        self.max_open_files = max_open_files
+        self.xr_args = xr_args
+        self._handles: OrderedDict[str, xr.DataArray] = OrderedDict()
+
+        # Candidate files of each (year, month) following the directory layout
+        self._files: dict[tuple[str, str], list[str]] = {}
+        for yr in sorted(os.listdir(self.dir_path)):
             yr_dir = os.path.join(self.dir_path, yr)
             if os.path.isdir(yr_dir):
-                self.das[yr] = {}
-                for fl in os.listdir(yr_dir):
+                for fl in sorted(os.listdir(yr_dir)):
                     pth = os.path.join(yr_dir, fl)
                     if os.path.isfile(pth):
-                        try:
-                            arr = xr.open_dataarray(pth, **xr_args)
-                        except:  # noqa
-                            continue
                         mon = fl.split(".")[0].split("_")[-1]
-                        self.das[yr][mon] = arr
+                        self._files.setdefault((yr, mon), []).append(pth)
+
+        self._index_path = os.path.join(
+            datasource_cache_root(),
+            "xr",
+            "dir_index_"
+            + hashlib.sha256(os.path.abspath(dir_path).encode()).hexdigest()
+            + ".json",
+        )
+        self._reverse_index: dict[int, str] | None = None
+        self._index = self._load_index()
+        self._index_dirty = False
 
     def __call__(
         self,
@@ -315,13 +346,189 @@ class DataArrayDirectory:
         if not (isinstance(variable, list) or isinstance(variable, ndarray)):
             variable = [variable]
 
-        arrs = []
-        for tt in time:
-            yr = str(to_datetime(tt).year)
-            mon = str(to_datetime(tt).month).zfill(2)
-            arrs.append(self.das[yr][mon].sel(time=tt, variable=variable))
+        time_ns = pd.DatetimeIndex([to_datetime(tt) for tt in time]).as_unit("ns").asi8
+        try:
+            # Group requested times per file, keeping request positions
+            groups: OrderedDict[str, list[int]] = OrderedDict()
+            for i, tt in enumerate(time_ns):
+                groups.setdefault(self._resolve_file(tt), []).append(i)
+
+            # One vectorized selection per file
+            arrs = []
+            for pth, request in groups.items():
+                da = self._open(pth)
+                positions = self._time_positions(pth, da, time_ns[request])
+                arrs.append(da.isel(time=positions).sel(variable=variable).load())
+        finally:
+            # Files opened by this request are indexed with a single write
+            self._write_index()
+
+        out = xr.concat(arrs, dim="time") if len(arrs) > 1 else arrs[0]
+        order = np.concatenate([np.asarray(r) for r in groups.values()])
+        if np.any(order[:-1] > order[1:]):
+            out = out.isel(time=np.argsort(order, kind="stable"))
+        return out
+
+    def _resolve_file(self, time_ns: int) -> str:
+        """Find the file containing a time, first from the time index then from the
+        year / month directory layout
+
+        Parameters
+        ----------
+        time_ns : int
+            Requested time in nanoseconds since epoch
+
+        Returns
+        -------
+        str
+            File path
+        """
+        pth = self._time_to_file.get(time_ns)
+        if pth is not None:
+            return pth
+
+        tt = pd.Timestamp(time_ns)
+        key = (str(tt.year), str(tt.month).zfill(2))
+        for pth in self._files.get(key, []):
+            if pth in self._index or self._try_open(pth) is not None:
+                return pth
+        raise KeyError(f"No data file found for time {tt}")
+
+    def _try_open(self, pth: str) -> xr.DataArray | None:
+        """Open a file, returning None if it is not a readable data array"""
+        try:
+            return self._open(pth)
+        except:  # noqa
+            return None
+
+    def _open(self, pth: str) -> xr.DataArray:
+        """Get the data array of a file from the open handle LRU, opening it if
+        needed and closing the least recently used handle when full
+
+        Parameters
+        ----------
+        pth : str
+            File path
+
+        Returns
+        -------
+        xr.DataArray
+            Opened data array
+        """
+        if pth in self._handles:
+            self._handles.move_to_end(pth)
+            return self._handles[pth]
+
+        da = xr.open_dataarray(pth, **self.xr_args)
+        self._handles[pth] = da
+        while len(self._handles) > self.max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+        if pth not in self._index:
+            self._update_index(pth, da)
+        return da
+
+    def _time_positions(
+        self, pth: str, da: xr.DataArray, time_ns: np.ndarray
+    ) -> np.ndarray:
+        """Positions of requested times along the time dimension of a file
+
+        Parameters
+        ----------
+        pth : str
+            File path
+        da : xr.DataArray
+            Opened data array of the file
+        time_ns : np.ndarray
+            Requested times in nanoseconds since epoch
+
+        Returns
+        -------
+        np.ndarray
+            Integer positions of each requested time
+        """
+        if pth not in self._index:
+            self._update_index(pth, da)
+        positions = pd.Index(self._index[pth]["time"]).get_indexer(time_ns)
+        if np.any(positions < 0):
+            missing = pd.DatetimeIndex(time_ns[positions < 0])
+            raise KeyError(f"Times {list(missing)} not found in {pth}")
+        return positions
+
+    @property
+    def _time_to_file(self) -> dict[int, str]:
+        """Reverse time to file lookup of the index"""
+        if self._reverse_index is None:
+            self._reverse_index = {
+                t: pth for pth, entry in self._index.items() for t in entry["time"]
+            }
+        return self._reverse_index
+
+    @staticmethod
+    def _file_stat(pth: str) -> list[int]:
+        stat = os.stat(pth)
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        """Load the persisted time index, dropping entries of changed or removed
+        files
 
-        return xr.concat(arrs, dim="time")
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Index of file path to file stat and time values
+        """
+        try:
+            with open(self._index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != self.INDEX_VERSION:
+            return {}
+
+        files = {pth for paths in self._files.values() for pth in paths}
+        index = {}
+        for pth, entry in data.get("files", {}).items():
+            if pth in files and entry.get("stat") == self._file_stat(pth):
+                index[pth] = entry
+        return index
+
+    def _update_index(self, pth: str, da: xr.DataArray) -> None:
+        """Record the time coordinate of a file in the index
+
+        Parameters
+        ----------
+        pth : str
+            File path
+        da : xr.DataArray
+            Opened data array of the file
+        """
+        times = pd.DatetimeIndex(np.atleast_1d(da["time"].values)).as_unit("ns").asi8
+        self._index[pth] = {"stat": self._file_stat(pth), "time": times.tolist()}
+        self._reverse_index = None
+        self._index_dirty = True
+
+    def _write_index(self) -> None:
+        """Persist the time index if it changed since the last write"""
+        if not self._index_dirty:
+            return
+        self._index_dirty = False
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".json", dir=os.path.dirname(self._index_path)
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": self.INDEX_VERSION, "files": self._index}, f)
+            os.replace(tmp_path, self._index_path)
+            tmp_path = None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to persist time index {self._index_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
 
 
 class DataArrayPathList:
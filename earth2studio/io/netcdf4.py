@@ -24,6 +24,11 @@ from cftime import date2num, num2date
 from loguru import logger
 from netCDF4 import Dataset, Variable
 
+from earth2studio.io.utils import (
+    cached_coord_indices,
+    contiguous_selection,
+    coord_index_map,
+)
 from earth2studio.utils.coords import convert_multidim_to_singledim
 from earth2studio.utils.time import timearray_to_datetime
 from earth2studio.utils.type import CoordSystem
@@ -64,6 +69,8 @@ class NetCDF4Backend:
         self.root = Dataset(file_name, **backend_kwargs)
 
         self.coords: CoordSystem = OrderedDict({})
+        # Coordinate value to index maps used to build write selections
+        self._coord_index: dict[str, tuple[np.ndarray, dict[Any, int] | None]] = {}
         for dim in self.root.dimensions:
             if dim == "time":
                 nums = self.root[dim]
@@ -199,6 +206,7 @@ class NetCDF4Backend:
             if c not in self.coords:
                 self.add_dimension(c, v.shape, v)
                 self.coords[c] = v
+                self._coord_index[c] = (v, coord_index_map(v))
 
         # Add multidimensional coords
         for k in mapping:
@@ -274,13 +282,13 @@ class NetCDF4Backend:
             if name not in self.root.variables:
                 self.add_array(adjusted_coords, name)
 
-            # Get indices as list of arrays and set torch tensor
+            # Contiguous index runs are written as slices
             self.root[name][
                 tuple(
-                    [
-                        np.where(np.isin(self.coords[dim], value))[0]
-                        for dim, value in adjusted_coords.items()
-                    ]
+                    contiguous_selection(
+                        cached_coord_indices(self.coords, self._coord_index, dim, value)
+                    )
+                    for dim, value in adjusted_coords.items()
                 )
             ] = xi.to("cpu").numpy()
 
@@ -0,0 +1,263 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-FileCopyrightText: All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import torch
+
+from earth2studio.io.base import IOBackend
+from earth2studio.utils.type import CoordSystem
+
+
+def _index_keys(values: np.ndarray) -> list[Any]:
+    """Hashable keys of a 1D coordinate array. Datetime and timedelta coordinates are
+    normalized to nanoseconds so keys compare equal across numpy time units.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1D coordinate array
+
+    Returns
+    -------
+    list[Any]
+        Python scalar keys
+    """
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype("datetime64[ns]").view(np.int64)
+    elif np.issubdtype(values.dtype, np.timedelta64):
+        values = values.astype("timedelta64[ns]").view(np.int64)
+    return values.tolist()
+
+
+def coord_index_map(values: np.ndarray) -> dict[Any, int] | None:
+    """Build a coordinate value to index hash map for a 1D store coordinate.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1D coordinate array of the store
+
+    Returns
+    -------
+    dict[Any, int] | None
+        Coordinate value to index map, None if the coordinate has duplicate values
+        and cannot be indexed by value
+    """
+    index_map = {key: i for i, key in enumerate(_index_keys(values))}
+    if len(index_map) != len(values):
+        return None
+    return index_map
+
+
+def coord_indices(
+    values: np.ndarray, value: np.ndarray, index_map: dict[Any, int] | None
+) -> np.ndarray:
+    """Indices of the store coordinate that are present in the requested coordinate
+    values, in store order. Equivalent to `np.where(np.isin(values, value))[0]` but
+    O(k) dictionary lookups for k requested values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        1D coordinate array of the store
+    value : np.ndarray
+        Requested coordinate values
+    index_map : dict[Any, int] | None
+        Index map from `coord_index_map`, falls back to `np.isin` if None
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique indices into the store coordinate
+    """
+    if index_map is None:
+        return np.where(np.isin(values, value))[0]
+    try:
+        indices = [index_map.get(key) for key in _index_keys(value)]
+    except TypeError:
+        # Unhashable / non-scalar values
+        return np.where(np.isin(values, value))[0]
+    return np.unique(np.array([i for i in indices if i is not None], dtype=np.int64))
+
+
+def cached_coord_indices(
+    coords: CoordSystem,
+    cache: dict[str, tuple[np.ndarray, dict[Any, int] | None]],
+    dim: str,
+    value: np.ndarray,
+) -> np.ndarray:
+    """Indices of the store coordinate dim present in value, using a cached value
+    to index map which is rebuilt if the store coordinate changed.
+
+    Parameters
+    ----------
+    coords : CoordSystem
+        Coordinate system of the store
+    cache : dict[str, tuple[np.ndarray, dict[Any, int] | None]]
+        Per dimension cache of the coordinate array and its index map, updated in
+        place
+    dim : str
+        Coordinate dimension name
+    value : np.ndarray
+        Requested coordinate values
+
+    Returns
+    -------
+    np.ndarray
+        Sorted unique indices into the store coordinate
+    """
+    values = coords[dim]
+    cached = cache.get(dim)
+    if cached is None or cached[0] is not values:
+        cached = (values, coord_index_map(values))
+        cache[dim] = cached
+    return coord_indices(values, value, cached[1])
+
+
+def contiguous_selection(indices: np.ndarray) -> slice | np.ndarray:
+    """Convert sorted unique indices into a slice if they form a contiguous run.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        Sorted unique indices
+
+    Returns
+    -------
+    slice | np.ndarray
+        Slice for contiguous runs, otherwise the input indices
+    """
+    if len(indices) > 0 and indices[-1] - indices[0] + 1 == len(indices):
+        return slice(int(indices[0]), int(indices[-1]) + 1)
+    return indices
+
+
+class BackgroundWriter:
+    """Bounded background writer that consumes output snapshots on a worker thread
+    so IO, including the device to host copy, overlaps with the next model steps.
+
+    Tensors are cloned when submitted, so the producer is free to modify them in
+    place. Submitting blocks once `max_queue_size` writes are pending (backpressure)
+    and `close` drains all pending writes. Errors raised by the IO backend are
+    re-raised in the producer thread on the next call.
+
+    Parameters
+    ----------
+    io : IOBackend
+        IO backend to write to. The backend should not be written to by other
+        threads while the writer is open.
+    max_queue_size : int, optional
+        Maximum number of pending writes, by default 2
+
+    Example
+    -------
+    >>> with BackgroundWriter(io) as writer:
+    ...     for x, coords in model:
+    ...         writer.write(*split_coords(x, coords))
+    """
+
+    def __init__(self, io: IOBackend, max_queue_size: int = 2) -> None:
+        if max_queue_size < 1:
+            raise ValueError(f"max_queue_size must be at least 1, got {max_queue_size}")
+        self.io = io
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="earth2studio-io-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                # Skip remaining writes once the backend failed
+                if self._error is None:
+                    self.io.write(*item)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def write(
+        self,
+        x: torch.Tensor | list[torch.Tensor],
+        coords: CoordSystem,
+        array_name: str | list[str],
+    ) -> None:
+        """Queue a snapshot of the data to be written by the background thread.
+        Blocks while the queue is full.
+
+        Parameters
+        ----------
+        x : torch.Tensor | list[torch.Tensor]
+            Tensor(s) to be written
+        coords : CoordSystem
+            Coordinates of the passed data
+        array_name : str | list[str]
+            Name(s) of the array(s) that will be written to
+        """
+        self._raise_error()
+        if not self._thread.is_alive():
+            raise RuntimeError("Background writer is closed")
+        if isinstance(x, torch.Tensor):
+            snapshot: torch.Tensor | list[torch.Tensor] = x.detach().clone()
+        else:
+            snapshot = [xi.detach().clone() for xi in x]
+        self._queue.put((snapshot, coords.copy(), array_name))
+
+    def drain(self) -> None:
+        """Block until all queued writes are complete."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Drain pending writes and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Do not mask the original exception with a write error
+        try:
+            self.close()
+        except Exception:  # noqa: S110
+            pass
@@ -25,6 +25,11 @@ from loguru import logger
 from zarr.core.array import Array as ZarrArray
 from zarr.core.array import CompressorsLike
 
+from earth2studio.io.utils import (
+    cached_coord_indices,
+    contiguous_selection,
+    coord_index_map,
+)
 from earth2studio.utils.coords import convert_multidim_to_singledim
 from earth2studio.utils.type import CoordSystem
 
@@ -76,6 +81,8 @@ class ZarrBackend:
 
         # Read data from file, if available
         self.coords: CoordSystem = OrderedDict({})
+        # Coordinate value to index maps used to build write selections
+        self._coord_index: dict[str, tuple[np.ndarray, dict[Any, int] | None]] = {}
         self.chunks = chunks.copy()
         for array in self.root:
             # https://github.com/pydata/xarray/pull/9669
@@ -181,6 +188,7 @@ class ZarrBackend:
                 )
                 self.root[dim][:] = values
                 self.coords[dim] = values
+                self._coord_index[dim] = (values, coord_index_map(values))
 
         # Add any multidim coordinates that were expelled above
         for k in mapping:
@@ -273,15 +281,19 @@ class ZarrBackend:
             if name not in self.root:
                 self.add_array(adjusted_coords, array_name)
 
-            # Get indices as list of arrays and set torch tensor
-            self.root[name][
-                np.ix_(
-                    *[
-                        np.where(np.isin(self.coords[dim], value))[0]
-                        for dim, value in adjusted_coords.items()
-                    ]
+            # Contiguous index runs are written as slices, avoiding zarr's fancy
+            # indexing path
+            selection = tuple(
+                contiguous_selection(
+                    cached_coord_indices(self.coords, self._coord_index, dim, value)
                 )
-            ] = xi.to("cpu", non_blocking=False).numpy()
+                for dim, value in adjusted_coords.items()
+            )
+            data = xi.to("cpu", non_blocking=False).numpy()
+            if all(isinstance(s, slice) for s in selection):
+                self.root[name][selection] = data
+            else:
+                self.root[name].oindex[selection] = data
 
     def read(
         self, coords: CoordSystem, array_name: str, device: torch.device = "cpu"
@@ -14,6 +14,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .healda import HealDA
-from .interp import InterpEquirectangular
-from .sda_stormcast import StormCastSDA
+from typing import TYPE_CHECKING
+
+from earth2studio.utils.imports import lazy_import_attributes
+
+if TYPE_CHECKING:
+    from earth2studio.models.da.healda import HealDA
+    from earth2studio.models.da.interp import InterpEquirectangular
+    from earth2studio.models.da.sda_stormcast import StormCastSDA
+
+# Models (and their optional dependencies) are imported on first attribute access
+_LAZY_IMPORTS = {
+    ".healda": ["HealDA"],
+    ".interp": ["InterpEquirectangular"],
+    ".sda_stormcast": ["StormCastSDA"],
+}
+__getattr__, __dir__ = lazy_import_attributes(__name__, _LAZY_IMPORTS)
@@ -29,7 +29,7 @@ from loguru import logger
 
 from earth2studio.models.auto import AutoModelMixin, Package
 from earth2studio.models.da.base import AssimilationModel
-from earth2studio.models.da.utils import filter_time_range
+from earth2studio.models.da.utils import partition_time_range
 from earth2studio.utils.imports import (
     OptionalDependencyFailure,
     check_optional_dependencies,
@@ -775,14 +775,15 @@ class HealDA(torch.nn.Module, AutoModelMixin):
         result: dict[str, list[pd.DataFrame | None]] = {}
         for sensor in ALL_SENSORS:
             sensor_df = obs[obs["sensor"] == sensor]
-            time_list: list[pd.DataFrame | None] = []
-            for t in request_time:
-                t_arr = np.array([t], dtype="datetime64[ns]")
-                df_t = filter_time_range(
-                    sensor_df, t_arr, self._tolerance, time_column="obs_time_ns"
+            result[sensor] = [
+                df_t if len(df_t) > 0 else None
+                for df_t in partition_time_range(
+                    sensor_df,
+                    np.asarray(request_time, dtype="datetime64[ns]"),
+                    self._tolerance,
+                    time_column="obs_time_ns",
                 )
-                time_list.append(df_t if len(df_t) > 0 else None)
-            result[sensor] = time_list
+            ]
         return result
 
     @staticmethod
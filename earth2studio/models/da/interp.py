@@ -24,7 +24,7 @@ from loguru import logger
 
 from earth2studio.models.da.utils import (
     dfseries_to_torch,
-    filter_time_range,
+    partition_time_range,
     validate_observation_fields,
 )
 from earth2studio.utils.imports import (
@@ -40,6 +40,12 @@ except ImportError:
     OptionalDependencyFailure("gpu")
     cp = None  # type: ignore[assignment]
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    OptionalDependencyFailure("da-interp")
+    cKDTree = None
+
 
 @check_optional_dependencies()
 class InterpEquirectangular(torch.nn.Module):
@@ -50,7 +56,13 @@ class InterpEquirectangular(torch.nn.Module):
     - Accepts DataFrames with observations (time, lat, lon, observation, variable)
     - Interpolates observations to a regular lat-lon grid using specified method
     - Validates input observations against schema constraints
-    - Supports interpolation methods: 'nearest' or 'smolyak' (Smolyak sparse grid algorithm)
+    - Supports interpolation methods: 'nearest', 'idw' (k-nearest inverse distance
+      weighting) or 'smolyak' (Smolyak sparse grid algorithm)
+
+    The 'nearest' and 'idw' methods search neighbors with a KD-tree built over the
+    observations in 3D unit-vector space (chord distance on the sphere) and query the
+    output grid in chunks, so peak memory scales with O(M + N) for M grid points and
+    N observations rather than O(M * N).
 
     Parameters
     ----------
@@ -61,16 +73,22 @@ class InterpEquirectangular(torch.nn.Module):
         Longitude coordinates for output grid, by default None (uses default
         grid over CONUS)
     interp_method : str, optional
-        Interpolation method to use: 'nearest' or 'smolyak', by default "smolyak"
+        Interpolation method to use: 'nearest', 'idw' or 'smolyak', by default
+        "smolyak"
     time_tolerance : TimeTolerance, optional
         Time tolerance for filtering observations. Observations within the tolerance
         window around each requested time will be used for interpolation, by default
         np.timedelta64(10, "m")
+    n_neighbors : int, optional
+        Number of nearest observations used by the 'idw' method, by default 8
+    idw_power : float, optional
+        Power of the great-circle distance used for 'idw' weights, by default 2.0
 
     Raises
     ------
     ValueError
-        If interp_method is not one of the supported methods
+        If interp_method is not one of the supported methods or n_neighbors is less
+        than one
 
     Badges
     ------
@@ -79,6 +97,10 @@ class InterpEquirectangular(torch.nn.Module):
 
     # Acceptable variables for this model
     VARIABLES = ["t2m", "u10m", "v10m", "sp"]
+    # Interpolation methods that use the spherical KD-tree neighbor search
+    INDEXED_METHODS = ["nearest", "idw"]
+    # Number of output grid points queried against the KD-tree at once
+    QUERY_CHUNK_SIZE = 2**18
 
     def __init__(
         self,
@@ -86,12 +108,16 @@ class InterpEquirectangular(torch.nn.Module):
         lon: np.ndarray | None = None,
         interp_method: str = "smolyak",
         time_tolerance: TimeTolerance = np.timedelta64(10, "m"),
+        n_neighbors: int = 8,
+        idw_power: float = 2.0,
     ) -> None:
-        if interp_method not in ["nearest", "smolyak"]:
+        if interp_method not in ["nearest", "idw", "smolyak"]:
             raise ValueError(
-                f"interp_method must be one of ['nearest', 'smolyak'], "
+                f"interp_method must be one of ['nearest', 'idw', 'smolyak'], "
                 f"got {interp_method}"
             )
+        if n_neighbors < 1:
+            raise ValueError(f"n_neighbors must be at least 1, got {n_neighbors}")
         super().__init__()
         self._lat = (
             lat if lat is not None else np.linspace(25.0, 50.0, 101, dtype=np.float32)
@@ -100,6 +126,8 @@ class InterpEquirectangular(torch.nn.Module):
             lon if lon is not None else np.linspace(235.0, 295.0, 241, dtype=np.float32)
         )
         self.interp_method = interp_method
+        self.n_neighbors = n_neighbors
+        self.idw_power = idw_power
         self._tolerance = normalize_time_tolerance(time_tolerance)
         self.register_buffer("device_buffer", torch.empty(0), persistent=False)
 
@@ -249,6 +277,11 @@ class InterpEquirectangular(torch.nn.Module):
         target_points_t = torch.stack(
             [lat_mesh_t.T.ravel(), lon_mesh_t.T.ravel()], dim=1
         )
+        # Unit vectors of the output grid, shared by all variables and time steps
+        target_xyz = None
+        if self.interp_method in self.INDEXED_METHODS:
+            lon_mesh, lat_mesh = np.meshgrid(lon_grid, lat_grid)
+            target_xyz = _latlon_to_xyz(lat_mesh.ravel(), lon_mesh.ravel())
 
         # Initialize output tensor
         interpolated_data = torch.full(
@@ -258,12 +291,13 @@ class InterpEquirectangular(torch.nn.Module):
             device=device,
         )
 
+        # Split observations into the tolerance window of each time step at once
+        time_filtered_dfs = partition_time_range(
+            df, np.asarray(time_coords), self._tolerance, time_column="time"
+        )
+
         # Process each time step separately
-        for t_idx, request_time in enumerate(time_coords):
-            # Filter observations within tolerance window for this time step
-            time_filtered_df = filter_time_range(
-                df, request_time, self._tolerance, time_column="time"
-            )
+        for t_idx, time_filtered_df in enumerate(time_filtered_dfs):
 
             # Group observations by variable and interpolate each
             for var_idx, variable in enumerate(variables):
@@ -289,7 +323,12 @@ class InterpEquirectangular(torch.nn.Module):
 
                 # Interpolate to grid using PyTorch
                 grid_values = self._interpolate_scattered(
-                    source_points_t, values_t, target_points_t, n_lat, n_lon
+                    source_points_t,
+                    values_t,
+                    target_points_t,
+                    n_lat,
+                    n_lon,
+                    target_xyz=target_xyz,
                 )
 
                 # Assign to this time step
@@ -321,6 +360,7 @@ class InterpEquirectangular(torch.nn.Module):
         target_points: torch.Tensor,
         n_lat: int,
         n_lon: int,
+        target_xyz: np.ndarray | None = None,
     ) -> torch.Tensor:
         """Interpolate scattered points to target grid using PyTorch.
 
@@ -341,38 +381,20 @@ class InterpEquirectangular(torch.nn.Module):
             Number of latitude points in output grid
         n_lon : int
             Number of longitude points in output grid
+        target_xyz : np.ndarray | None, optional
+            Precomputed unit vectors [M, 3] of the target points used by the indexed
+            methods. Computed from target_points if None, by default None
 
         Returns
         -------
         torch.Tensor
             Interpolated values [n_lat, n_lon]
         """
-        target_lat = target_points[:, 0:1]  # [M, 1]
-        target_lon = target_points[:, 1:2]  # [M, 1]
-        source_lat = source_points[:, 0:1].T  # [1, N]
-        source_lon = source_points[:, 1:2].T  # [1, N]
-
-        # Normalize longitude from -180,180 to 0,360 range
-        # Convert negative longitudes to positive: -180 -> 180, -90 -> 270, etc.
-        target_lon = torch.where(target_lon < 0, target_lon + 360.0, target_lon)
-        source_lon = torch.where(source_lon < 0, source_lon + 360.0, source_lon)
-
-        # Latitude distance (not periodic)
-        lat_diff = target_lat - source_lat  # [M, N]
-        lat_dist_sq = lat_diff**2
-
-        # Longitude distance with periodic boundary (0-360)
-        lon_diff = target_lon - source_lon  # [M, N]
-        # Compute periodic distance: min(|diff|, 360 - |diff|)
-        lon_diff_abs = torch.abs(lon_diff)
-        lon_dist = torch.minimum(lon_diff_abs, 360.0 - lon_diff_abs)
-        lon_dist_sq = lon_dist**2
-        distances = torch.sqrt(lat_dist_sq + lon_dist_sq)
-
-        if self.interp_method == "nearest":
-            # Nearest neighbor interpolation using distance
-            nearest_indices = torch.argmin(distances, dim=1)
-            interpolated = values[nearest_indices]
+        if self.interp_method in self.INDEXED_METHODS:
+            if target_xyz is None:
+                target_np = target_points.detach().cpu().numpy()
+                target_xyz = _latlon_to_xyz(target_np[:, 0], target_np[:, 1])
+            interpolated = self._indexed_interpolate(source_points, values, target_xyz)
         elif self.interp_method == "smolyak":
             interpolated = self._smolyak_interpolate(
                 source_points, values, target_points
@@ -383,6 +405,60 @@ class InterpEquirectangular(torch.nn.Module):
         # Reshape to grid
         return interpolated.reshape(n_lat, n_lon)
 
+    def _indexed_interpolate(
+        self,
+        source_points: torch.Tensor,
+        values: torch.Tensor,
+        target_xyz: np.ndarray,
+    ) -> torch.Tensor:
+        """Nearest neighbor / inverse distance weighting using a KD-tree over the
+        observations on the unit sphere.
+
+        Target points are queried in chunks of QUERY_CHUNK_SIZE so only
+        [chunk, n_neighbors] neighbor tables are alive at any time.
+
+        Parameters
+        ----------
+        source_points : torch.Tensor
+            Source points [N, 2] with (lat, lon) coordinates
+        values : torch.Tensor
+            Values at source points [N]
+        target_xyz : np.ndarray
+            Unit vectors of the target points [M, 3]
+
+        Returns
+        -------
+        torch.Tensor
+            Interpolated values [M]
+        """
+        source_np = source_points.detach().cpu().numpy()
+        tree = cKDTree(_latlon_to_xyz(source_np[:, 0], source_np[:, 1]))
+
+        k = 1 if self.interp_method == "nearest" else self.n_neighbors
+        k = min(k, source_np.shape[0])
+        n_target = target_xyz.shape[0]
+        interpolated = torch.empty(n_target, dtype=values.dtype, device=values.device)
+        for start in range(0, n_target, self.QUERY_CHUNK_SIZE):
+            end = min(start + self.QUERY_CHUNK_SIZE, n_target)
+            chord, index = tree.query(target_xyz[start:end], k=k, workers=-1)
+            index_t = torch.as_tensor(
+                index.reshape(end - start, k), device=values.device
+            )
+            if self.interp_method == "nearest":
+                interpolated[start:end] = values[index_t[:, 0]]
+                continue
+            # Chord length to great-circle angle for the weights
+            chord_t = torch.as_tensor(
+                chord.reshape(end - start, k), dtype=values.dtype, device=values.device
+            )
+            angle = 2.0 * torch.arcsin(torch.clamp(chord_t / 2.0, max=1.0))
+            weights = torch.clamp(angle, min=1e-10) ** (-self.idw_power)
+            interpolated[start:end] = (weights * values[index_t]).sum(
+                dim=1
+            ) / weights.sum(dim=1)
+
+        return interpolated
+
     def _chebyshev_polynomials(self, x: torch.Tensor, degree: int) -> torch.Tensor:
         """Evaluate Chebyshev polynomials T_0(x) through T_degree(x) using recurrence.
 
@@ -591,3 +667,29 @@ class InterpEquirectangular(torch.nn.Module):
         interpolated = target_basis @ coeffs  # [M]
 
         return interpolated
+
+
+def _latlon_to_xyz(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Convert lat/lon in degrees to 3D unit vectors. Euclidean (chord) distance
+    between unit vectors is monotonic in great-circle distance, so KD-tree neighbors
+    in this space are the true nearest neighbors on the sphere, including across the
+    anti-meridian.
+
+    Parameters
+    ----------
+    lat : np.ndarray
+        Latitude in degrees [N]
+    lon : np.ndarray
+        Longitude in degrees [N], either -180,180 or 0,360 range
+
+    Returns
+    -------
+    np.ndarray
+        Unit vectors [N, 3]
+    """
+    lat_r = np.deg2rad(np.asarray(lat, dtype=np.float64))
+    lon_r = np.deg2rad(np.asarray(lon, dtype=np.float64))
+    cos_lat = np.cos(lat_r)
+    return np.stack(
+        [cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)], axis=-1
+    )
@@ -19,7 +19,7 @@ import pandas as pd
 import torch
 from loguru import logger
 
-from earth2studio.utils.obs import filter_time_range  # noqa: F401
+from earth2studio.utils.obs import filter_time_range, partition_time_range  # noqa: F401
 
 try:
     import cudf
@@ -14,41 +14,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING
+
 from earth2studio.models.dx.base import DiagnosticModel
-from earth2studio.models.dx.cbottle_infill import CBottleInfill  # noqa
-from earth2studio.models.dx.cbottle_sr import CBottleSR  # noqa
-from earth2studio.models.dx.cbottle_tc import CBottleTCGuidance  # noqa
-from earth2studio.models.dx.climatenet import ClimateNet  # noqa
-from earth2studio.models.dx.corrdiff import (
-    CorrDiff,
-    CorrDiffTaiwan,
-)
-from earth2studio.models.dx.corrdiff_cmip6 import CorrDiffCMIP6
-from earth2studio.models.dx.corrdiff_cosmo_era5 import CorrDiffCosmoEra5
-from earth2studio.models.dx.derived import (
-    DerivedRH,
-    DerivedRHDewpoint,
-    DerivedSurfacePressure,
-    DerivedTCWV,
-    DerivedVPD,
-    DerivedWS,
-)
-from earth2studio.models.dx.dlesym_v0_isccp_era5_precip import (
-    DLESyMv0_ISCCP_ERA5Precip,  # noqa
-)
-from earth2studio.models.dx.identity import Identity  # noqa
-from earth2studio.models.dx.orbit2_precip import OrbitGlobalPrecip  # noqa
-from earth2studio.models.dx.precipitation_afno import PrecipitationAFNO  # noqa
-from earth2studio.models.dx.precipitation_afno_v2 import PrecipitationAFNOv2  # noqa
-from earth2studio.models.dx.solarradiation_afno import (
-    SolarRadiationAFNO1H,
-    SolarRadiationAFNO6H,
-)
-from earth2studio.models.dx.tc_tracking import (
-    TCTrackerVitart,
-    TCTrackerWuDuan,
-)
-from earth2studio.models.dx.wind_gust import WindgustAFNO  # noqa
+from earth2studio.utils.imports import lazy_import_attributes
+
+if TYPE_CHECKING:
+    from earth2studio.models.dx.cbottle_infill import CBottleInfill
+    from earth2studio.models.dx.cbottle_sr import CBottleSR
+    from earth2studio.models.dx.cbottle_tc import CBottleTCGuidance
+    from earth2studio.models.dx.climatenet import ClimateNet
+    from earth2studio.models.dx.corrdiff import CorrDiff, CorrDiffTaiwan
+    from earth2studio.models.dx.corrdiff_cmip6 import CorrDiffCMIP6
+    from earth2studio.models.dx.corrdiff_cosmo_era5 import CorrDiffCosmoEra5
+    from earth2studio.models.dx.derived import (
+        DerivedRH,
+        DerivedRHDewpoint,
+        DerivedSurfacePressure,
+        DerivedTCWV,
+        DerivedVPD,
+        DerivedWS,
+    )
+    from earth2studio.models.dx.dlesym_v0_isccp_era5_precip import (
+        DLESyMv0_ISCCP_ERA5Precip,
+    )
+    from earth2studio.models.dx.identity import Identity
+    from earth2studio.models.dx.orbit2_precip import OrbitGlobalPrecip
+    from earth2studio.models.dx.precipitation_afno import PrecipitationAFNO
+    from earth2studio.models.dx.precipitation_afno_v2 import PrecipitationAFNOv2
+    from earth2studio.models.dx.solarradiation_afno import (
+        SolarRadiationAFNO1H,
+        SolarRadiationAFNO6H,
+    )
+    from earth2studio.models.dx.tc_tracking import TCTrackerVitart, TCTrackerWuDuan
+    from earth2studio.models.dx.wind_gust import WindgustAFNO
+
+# Models (and their optional dependencies) are imported on first attribute access
+_LAZY_IMPORTS = {
+    ".cbottle_infill": ["CBottleInfill"],
+    ".cbottle_sr": ["CBottleSR"],
+    ".cbottle_tc": ["CBottleTCGuidance"],
+    ".climatenet": ["ClimateNet"],
+    ".corrdiff": ["CorrDiff", "CorrDiffTaiwan"],
+    ".corrdiff_cmip6": ["CorrDiffCMIP6"],
+    ".corrdiff_cosmo_era5": ["CorrDiffCosmoEra5"],
+    ".derived": [
+        "DerivedRH",
+        "DerivedRHDewpoint",
+        "DerivedSurfacePressure",
+        "DerivedTCWV",
+        "DerivedVPD",
+        "DerivedWS",
+    ],
+    ".dlesym_v0_isccp_era5_precip": ["DLESyMv0_ISCCP_ERA5Precip"],
+    ".identity": ["Identity"],
+    ".orbit2_precip": ["OrbitGlobalPrecip"],
+    ".precipitation_afno": ["PrecipitationAFNO"],
+    ".precipitation_afno_v2": ["PrecipitationAFNOv2"],
+    ".solarradiation_afno": ["SolarRadiationAFNO1H", "SolarRadiationAFNO6H"],
+    ".tc_tracking": ["TCTrackerVitart", "TCTrackerWuDuan"],
+    ".wind_gust": ["WindgustAFNO"],
+}
+__getattr__, __dir__ = lazy_import_attributes(__name__, _LAZY_IMPORTS)
 
 __all__ = [
     "ClimateNet",
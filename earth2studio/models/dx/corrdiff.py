@@ -144,6 +144,10 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
     sigma_max : float | None, optional
         Maximum noise level for diffusion process. If None, uses sampler-specific defaults
         By default None.
+    sample_batch_size : int, optional
+        Maximum number of diffusion samples denoised together in one batch. Samples
+        of all input batch members are stacked into micro-batches of at most this
+        size, each sample keeping its own seed, by default 1
 
     Badges
     ------
@@ -179,12 +183,15 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         grid_bounds_margin: float = 0.0,
         sigma_min: float | None = None,
         sigma_max: float | None = None,
+        sample_batch_size: int = 1,
     ):
         super().__init__()
 
         # Validate parameters
         if not isinstance(number_of_samples, int) or number_of_samples < 1:
             raise ValueError("`number_of_samples` must be a positive integer.")
+        if not isinstance(sample_batch_size, int) or sample_batch_size < 1:
+            raise ValueError("`sample_batch_size` must be a positive integer.")
         if not isinstance(number_of_steps, int) or number_of_steps < 1:
             raise ValueError("`number_of_steps` must be a positive integer.")
         if solver not in ["heun", "euler"]:
@@ -206,6 +213,7 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         self.grid_bounds_margin = grid_bounds_margin
         self.sigma_max = sigma_max
         self.sigma_min = sigma_min
+        self.sample_batch_size = sample_batch_size
 
         # Store models
         self.residual_model = residual_model
@@ -628,6 +636,7 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         device: str | None = None,
         sigma_min: float | None = None,
         sigma_max: float | None = None,
+        sample_batch_size: int = 1,
     ) -> DiagnosticModel:
         """Load CorrDiff model from package.
 
@@ -643,6 +652,9 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         sigma_max : float | None, optional
             Maximum noise level for diffusion process. Priority order: (1) this argument,
             (2) metadata.json, (3) sampler internal defaults. By default None.
+        sample_batch_size : int, optional
+            Maximum number of diffusion samples denoised together in one batch,
+            by default 1
 
         Returns
         -------
@@ -850,6 +862,7 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
             grid_bounds_margin=grid_bounds_margin,
             sigma_min=effective_sigma_min,
             sigma_max=effective_sigma_max,
+            sample_batch_size=sample_batch_size,
         )
 
     @staticmethod
@@ -1035,6 +1048,30 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         torch.Tensor
             Output tensor
         """
+        return self._forward_batch(x.unsqueeze(0), [valid_time])[0]
+
+    @torch.inference_mode()
+    def _forward_batch(
+        self, x: torch.Tensor, valid_times: list[datetime | None]
+    ) -> torch.Tensor:
+        """Forward pass of the model over a batch of inputs.
+
+        The diffusion samples of all batch members are generated together in
+        micro-batches of at most `sample_batch_size` samples. Sample j of each batch
+        member is seeded with seed + j, independent of the micro-batch size.
+
+        Parameters
+        ----------
+        x : torch.Tensor
+            Input tensor of shape [B, C, H_in, W_in]
+        valid_times : list[datetime | None]
+            Validity time of each input batch member, passed to `preprocess_input`
+
+        Returns
+        -------
+        torch.Tensor
+            Output tensor of shape [B, number_of_samples, C_out, H_out, W_out]
+        """
         if self.solver not in ["euler", "heun"]:
             raise ValueError(
                 f"solver must be either 'euler' or 'heun' but got {self.solver}"
@@ -1042,61 +1079,68 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
 
         # Preprocess input (interpolate, add batch dimension, add invariants, normalize)
         # Base class ignores valid_time; subclasses can override preprocess_input to use it
-        image_lr = self.preprocess_input(x, valid_time)
+        image_lr = torch.concat(
+            [self.preprocess_input(x[i], valid_times[i]) for i in range(x.shape[0])],
+            dim=0,
+        )
         image_lr = image_lr.to(torch.float32).to(memory_format=torch.channels_last)
+        batch_size = image_lr.shape[0]
 
-        # Run regression model
+        # Run regression model, regression_step only supports a single input
         if self.regression_model:
             latents_shape = (1, len(self.output_variables), *image_lr.shape[-2:])
             with self._inference_context():
-                image_reg = regression_step(
-                    net=self.regression_model,
-                    img_lr=image_lr,
-                    latents_shape=latents_shape,
+                image_reg = torch.concat(
+                    [
+                        regression_step(
+                            net=self.regression_model,
+                            img_lr=image_lr[i : i + 1],
+                            latents_shape=latents_shape,
+                        )
+                        for i in range(batch_size)
+                    ],
+                    dim=0,
                 )
 
-        # Generate samples
-        def generate(i: int) -> torch.Tensor:
-            """Generate a single sample.
-
-            Parameters
-            ----------
-            i : int
-                Sample index
-
-            Returns
-            -------
-            torch.Tensor
-                Generated sample
-            """
-            seed = self.seed if self.seed is not None else np.random.randint(2**32)
-
-            if self.residual_model and self.inference_mode != "regression":
-                mean_hr = image_reg[:1] if self.hr_mean_conditioning else None
+        # Generate samples of all batch members in micro-batches
+        if self.residual_model and self.inference_mode != "regression":
+            jobs: list[tuple[int, int]] = []
+            for i in range(batch_size):
+                seed = self.seed if self.seed is not None else np.random.randint(2**32)
+                jobs.extend((i, seed + j) for j in range(self.number_of_samples))
+
+            samples = []
+            for k in range(0, len(jobs), self.sample_batch_size):
+                index, seeds = zip(*jobs[k : k + self.sample_batch_size])
+                index = torch.tensor(index, device=image_lr.device)
+                mean_hr = image_reg[index] if self.hr_mean_conditioning else None
                 with self._inference_context():
-                    image_res = diffusion_step(
-                        net=self.residual_model,
-                        sampler_fn=self.sampler,
-                        img_shape=image_lr.shape[-2:],
-                        img_out_channels=len(self.output_variables),
-                        rank_batches=[[seed + i]],
-                        img_lr=image_lr,
-                        rank=1,
-                        device=image_lr.device,
-                        mean_hr=mean_hr,
+                    samples.append(
+                        diffusion_step(
+                            net=self.residual_model,
+                            sampler_fn=self.sampler,
+                            img_shape=image_lr.shape[-2:],
+                            img_out_channels=len(self.output_variables),
+                            rank_batches=[list(seeds)],
+                            img_lr=image_lr[index],
+                            rank=1,
+                            device=image_lr.device,
+                            mean_hr=mean_hr,
+                        )
                     )
+            image_res = torch.concat(samples, dim=0)
+            image_res = image_res.reshape(
+                batch_size, self.number_of_samples, *image_res.shape[1:]
+            )
 
-            if self.inference_mode == "regression":
-                return image_reg
-            elif self.inference_mode == "diffusion":
-                return image_res
-            else:
-                return image_reg + image_res
-
-        # Generate all samples
-        image_out = torch.concat(
-            [generate(i) for i in range(self.number_of_samples)], dim=0
-        )
+        if self.inference_mode == "regression":
+            image_out = image_reg.unsqueeze(1).expand(
+                -1, self.number_of_samples, -1, -1, -1
+            )
+        elif self.inference_mode == "diffusion":
+            image_out = image_res
+        else:
+            image_out = image_reg.unsqueeze(1) + image_res
 
         # Denormalize output
         image_out = self.postprocess_output(image_out)
@@ -1207,8 +1251,7 @@ class CorrDiff(torch.nn.Module, AutoModelMixin):
         else:
             valid_time_list = [None] * out.shape[0]
 
-        for i in range(out.shape[0]):
-            out[i] = self._forward(x[i], valid_time_list[i])
+        out[:] = self._forward_batch(x, valid_time_list)
 
         return out, output_coords
 
@@ -15,39 +15,76 @@
 # limitations under the License.
 
 import warnings
+from typing import TYPE_CHECKING
 
-from earth2studio.models.px.ace2 import ACE2ERA5
-from earth2studio.models.px.aifs import AIFS
-from earth2studio.models.px.aifs2 import AIFS2
-from earth2studio.models.px.aifs2ens import AIFS2ENS
-from earth2studio.models.px.aifsens import AIFSENS
-from earth2studio.models.px.atlas import Atlas
-from earth2studio.models.px.aurora import Aurora
-from earth2studio.models.px.aurora1p5 import Aurora1p5, Aurora1p5Ensemble
 from earth2studio.models.px.base import PrognosticModel
-from earth2studio.models.px.cbottle_video import CBottleVideo
-from earth2studio.models.px.dlesym import DLESyM, DLESyMLatLon
-from earth2studio.models.px.dlesym_v0_isccp_era5 import (
-    DLESyMv0_ISCCP_ERA5,
-    DLESyMv0_ISCCP_ERA5LatLon,
-)
-from earth2studio.models.px.dlwp import DLWP
-from earth2studio.models.px.dxwrapper import DiagnosticWrapper
-from earth2studio.models.px.fcn import FCN
-from earth2studio.models.px.fcn3 import FCN3
-from earth2studio.models.px.fengwu import FengWu
-from earth2studio.models.px.fuxi import FuXi
-from earth2studio.models.px.gencast_mini import GenCastMini
-from earth2studio.models.px.graphcast_operational import GraphCastOperational
-from earth2studio.models.px.graphcast_small import GraphCastSmall
-from earth2studio.models.px.interpmodafno import InterpModAFNO
-from earth2studio.models.px.pangu import Pangu3, Pangu6, Pangu24
-from earth2studio.models.px.persistence import Persistence
-from earth2studio.models.px.sfno import SFNO
-from earth2studio.models.px.stormcast import StormCast
-from earth2studio.models.px.stormcastconus import StormCastCONUS
-from earth2studio.models.px.stormscope import StormScopeGOES, StormScopeMRMS
-from earth2studio.models.px.ucast import UCast
+from earth2studio.utils.imports import lazy_import_attributes
+
+if TYPE_CHECKING:
+    from earth2studio.models.px.ace2 import ACE2ERA5
+    from earth2studio.models.px.aifs import AIFS
+    from earth2studio.models.px.aifs2 import AIFS2
+    from earth2studio.models.px.aifs2ens import AIFS2ENS
+    from earth2studio.models.px.aifsens import AIFSENS
+    from earth2studio.models.px.atlas import Atlas
+    from earth2studio.models.px.aurora import Aurora
+    from earth2studio.models.px.aurora1p5 import Aurora1p5, Aurora1p5Ensemble
+    from earth2studio.models.px.cbottle_video import CBottleVideo
+    from earth2studio.models.px.dlesym import DLESyM, DLESyMLatLon
+    from earth2studio.models.px.dlesym_v0_isccp_era5 import (
+        DLESyMv0_ISCCP_ERA5,
+        DLESyMv0_ISCCP_ERA5LatLon,
+    )
+    from earth2studio.models.px.dlwp import DLWP
+    from earth2studio.models.px.dxwrapper import DiagnosticWrapper
+    from earth2studio.models.px.fcn import FCN
+    from earth2studio.models.px.fcn3 import FCN3
+    from earth2studio.models.px.fengwu import FengWu
+    from earth2studio.models.px.fuxi import FuXi
+    from earth2studio.models.px.gencast_mini import GenCastMini
+    from earth2studio.models.px.graphcast_operational import GraphCastOperational
+    from earth2studio.models.px.graphcast_small import GraphCastSmall
+    from earth2studio.models.px.interpmodafno import InterpModAFNO
+    from earth2studio.models.px.pangu import Pangu3, Pangu6, Pangu24
+    from earth2studio.models.px.persistence import Persistence
+    from earth2studio.models.px.sfno import SFNO
+    from earth2studio.models.px.stormcast import StormCast
+    from earth2studio.models.px.stormcastconus import StormCastCONUS
+    from earth2studio.models.px.stormscope import StormScopeGOES, StormScopeMRMS
+    from earth2studio.models.px.ucast import UCast
+
+# Models (and their optional dependencies) are imported on first attribute access
+_LAZY_IMPORTS = {
+    ".ace2": ["ACE2ERA5"],
+    ".aifs": ["AIFS"],
+    ".aifs2": ["AIFS2"],
+    ".aifs2ens": ["AIFS2ENS"],
+    ".aifsens": ["AIFSENS"],
+    ".atlas": ["Atlas"],
+    ".aurora": ["Aurora"],
+    ".aurora1p5": ["Aurora1p5", "Aurora1p5Ensemble"],
+    ".cbottle_video": ["CBottleVideo"],
+    ".dlesym": ["DLESyM", "DLESyMLatLon"],
+    ".dlesym_v0_isccp_era5": ["DLESyMv0_ISCCP_ERA5", "DLESyMv0_ISCCP_ERA5LatLon"],
+    ".dlwp": ["DLWP"],
+    ".dxwrapper": ["DiagnosticWrapper"],
+    ".fcn": ["FCN"],
+    ".fcn3": ["FCN3"],
+    ".fengwu": ["FengWu"],
+    ".fuxi": ["FuXi"],
+    ".gencast_mini": ["GenCastMini"],
+    ".graphcast_operational": ["GraphCastOperational"],
+    ".graphcast_small": ["GraphCastSmall"],
+    ".interpmodafno": ["InterpModAFNO"],
+    ".pangu": ["Pangu3", "Pangu6", "Pangu24"],
+    ".persistence": ["Persistence"],
+    ".sfno": ["SFNO"],
+    ".stormcast": ["StormCast"],
+    ".stormcastconus": ["StormCastCONUS"],
+    ".stormscope": ["StormScopeGOES", "StormScopeMRMS"],
+    ".ucast": ["UCast"],
+}
+__getattr__, __dir__ = lazy_import_attributes(__name__, _LAZY_IMPORTS)
 
 # Silence warning spam from various models
 warnings.filterwarnings("ignore")
@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+from collections.abc import Iterator
+
 import numpy as np
 import torch
 
@@ -30,6 +33,10 @@ except ImportError:
     OptionalDependencyFailure("perturbation")
     InverseRealSHT = None
 
+# LRU of spherical GRF samplers, building the inverse SHT is expensive
+_SAMPLER_CACHE: OrderedDict[tuple, "GaussianRandomFieldS2"] = OrderedDict()
+_SAMPLER_CACHE_SIZE = 8
+
 
 @check_optional_dependencies()
 class SphericalGaussian:
@@ -95,34 +102,137 @@ class SphericalGaussian:
         # Check the required dimensions are present
         handshake_dim(coords, required_dim="lat", required_index=-2)
         handshake_dim(coords, required_dim="lon", required_index=-1)
+
+        noise = self._sample(shape, x.device, x.dtype)
+        noise_amplitude = self.noise_amplitude.to(x.device)
+        return x + noise_amplitude * noise, coords
+
+    @torch.inference_mode()
+    def generate(
+        self,
+        shape: tuple[int, ...],
+        number_of_members: int,
+        chunk_size: int = 1,
+        device: torch.device | str = "cpu",
+        dtype: torch.dtype = torch.float32,
+    ) -> Iterator[torch.Tensor]:
+        """Stream scaled noise for a number of ensemble members in fixed-size chunks
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            Shape of a single ensemble member, the last two dimensions must be lat
+            and lon
+        number_of_members : int
+            Total number of ensemble members to generate noise for
+        chunk_size : int, optional
+            Number of members per yielded chunk, the last chunk may be smaller, by
+            default 1
+        device : torch.device | str, optional
+            Device to generate noise on, by default "cpu"
+        dtype : torch.dtype, optional
+            Data type of the noise, by default torch.float32
+
+        Yields
+        ------
+        torch.Tensor
+            Noise tensor of shape [chunk, *shape] scaled by the noise amplitude, i.e.
+            the perturbation added to a member by this method
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer")
+        noise_amplitude = self.noise_amplitude.to(device)
+        for start in range(0, number_of_members, chunk_size):
+            size = min(chunk_size, number_of_members - start)
+            yield noise_amplitude * self._sample(
+                (size, *shape), torch.device(device), dtype
+            )
+
+    def _sample(
+        self, shape: tuple[int, ...], device: torch.device, dtype: torch.dtype
+    ) -> torch.Tensor:
+        """Sample unit noise on a lat lon grid
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            Output shape, the last two dimensions must be lat and lon
+        device : torch.device
+            Device to sample on
+        dtype : torch.dtype
+            Data type of the input, double precision inputs are sampled in double
+            precision and all others in single precision
+
+        Returns
+        -------
+        torch.Tensor
+            Noise tensor of given shape
+        """
         # Check the ratio
         if 2 * (shape[-2] // 2) != shape[-1] / 2:
             raise ValueError("Lat/lon aspect ration must be N:2N or N+1:2N")
 
         nlat = 2 * (shape[-2] // 2)  # Noise only support even lat count
-        sampler = GaussianRandomFieldS2(
-            nlat=nlat,
-            alpha=self.alpha,
-            tau=self.tau,
-            sigma=self.sigma,
-            device=x.device,
-        )
-        sampler = sampler.to(x.device)
+        dtype = torch.float64 if dtype == torch.float64 else torch.float32
+        sampler = _cached_sampler(nlat, self.alpha, self.tau, self.sigma, device, dtype)
 
-        sample_noise = sampler(np.array(shape[:-2]).prod()).reshape(
+        sample_noise = sampler(int(np.prod(shape[:-2]))).reshape(
             *shape[:-2], nlat, 2 * nlat
         )
 
-        # Hack for odd lat coords
-        if x.shape[-2] % 2 == 1:
-            noise = torch.zeros_like(x)
-            noise[..., :-1, :] = sample_noise
-            noise[..., -1:, :] = noise[..., -2:-1, :]
-        else:
-            noise = sample_noise
+        # Hack for odd lat coords, repeat the last latitude row
+        if shape[-2] % 2 == 1:
+            return torch.cat([sample_noise, sample_noise[..., -1:, :]], dim=-2)
+        return sample_noise
 
-        noise_amplitude = self.noise_amplitude.to(x.device)
-        return x + noise_amplitude * noise, coords
+
+def _cached_sampler(
+    nlat: int,
+    alpha: float,
+    tau: float,
+    sigma: float | None,
+    device: torch.device,
+    dtype: torch.dtype,
+) -> "GaussianRandomFieldS2":
+    """Spherical GRF sampler from an LRU cache keyed on its parameters
+
+    Parameters
+    ----------
+    nlat : int
+        Number of latitudinal modes
+    alpha : float
+        Regularity parameter
+    tau : float
+        Length-scale parameter
+    sigma : float | None
+        Scale parameter
+    device : torch.device
+        Pytorch device
+    dtype : torch.dtype
+        Numerical type for the calculations
+
+    Returns
+    -------
+    GaussianRandomFieldS2
+        Sampler
+    """
+    key = (nlat, alpha, tau, sigma, str(device), dtype)
+    sampler = _SAMPLER_CACHE.get(key)
+    if sampler is None:
+        sampler = GaussianRandomFieldS2(
+            nlat=nlat,
+            alpha=alpha,
+            tau=tau,
+            sigma=sigma,
+            dtype=dtype,
+            device=device,
+        ).to(device)
+        _SAMPLER_CACHE[key] = sampler
+        while len(_SAMPLER_CACHE) > _SAMPLER_CACHE_SIZE:
+            _SAMPLER_CACHE.popitem(last=False)
+    else:
+        _SAMPLER_CACHE.move_to_end(key)
+    return sampler
 
 
 class GaussianRandomFieldS2(torch.nn.Module):
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 from collections import OrderedDict
+from contextlib import nullcontext
 from datetime import datetime
 from math import ceil
 
@@ -25,6 +26,7 @@ from tqdm import tqdm
 
 from earth2studio.data import DataSource, ForecastSource, fetch_data
 from earth2studio.io import IOBackend
+from earth2studio.io.utils import BackgroundWriter
 from earth2studio.models.dx import DiagnosticModel
 from earth2studio.models.px import PrognosticModel
 from earth2studio.perturbation import Perturbation
@@ -40,6 +42,28 @@ logger.remove()
 logger.add(lambda msg: tqdm.write(msg, end=""), colorize=True)
 
 
+def _write_output(
+    io: IOBackend,
+    writer: BackgroundWriter | None,
+    x: torch.Tensor,
+    coords: CoordSystem,
+    ckpt: CheckpointSession | NullCheckpoint,
+) -> None:
+    """Write workflow output synchronously, or through the background writer when
+    pipelining. Pending writes are drained before a checkpoint commit so a commit
+    never records outputs that are not yet on disk."""
+    if writer is None:
+        io.write(*split_coords(x, coords))
+        return
+
+    tensors, reduced_coords, var_names = split_coords(x, coords)
+    writer.write(tensors, reduced_coords, list(var_names))
+    if not isinstance(ckpt, NullCheckpoint):
+        interval = ckpt.catalog.flush_interval
+        if interval is not None and (ckpt.write_count + 1) % interval == 0:
+            writer.drain()
+
+
 # sphinx - deterministic start
 def deterministic(
     time: list[str] | list[datetime] | list[np.datetime64],
@@ -51,6 +75,7 @@ def deterministic(
     device: torch.device | None = None,
     verbose: bool = True,
     checkpoint: Checkpoint | CheckpointSession | NullCheckpoint = NullCheckpoint(),
+    pipeline_depth: int = 0,
 ) -> IOBackend:
     """Built in deterministic workflow.
     This workflow creates a determinstic inference pipeline to produce a forecast
@@ -77,6 +102,10 @@ def deterministic(
     checkpoint : Checkpoint, optional
         Checkpoint manager or checkpoint session used to record and resume workflow
         progress, by default no checkpoint
+    pipeline_depth : int, optional
+        Maximum number of output steps queued for a background IO writer thread,
+        which overlaps writes with the following model steps. If 0, outputs are
+        written synchronously, by default 0
 
     Returns
     -------
@@ -163,13 +192,20 @@ def deterministic(
 
         logger.info("Inference starting!")
         initial_progress = 0 if restart_step is None else restart_step + 1
-        with tqdm(
-            total=nsteps + 1,
-            initial=initial_progress,
-            desc="Running inference",
-            position=1,
-            disable=(not verbose),
-        ) as pbar:
+        with (
+            tqdm(
+                total=nsteps + 1,
+                initial=initial_progress,
+                desc="Running inference",
+                position=1,
+                disable=(not verbose),
+            ) as pbar,
+            (
+                BackgroundWriter(io, pipeline_depth)
+                if pipeline_depth > 0
+                else nullcontext()
+            ) as writer,
+        ):
             for local_step, (x, coords) in enumerate(model):
                 step = (
                     local_step
@@ -180,7 +216,7 @@ def deterministic(
                 current_lead_time = coords["lead_time"][-1]
                 # Subselect domain/variables as indicated in output_coords
                 x, coords = map_coords(x, coords, output_coords)
-                io.write(*split_coords(x, coords))
+                _write_output(io, writer, x, coords, ckpt)
                 ckpt.write(lead_time=current_lead_time)
                 pbar.update(1)
                 if step == nsteps:
@@ -359,6 +395,7 @@ def ensemble(
     device: torch.device | None = None,
     verbose: bool = True,
     checkpoint: Checkpoint | CheckpointSession | NullCheckpoint = NullCheckpoint(),
+    pipeline_depth: int = 0,
 ) -> IOBackend:
     """Built in ensemble workflow.
 
@@ -390,6 +427,10 @@ def ensemble(
     checkpoint : Checkpoint, optional
         Checkpoint manager or checkpoint session used to record and resume workflow
         progress, by default no checkpoint
+    pipeline_depth : int, optional
+        Maximum number of output steps queued for a background IO writer thread,
+        which overlaps writes with the following model steps. If 0, outputs are
+        written synchronously, by default 0
 
     Returns
     -------
@@ -449,7 +490,14 @@ def ensemble(
     if batch_size is None:
         batch_size = nensemble
     batch_size = min(nensemble, batch_size)
-    with checkpoint as ckpt:
+    with (
+        checkpoint as ckpt,
+        (
+            BackgroundWriter(io, pipeline_depth)
+            if pipeline_depth > 0
+            else nullcontext()
+        ) as writer,
+    ):
         completed_ensembles = []
         if ckpt.exists and not isinstance(ckpt, NullCheckpoint):
             completed_ensembles = [
@@ -527,7 +575,7 @@ def ensemble(
 
                     current_lead_time = coords["lead_time"][-1]
                     x, coords = map_coords(x, coords, output_coords)
-                    io.write(*split_coords(x, coords))
+                    _write_output(io, writer, x, coords, ckpt)
                     if step == nsteps:
                         completed.update(ensemble_members)
                         completed_ensembles = sorted(completed)
@@ -539,6 +587,8 @@ def ensemble(
                     if step == nsteps:
                         break
 
+            if writer is not None:
+                writer.drain()
             ckpt.flush()
 
     logger.success("\nInference complete")
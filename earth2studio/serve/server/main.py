@@ -65,10 +65,9 @@ from earth2studio.serve.server.redis_factory import (
     create_sync_redis_client,
 )
 from earth2studio.serve.server.utils import (
-    create_file_stream,
+    create_file_response,
     get_inference_request_output_path_key,
     get_inference_request_zip_key,
-    parse_range_header,
 )
 from earth2studio.serve.server.workflow import (
     WorkflowRegistry,
@@ -953,28 +952,14 @@ async def get_workflow_result_file(
                     },
                 )
 
-            zip_file_size = zip_file_path.stat().st_size
-            range_header = request.headers.get("Range")
-            start, end, content_length, range_status = parse_range_header(
-                range_header, zip_file_size
-            )
-            stream_generator = create_file_stream(
-                zip_file_path, start, content_length, "zip file"
-            )
-
-            headers = {
-                "Content-Disposition": f'attachment; filename="{zip_filename}"',
-                "Content-Length": str(content_length),
-                "Accept-Ranges": "bytes",
-            }
-            if range_status == 206:
-                headers["Content-Range"] = f"bytes {start}-{end}/{zip_file_size}"
-
-            return StreamingResponse(
-                stream_generator,
-                media_type="application/zip",
-                headers=headers,
-                status_code=range_status,
+            return create_file_response(
+                zip_file_path,
+                request.headers.get("Range"),
+                "application/zip",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{zip_filename}"'
+                },
+                file_description="zip file",
             )
 
         # Regular case: get file from output directory
@@ -1051,28 +1036,13 @@ async def get_workflow_result_file(
         if media_type is None:
             media_type = "application/octet-stream"
 
-        file_size = requested_path.stat().st_size
-        range_header = request.headers.get("Range")
-        start, end, content_length, range_status = parse_range_header(
-            range_header, file_size
-        )
-        stream_generator = create_file_stream(
-            requested_path, start, content_length, "file"
-        )
-
-        headers = {
-            "Content-Disposition": f'attachment; filename="{requested_path.name}"',
-            "Content-Length": str(content_length),
-            "Accept-Ranges": "bytes",
-        }
-        if range_status == 206:
-            headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
-
-        return StreamingResponse(
-            stream_generator,
-            media_type=media_type,
-            headers=headers,
-            status_code=range_status,
+        return create_file_response(
+            requested_path,
+            request.headers.get("Range"),
+            media_type,
+            headers={
+                "Content-Disposition": f'attachment; filename="{requested_path.name}"'
+            },
         )
 
     except HTTPException:
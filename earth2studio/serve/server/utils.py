@@ -15,6 +15,8 @@
 # limitations under the License.
 
 import asyncio
+import inspect
+import uuid
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Any, Literal
@@ -22,7 +24,9 @@ from urllib.parse import urlparse
 
 import aiofiles  # type: ignore[import-untyped]
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from starlette.types import Receive, Scope, Send
 
 from earth2studio.utils.imports import (
     OptionalDependencyFailure,
@@ -112,6 +116,10 @@ def parse_azure_blob_container_url(url: str) -> tuple[str, str]:
 # =============================================================================
 # File Streaming Utilities
 # =============================================================================
+STREAM_CHUNK_SIZE = 1048576  # 1MB chunks for better performance
+MAX_BYTE_RANGES = 64
+
+
 def parse_range_header(
     range_header: str | None, file_size: int
 ) -> tuple[int, int, int, int]:
@@ -194,6 +202,96 @@ def parse_range_header(
     return (start, end, content_length, status_code)
 
 
+def parse_byte_ranges(
+    range_header: str | None, file_size: int
+) -> list[tuple[int, int]]:
+    """
+    Parse every range of a Range header into inclusive byte offsets.
+
+    Unlike :func:`parse_range_header`, all ranges of a multi-range request are
+    returned. Ranges ending past the end of the file are clamped and ranges
+    starting past it are ignored, as allowed by RFC 9110.
+
+    Args:
+        range_header: The Range header value from the request, or None
+        file_size: Total size of the file in bytes
+
+    Returns:
+        List of (start, end) tuples in request order, empty when the whole file
+        should be served
+
+    Raises:
+        HTTPException: If the header is malformed, requests more than
+            MAX_BYTE_RANGES ranges or no range is satisfiable (416 status)
+    """
+    if not range_header:
+        return []
+
+    def not_satisfiable(details: str) -> HTTPException:
+        return HTTPException(
+            status_code=416,
+            headers={"Content-Range": f"bytes */{file_size}"},
+            detail={"error": "Range Not Satisfiable", "details": details},
+        )
+
+    if not range_header.startswith("bytes="):
+        raise not_satisfiable("Only byte ranges are supported")
+    parts = [part.strip() for part in range_header[6:].split(",") if part.strip()]
+    if len(parts) > MAX_BYTE_RANGES:
+        raise not_satisfiable(f"At most {MAX_BYTE_RANGES} ranges are supported")
+
+    ranges = []
+    for part in parts:
+        start_str, separator, end_str = part.partition("-")
+        if not separator:
+            raise not_satisfiable("Invalid range format")
+        try:
+            if start_str:
+                start = int(start_str)
+                end = int(end_str) if end_str else file_size - 1
+            else:
+                # Suffix range: "-suffix" means last N bytes
+                suffix = int(end_str)
+                if suffix == 0:
+                    continue
+                start = max(0, file_size - suffix)
+                end = file_size - 1
+        except ValueError:
+            raise not_satisfiable("Invalid range format") from None
+        if start < 0 or end < start:
+            raise not_satisfiable(f"Requested range {part} is invalid")
+        if start >= file_size:
+            continue
+        ranges.append((start, min(end, file_size - 1)))
+
+    if not ranges:
+        raise not_satisfiable(
+            f"Requested ranges {range_header[6:]} are invalid for file size {file_size}"
+        )
+    return ranges
+
+
+async def _read_file_range(
+    f: Any, start: int, content_length: int
+) -> AsyncGenerator[bytes, None]:
+    """Seek an open aiofiles handle to start and yield content_length bytes."""
+    if start > 0:
+        # aiofiles seek is a coroutine, but stay compatible with sync handles
+        result = f.seek(start)
+        if inspect.isawaitable(result):
+            await result
+
+    remaining = content_length
+    while remaining > 0:
+        read_size = min(STREAM_CHUNK_SIZE, remaining)
+        chunk = await f.read(read_size)
+        if not chunk:
+            break
+        yield chunk
+        remaining -= len(chunk)
+        await asyncio.sleep(0)
+
+
 async def create_file_stream(
     file_path: Path, start: int, content_length: int, file_description: str = "file"
 ) -> AsyncGenerator[bytes, None]:
@@ -210,33 +308,225 @@ async def create_file_stream(
         Bytes chunks from the file
     """
     try:
-        chunk_size = 1048576  # 1MB chunks for better performance
         async with aiofiles.open(file_path, "rb") as f:
-            # Skip leading bytes for range requests. Prefer sequential reads over seek so
-            # we stay compatible across aiofiles versions (seek may be sync or async).
-            if start > 0:
-                remaining_skip = start
-                while remaining_skip > 0:
-                    n = min(chunk_size, remaining_skip)
-                    data = await f.read(n)
-                    if not data:
-                        break
-                    remaining_skip -= len(data)
-
-            remaining = content_length
-            while remaining > 0:
-                read_size = min(chunk_size, remaining)
-                chunk = await f.read(read_size)
-                if not chunk:
-                    break
+            async for chunk in _read_file_range(f, start, content_length):
                 yield chunk
-                remaining -= len(chunk)
-                await asyncio.sleep(0)
     except Exception:
         logger.exception(f"Error streaming {file_description} {file_path}")
         raise
 
 
+def _multipart_part_header(
+    boundary: str, content_type: str, start: int, end: int, file_size: int
+) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Range: bytes {start}-{end}/{file_size}\r\n\r\n"
+    ).encode("latin-1")
+
+
+def multipart_byteranges_length(
+    ranges: list[tuple[int, int]], boundary: str, content_type: str, file_size: int
+) -> int:
+    """
+    Compute the Content-Length of a multipart/byteranges body.
+
+    Args:
+        ranges: Inclusive (start, end) byte ranges
+        boundary: Multipart boundary string
+        content_type: Media type of the file, repeated in each part
+        file_size: Total size of the file in bytes
+
+    Returns:
+        Size of the body produced by :func:`create_multipart_file_stream`
+    """
+    length = len(f"--{boundary}--\r\n")
+    for start, end in ranges:
+        header = _multipart_part_header(boundary, content_type, start, end, file_size)
+        length += len(header) + (end - start + 1) + 2
+    return length
+
+
+async def create_multipart_file_stream(
+    file_path: Path,
+    ranges: list[tuple[int, int]],
+    boundary: str,
+    content_type: str,
+    file_description: str = "file",
+) -> AsyncGenerator[bytes, None]:
+    """
+    Create an async generator that streams several file ranges as
+    multipart/byteranges.
+
+    Args:
+        file_path: Path to the file to stream
+        ranges: Inclusive (start, end) byte ranges, in response order
+        boundary: Multipart boundary string
+        content_type: Media type of the file, repeated in each part
+        file_description: Description for error logging
+
+    Yields:
+        Bytes chunks of the multipart body
+    """
+    try:
+        file_size = file_path.stat().st_size
+        async with aiofiles.open(file_path, "rb") as f:
+            for start, end in ranges:
+                yield _multipart_part_header(
+                    boundary, content_type, start, end, file_size
+                )
+                async for chunk in _read_file_range(f, start, end - start + 1):
+                    yield chunk
+                yield b"\r\n"
+        yield f"--{boundary}--\r\n".encode("latin-1")
+    except Exception:
+        logger.exception(f"Error streaming {file_description} {file_path}")
+        raise
+
+
+class FileRangeResponse(StreamingResponse):
+    """
+    Response streaming one byte range of a file.
+
+    When the ASGI server advertises the ``http.response.zerocopy`` extension the
+    open file is handed to the server, which sends the range with
+    ``os.sendfile``. Full-file responses also use ``http.response.pathsend`` when
+    available. Otherwise the range is streamed with :func:`create_file_stream`.
+
+    Args:
+        file_path: Path to the file to send
+        start: Starting byte position
+        content_length: Number of bytes to send
+        status_code: HTTP status code (200 or 206)
+        headers: Response headers, including Content-Length
+        media_type: Media type of the file
+        file_description: Description for error logging
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        start: int,
+        content_length: int,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        file_description: str = "file",
+    ) -> None:
+        super().__init__(
+            create_file_stream(file_path, start, content_length, file_description),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
+        self.file_path = file_path
+        self.range_start = start
+        self.range_length = content_length
+        self.full_file = start == 0 and content_length == file_path.stat().st_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopy" in extensions:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            with open(self.file_path, "rb") as handle:
+                await send(
+                    {
+                        "type": "http.response.zerocopy",
+                        "file": handle,
+                        "offset": self.range_start,
+                        "count": self.range_length,
+                        "more_body": False,
+                    }
+                )
+        elif "http.response.pathsend" in extensions and self.full_file:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.pathsend",
+                    "path": str(Path(self.file_path).resolve()),
+                }
+            )
+        else:
+            await super().__call__(scope, receive, send)
+            return
+        if self.background is not None:
+            await self.background()
+
+
+def create_file_response(
+    file_path: Path,
+    range_header: str | None,
+    media_type: str,
+    headers: dict[str, str] | None = None,
+    file_description: str = "file",
+) -> StreamingResponse:
+    """
+    Create a response serving a file, honouring single and multi-range requests.
+
+    Args:
+        file_path: Path to the file to serve
+        range_header: The Range header value from the request, or None
+        media_type: Media type of the file
+        headers: Extra response headers, e.g. Content-Disposition
+        file_description: Description for error logging
+
+    Returns:
+        A :class:`FileRangeResponse` for full-file and single-range requests, or a
+        multipart/byteranges streaming response for multi-range requests
+
+    Raises:
+        HTTPException: If the range is invalid (416 status)
+    """
+    file_size = file_path.stat().st_size
+    ranges = parse_byte_ranges(range_header, file_size)
+    response_headers = {**(headers or {}), "Accept-Ranges": "bytes"}
+
+    if len(ranges) > 1:
+        boundary = uuid.uuid4().hex
+        response_headers["Content-Length"] = str(
+            multipart_byteranges_length(ranges, boundary, media_type, file_size)
+        )
+        return StreamingResponse(
+            create_multipart_file_stream(
+                file_path, ranges, boundary, media_type, file_description
+            ),
+            status_code=206,
+            headers=response_headers,
+            media_type=f"multipart/byteranges; boundary={boundary}",
+        )
+
+    if ranges:
+        start, end = ranges[0]
+        status_code = 206
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    else:
+        start, end = 0, file_size - 1
+        status_code = 200
+    response_headers["Content-Length"] = str(end - start + 1)
+    return FileRangeResponse(
+        file_path,
+        start,
+        end - start + 1,
+        status_code=status_code,
+        headers=response_headers,
+        media_type=media_type,
+        file_description=file_description,
+    )
+
+
 # =============================================================================
 # Pipeline Stage Utilities
 # =============================================================================
@@ -21,7 +21,7 @@ from .crps import crps
 from .energy_score import energy_score
 from .fss import fss
 from .lsd import log_spectral_distance
-from .moments import mean, std, variance  # noqa
+from .moments import MomentsAccumulator, mean, std, variance  # noqa
 from .rank import rank_histogram  # noqa
 from .rmse import mae, rmse, skill_spread, spread_skill_ratio  # noqa
 from .weights import lat_weight  # noqa
@@ -63,6 +63,21 @@ class crps:
     fair: bool, optional
         If true, the CRPS is calculated using the fair CRPS formula.
         By default False.
+    batch_update: bool, optional
+        Whether to treat each invocation of __call__ as a new batch of ensemble
+        members scored against the same observation. Each invocation returns the
+        CRPS of all members seen so far, computed from the pairwise-difference
+        decomposition E|X - y| - 0.5 E|X - X'| without buffering the ensemble.
+        By default False.
+    sketch_size: int, optional
+        Maximum number of weighted atoms kept per point to evaluate cross-batch
+        member differences when batch_update is True. The score is exact while the
+        number of seen members does not exceed sketch_size, beyond which the
+        members are compressed into a fixed-memory quantile sketch. By default 128.
+    chunk_size: int, optional
+        Maximum number of grid points scored at once by the empirical CDF method,
+        bounding the size of the temporary sorted ensemble for very large grids.
+        If None, all points are scored at once. By default None.
     """
 
     def __init__(
@@ -71,11 +86,18 @@ class crps:
         reduction_dimensions: list[str] | None = None,
         weights: torch.Tensor = None,
         fair: bool = False,
+        batch_update: bool = False,
+        sketch_size: int = 128,
+        chunk_size: int | None = None,
     ):
         if not isinstance(ensemble_dimension, str):
             raise ValueError(
                 "Error! CRPS currently assumes reduction over a single dimension."
             )
+        if sketch_size < 1:
+            raise ValueError("Error! sketch_size must be a positive integer.")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("Error! chunk_size must be a positive integer.")
 
         self.ensemble_dimension = ensemble_dimension
         self._reduction_dimensions = reduction_dimensions
@@ -83,6 +105,12 @@ class crps:
             self.mean = mean(reduction_dimensions, weights=weights, batch_update=False)
         self.fair = fair
 
+        self.batch_update = batch_update
+        self.sketch_size = sketch_size
+        self.chunk_size = chunk_size
+        if self.batch_update:
+            self.n = 0
+
     def __str__(self) -> str:
         return "_".join(self.reduction_dimensions + ["crps"])
 
@@ -169,19 +197,133 @@ class crps:
                 coord_count += 1
 
         dim = list(x_coords).index(self.ensemble_dimension)
-        if self.fair:
+        if self.batch_update:
+            out = self._update(torch.movedim(x, dim, 0), y)
+        elif self.fair:
             out = kcrps(x, y, dim=dim, biased=False)
         else:
-            out = _crps_from_empirical_cdf(x, y, dim=dim)
+            out = _crps_from_empirical_cdf(x, y, dim=dim, chunk_size=self.chunk_size)
         out_coords = y_coords.copy()
 
         if self._reduction_dimensions is not None:
             out, out_coords = self.mean(out, out_coords)
         return out, out_coords
 
+    def _update(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        """Update the running CRPS terms with a batch of ensemble members
+
+        Parameters
+        ----------
+        x : torch.Tensor
+            Batch of ensemble members with the ensemble dimension first
+        y : torch.Tensor
+            Observation tensor
+
+        Returns
+        -------
+        torch.Tensor
+            CRPS of all ensemble members seen so far
+        """
+        abs_error = torch.sum(torch.abs(x - y.unsqueeze(0)), dim=0)
+        pair_sum = 2 * _sorted_pair_sum(x)
+        if self.n == 0:
+            self.abs_error = abs_error
+            self.pair_sum = pair_sum
+            self.sketch, self.sketch_weights = _compress_sketch(
+                x.clone(),
+                torch.ones(x.shape[0], device=x.device, dtype=x.dtype),
+                self.sketch_size,
+            )
+        else:
+            # Cross-batch pairs are counted twice in the sum over ordered pairs
+            weights = self.sketch_weights.view((-1,) + (1,) * y.ndim)
+            for member in x:
+                pair_sum += 2 * torch.sum(
+                    weights * torch.abs(self.sketch - member.unsqueeze(0)), dim=0
+                )
+            self.abs_error += abs_error
+            self.pair_sum += pair_sum
+            self.sketch, self.sketch_weights = _compress_sketch(
+                torch.cat([self.sketch, x], dim=0),
+                torch.cat(
+                    [
+                        self.sketch_weights,
+                        torch.ones_like(self.sketch_weights[:1]).expand(x.shape[0]),
+                    ]
+                ),
+                self.sketch_size,
+            )
+        self.n += x.shape[0]
+
+        if self.fair:
+            spread = self.pair_sum / (2 * self.n * (self.n - 1))
+        else:
+            spread = self.pair_sum / (2 * self.n**2)
+        return self.abs_error / self.n - spread
+
+
+def _sorted_pair_sum(x: torch.Tensor) -> torch.Tensor:
+    """Sum of absolute differences over all unordered pairs along the first
+    dimension, sum_{i<j} |x_i - x_j|, computed in O(n log n) from the sorted values.
+
+    Parameters
+    ----------
+    x : torch.Tensor
+        Input tensor with the sample dimension first
+
+    Returns
+    -------
+    torch.Tensor
+        Pairwise absolute difference sums
+    """
+    n = x.shape[0]
+    x, _ = torch.sort(x, dim=0)
+    coef = 2 * torch.arange(n, device=x.device, dtype=x.dtype) - (n - 1)
+    return torch.sum(coef.view((-1,) + (1,) * (x.ndim - 1)) * x, dim=0)
+
+
+def _compress_sketch(
+    values: torch.Tensor, weights: torch.Tensor, size: int
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Compress weighted atoms along the first dimension into at most `size`
+    equally weighted atoms placed at the mid-point quantiles of the weighted
+    empirical distribution.
+
+    Parameters
+    ----------
+    values : torch.Tensor
+        Atom values with the atom dimension first
+    weights : torch.Tensor
+        1D tensor of atom weights shared by every point
+    size : int
+        Maximum number of atoms to keep
+
+    Returns
+    -------
+    tuple[torch.Tensor, torch.Tensor]
+        Compressed atom values and weights
+    """
+    if values.shape[0] <= size:
+        return values, weights
+
+    total = torch.sum(weights)
+    values, order = torch.sort(values, dim=0)
+    cdf = torch.cumsum(weights[order.flatten()].view(order.shape), dim=0)
+    cdf = cdf.movedim(0, -1)
+    targets = (
+        (torch.arange(size, device=values.device, dtype=cdf.dtype) + 0.5) * total / size
+    ).expand(cdf.shape[:-1] + (size,))
+    index = torch.searchsorted(cdf.contiguous(), targets.contiguous())
+    index = torch.clamp(index, max=values.shape[0] - 1).movedim(-1, 0)
+    values = torch.gather(values, 0, index)
+    return values, torch.full_like(weights[:size], total / size)
+
 
 def _crps_from_empirical_cdf(
-    ensemble: torch.Tensor, truth: torch.Tensor, dim: int = 0
+    ensemble: torch.Tensor,
+    truth: torch.Tensor,
+    dim: int = 0,
+    chunk_size: int | None = None,
 ) -> torch.Tensor:
     """
 
@@ -194,7 +336,13 @@ def _crps_from_empirical_cdf(
     Uses this formula
         # int [F(x) - 1(x-y)]^2 dx
 
-    where F is the emperical CDF and 1(x-y) = 1 if x > y.
+    where F is the emperical CDF and 1(x-y) = 1 if x > y. The integral over the
+    piecewise constant empirical CDF is evaluated in closed form over the sorted
+    ensemble as
+
+        mean_i |x_i - y| - 1 / n^2 sum_i (2i - n - 1) x_(i)
+
+    which avoids looping over ensemble members.
 
     Parameters
     ----------
@@ -204,55 +352,47 @@ def _crps_from_empirical_cdf(
         tensor of observations
     dim : int
         Dimension to perform CRPS reduction over.
+    chunk_size : int | None, optional
+        Maximum number of grid points processed at once, bounding the size of the
+        temporary sorted ensemble for very large grids. If None, all points are
+        processed at once, by default None
 
     Returns
     -------
         tensor of CRPS scores
 
     """
-    n = ensemble.shape[dim]
-    device = ensemble.device
-    ensemble, _ = torch.sort(ensemble, dim=dim)
-    ans = torch.zeros_like(truth)
-
-    # dx [F(x) - H(x-y)]^2 = dx [0 - 1]^2 = dx
-    # val = ensemble[0] - truth
-    val = (
-        torch.index_select(
-            ensemble, dim, torch.tensor([0], device=device, dtype=torch.int32)
-        ).squeeze(dim)
-        - truth
-    )
-    ans += torch.where(val > 0, val, 0.0)
-
-    for i in range(n - 1):
-        x0 = torch.index_select(
-            ensemble, dim, torch.tensor([i], device=device, dtype=torch.int32)
-        ).squeeze(dim)
-        x1 = torch.index_select(
-            ensemble, dim, torch.tensor([i + 1], device=device, dtype=torch.int32)
-        ).squeeze(dim)
-
-        cdf = (i + 1) / n
-
-        # a. case y < x0
-        val = (x1 - x0) * (cdf - 1) ** 2
-        mask = truth < x0
-        ans += torch.where(mask, val, 0.0)
-
-        # b. case x0 <= y <= x1
-        val = (truth - x0) * cdf**2 + (x1 - truth) * (cdf - 1) ** 2
-        mask = (truth >= x0) & (truth <= x1)
-        ans += torch.where(mask, val, 0.0)
-
-        # c. case x1 < t
-        mask = truth > x1
-        val = (x1 - x0) * cdf**2
-        ans += torch.where(mask, val, 0.0)
-
-    # dx [F(x) - H(x-y)]^2 = dx [1 - 0]^2 = dx
-    val = truth - torch.index_select(
-        ensemble, dim, torch.tensor([n - 1], device=device, dtype=torch.int32)
-    ).squeeze(dim)
-    ans += torch.where(val > 0, val, 0.0)
-    return ans
+    ensemble = torch.movedim(ensemble, dim, 0)
+    n = ensemble.shape[0]
+    shape = torch.broadcast_shapes(ensemble.shape[1:], truth.shape)
+    if chunk_size is None or shape.numel() <= chunk_size:
+        return _crps_sorted(ensemble, truth)
+
+    ensemble = ensemble.expand((n,) + shape).reshape(n, -1)
+    truth = truth.expand(shape).reshape(-1)
+    ans = torch.empty_like(truth, dtype=torch.result_type(ensemble, truth))
+    for i in range(0, truth.shape[0], chunk_size):
+        ans[i : i + chunk_size] = _crps_sorted(
+            ensemble[:, i : i + chunk_size], truth[i : i + chunk_size]
+        )
+    return ans.reshape(shape)
+
+
+def _crps_sorted(ensemble: torch.Tensor, truth: torch.Tensor) -> torch.Tensor:
+    """Closed form empirical CRPS with the ensemble dimension first
+
+    Parameters
+    ----------
+    ensemble : torch.Tensor
+        tensor of ensemble members with the ensemble dimension first
+    truth : torch.Tensor
+        tensor of observations
+
+    Returns
+    -------
+    torch.Tensor
+        tensor of CRPS scores
+    """
+    n = ensemble.shape[0]
+    abs_error = torch.mean(torch.abs(ensemble - truth.unsqueeze(0)), dim=0)
+    return abs_error - _sorted_pair_sum(ensemble) / n**2
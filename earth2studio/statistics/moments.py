@@ -14,13 +14,212 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Any, cast
+
 import torch
+import torch.distributed as dist
 
 from earth2studio.statistics.utils import _broadcast_weights
 from earth2studio.utils.coords import handshake_dim
 from earth2studio.utils.type import CoordSystem
 
 
+class MomentsAccumulator:
+    """
+    Numerically stable accumulator of the weighted mean and variance of a stream of
+    batches. Each batch is reduced to its total weight, mean and sum of squared
+    deviations from its mean (M2), which are combined with the pairwise update of
+    Chan et al., generalizing Welford's algorithm. Unlike running sums, this does
+    not lose precision over long streams in low precision.
+
+    Accumulators of separate streams, for example on different processes, can be
+    combined with `merge` or with `all_reduce` over a `torch.distributed` process
+    group, and saved and restored with `state_dict` / `load_state_dict`.
+    """
+
+    def __init__(self) -> None:
+        self.weight: torch.Tensor | None = None
+        self.mean: torch.Tensor | None = None
+        self.m2: torch.Tensor | None = None
+
+    @property
+    def empty(self) -> bool:
+        """True if no data has been accumulated"""
+        return self.weight is None
+
+    def update(
+        self, x: torch.Tensor, weights: torch.Tensor, dims: list[int]
+    ) -> "MomentsAccumulator":
+        """Accumulate a batch of data
+
+        Parameters
+        ----------
+        x : torch.Tensor
+            Input data
+        weights : torch.Tensor
+            Weights broadcastable to x
+        dims : list[int]
+            Dimensions of x to reduce over
+
+        Returns
+        -------
+        MomentsAccumulator
+            The updated accumulator
+        """
+        weight = torch.sum(weights)
+        mean = torch.sum(weights * x, dim=dims, keepdim=True) / weight
+        m2 = torch.sum(weights * (x - mean) ** 2, dim=dims)
+        # Weights share the dtype of the moments, so all_reduce sees one dtype
+        return self._combine(weight.to(m2.dtype), mean.reshape(m2.shape), m2)
+
+    def merge(self, other: "MomentsAccumulator") -> "MomentsAccumulator":
+        """Merge the moments of another accumulator into this one
+
+        Parameters
+        ----------
+        other : MomentsAccumulator
+            Accumulator to merge
+
+        Returns
+        -------
+        MomentsAccumulator
+            The updated accumulator
+        """
+        if other.weight is None or other.mean is None or other.m2 is None:
+            return self
+        return self._combine(other.weight, other.mean, other.m2)
+
+    def _combine(
+        self, weight: torch.Tensor, mean: torch.Tensor, m2: torch.Tensor
+    ) -> "MomentsAccumulator":
+        if self.weight is None or self.mean is None or self.m2 is None:
+            self.weight, self.mean, self.m2 = weight.clone(), mean.clone(), m2.clone()
+            return self
+
+        total = self.weight + weight
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (weight / total)
+        self.m2 = self.m2 + m2 + delta**2 * (self.weight * weight / total)
+        self.weight = total
+        return self
+
+    def variance(self, correction: float = 1.0) -> torch.Tensor:
+        """Variance of the accumulated data
+
+        Parameters
+        ----------
+        correction : float, optional
+            Difference between the total weight and the divisor, by default 1.0
+            (sample variance)
+
+        Returns
+        -------
+        torch.Tensor
+            Variance
+        """
+        if self.weight is None or self.m2 is None:
+            raise ValueError("No data has been accumulated")
+        return self.m2 / torch.clamp(self.weight - correction, min=1.0)
+
+    def all_reduce(
+        self, group: Any = None, like: torch.Tensor | None = None
+    ) -> "MomentsAccumulator":
+        """Combine the accumulators of all ranks of a `torch.distributed` process
+        group in place, without gathering them. Ranks which have not accumulated any
+        data contribute zero weight, using `like` for the shape, dtype and device of
+        the moments. Whether ranks are empty is checked collectively, so every rank
+        either reduces or raises. Does nothing if torch.distributed is not
+        initialized or no rank holds data.
+
+        Parameters
+        ----------
+        group : Any, optional
+            Process group to reduce over, by default None (default group)
+        like : torch.Tensor | None, optional
+            Tensor with the shape, dtype and device of the accumulated mean, required
+            on ranks without data when other ranks hold data, by default None
+
+        Returns
+        -------
+        MomentsAccumulator
+            The updated accumulator
+
+        Raises
+        ------
+        ValueError
+            If a rank without data was not given `like` while other ranks hold data
+        """
+        if not (dist.is_available() and dist.is_initialized()):
+            return self
+
+        template = self.mean if self.mean is not None else like
+        if template is not None:
+            device = template.device
+        elif dist.get_backend(group) == "nccl":
+            device = torch.device("cuda", torch.cuda.current_device())
+        else:
+            device = torch.device("cpu")
+        # Agree on empty ranks before reducing moments so no rank is left waiting
+        flags = torch.tensor(
+            [float(self.empty), float(template is None)], device=device
+        )
+        dist.all_reduce(flags, group=group)
+        if int(flags[0].item()) == dist.get_world_size(group):
+            return self
+        if flags[1].item() > 0:
+            raise ValueError(
+                f"No data has been accumulated on {int(flags[1].item())} ranks, pass "
+                "`like` to all_reduce on ranks without data"
+            )
+
+        if self.weight is None or self.mean is None or self.m2 is None:
+            template = cast(torch.Tensor, template)
+            local_weight = torch.zeros((), dtype=template.dtype, device=device)
+            local_mean = torch.zeros_like(template)
+            local_m2 = torch.zeros_like(template)
+        else:
+            local_weight, local_mean, local_m2 = self.weight, self.mean, self.m2
+
+        weight = local_weight.clone()
+        dist.all_reduce(weight, group=group)
+        mean = local_mean * local_weight
+        dist.all_reduce(mean, group=group)
+        mean = mean / weight
+        # Deviations of each rank's mean from the global mean, Chan et al.
+        m2 = local_m2 + local_weight * (local_mean - mean) ** 2
+        dist.all_reduce(m2, group=group)
+
+        self.weight, self.mean, self.m2 = weight, mean, m2
+        return self
+
+    def state_dict(self) -> dict[str, torch.Tensor]:
+        """State of the accumulator
+
+        Returns
+        -------
+        dict[str, torch.Tensor]
+            Total weight, mean and M2 tensors, empty if no data has been accumulated
+        """
+        if self.weight is None or self.mean is None or self.m2 is None:
+            return {}
+        return {"weight": self.weight, "mean": self.mean, "m2": self.m2}
+
+    def load_state_dict(self, state_dict: dict[str, torch.Tensor]) -> None:
+        """Restore the state of the accumulator
+
+        Parameters
+        ----------
+        state_dict : dict[str, torch.Tensor]
+            State from `state_dict`
+        """
+        if not state_dict:
+            self.weight = self.mean = self.m2 = None
+            return
+        self.weight = state_dict["weight"]
+        self.mean = state_dict["mean"]
+        self.m2 = state_dict["m2"]
+
+
 class mean:
     """
     Statistic for calculating the sample mean over a set of given dimensions.
@@ -40,7 +239,8 @@ class mean:
     batch_update: bool, optional
         Whether to applying batch updates to the mean with each invocation of __call__.
         This is particularly useful when data is recieved in a stream of batches. Each
-        invocation of __call__ will return the running mean.
+        invocation of __call__ will return the running mean. The running moments are
+        kept in the `moments` attribute, a MomentsAccumulator.
         By default False.
     """
 
@@ -60,7 +260,7 @@ class mean:
 
         self.batch_update = batch_update
         if self.batch_update:
-            self.n = 0
+            self.moments = MomentsAccumulator()
 
     def __str__(self) -> str:
         return "_".join(self._reduction_dimensions + ["mean"])
@@ -129,13 +329,8 @@ class mean:
 
         # If batch updating then calculate updated mean
         else:
-            if self.n == 0:
-                self.sum = torch.sum(weights * x, dim=dims)
-            else:
-                self.sum += torch.sum(weights * x, dim=dims)
-
-            self.n += weights_sum
-            return self.sum / self.n, output_coords
+            self.moments.update(x, weights, dims)
+            return self.moments.mean.clone(), output_coords  # type: ignore[union-attr]
 
 
 class variance:
@@ -157,7 +352,8 @@ class variance:
     batch_update: bool, optional
         Whether to applying batch updates to the variance with each invocation of __call__.
         This is particularly useful when data is recieved in a stream of batches. Each
-        invocation of __call__ will return the running variance.
+        invocation of __call__ will return the running variance. The running moments
+        are kept in the `moments` attribute, a MomentsAccumulator.
         By default False.
     """
 
@@ -177,7 +373,7 @@ class variance:
 
         self.batch_update = batch_update
         if self.batch_update:
-            self.n = 0
+            self.moments = MomentsAccumulator()
 
     def __str__(self) -> str:
         return "_".join(self._reduction_dimensions + ["variance"])
@@ -247,28 +443,10 @@ class variance:
             div = weights_sum - torch.sum(weights**2) / weights_sum
             return torch.sum(weights * (x - m) ** 2, dim=dims) / div, output_coords
 
-        # If batch updating then calculate updated mean
+        # If batch updating then merge batch moments into the running moments
         else:
-            temp_n = weights_sum
-            temp_sum = torch.sum(weights * x, dim=dims)
-            temp_sum2 = torch.sum(weights * (x - temp_sum / temp_n) ** 2, dim=dims)
-
-            # First batch then no correction
-            if self.n == 0:
-                self.n = temp_n
-                self.sum = temp_sum
-                self.sum2 = temp_sum2
-            # Second-order correction with each batch
-            else:
-                delta = self.sum * temp_n / self.n - temp_sum
-                self.sum += temp_sum
-                self.sum2 += temp_sum2 + self.n / temp_n / (self.n + temp_n) * delta**2
-                self.n += temp_n
-
-            return (
-                self.sum2 / torch.maximum(self.n - 1.0, torch.tensor(1.0)),
-                output_coords,
-            )
+            self.moments.update(x, weights, dims)
+            return self.moments.variance(), output_coords
 
 
 class std:
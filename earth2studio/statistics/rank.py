@@ -59,6 +59,13 @@ class rank_histogram:
         distribution of ranks in cases where ties occur frequently. If False, the rank
         will be computed as if the observation were larger than the tied ensemble
         members, by default True
+    batch_update: bool, optional
+        Whether to treat each invocation of __call__ as a new batch of ensemble
+        members ranked against the same observation. Exact rank counts are
+        accumulated so memory scales with the batch rather than the ensemble size,
+        and each invocation returns the rank histogram of all members seen so far.
+        Set number_of_bins explicitly to keep the output shape fixed across batches,
+        by default False
     """
 
     def __init__(
@@ -67,6 +74,7 @@ class rank_histogram:
         reduction_dimensions: list[str],
         number_of_bins: int | None = None,
         randomize_ties: bool = True,
+        batch_update: bool = False,
     ):
         if not isinstance(ensemble_dimension, str):
             raise ValueError(
@@ -78,6 +86,10 @@ class rank_histogram:
         self.number_of_bins = number_of_bins
         self.randomize_ties = randomize_ties
 
+        self.batch_update = batch_update
+        if self.batch_update:
+            self.n = 0
+
     def __str__(self) -> str:
         return "rank_histogram"
 
@@ -87,6 +99,8 @@ class rank_histogram:
 
     def _get_number_of_bins(self, input_coords: CoordSystem) -> int:
         if self.number_of_bins is None:
+            if self.batch_update and self.n > 0:
+                return self.n + 1
             return len(input_coords[self.ensemble_dimension]) + 1
         else:
             return self.number_of_bins
@@ -176,8 +190,6 @@ class rank_histogram:
                 handshake_coords(y_coords, x_coords, c)
                 coord_count += 1
 
-        number_of_bins = self._get_number_of_bins(x_coords)
-
         # Get the dimension index of the ensemble dimension
         dim = list(x_coords).index(self.ensemble_dimension)
 
@@ -186,9 +198,29 @@ class rank_histogram:
 
         # Compute the ranks over the ensemble dimension
         _ranks = torch.sum(torch.ge(y, x).to(dtype=torch.int32), dim=0)
-
         if self.randomize_ties:
             _ranks_gt = torch.sum(torch.gt(y, x).to(dtype=torch.int32), dim=0)
+
+        # Accumulate exact rank counts over all seen ensemble batches
+        ensemble_size = x.shape[0]
+        if self.batch_update:
+            if self.n == 0:
+                self.ranks_ge = _ranks
+                if self.randomize_ties:
+                    self.ranks_gt = _ranks_gt
+            else:
+                self.ranks_ge += _ranks
+                if self.randomize_ties:
+                    self.ranks_gt += _ranks_gt
+            self.n += ensemble_size
+            ensemble_size = self.n
+            _ranks = self.ranks_ge.clone()
+            if self.randomize_ties:
+                _ranks_gt = self.ranks_gt
+
+        number_of_bins = self._get_number_of_bins(x_coords)
+
+        if self.randomize_ties:
             rank_diff = _ranks - _ranks_gt
             ties = rank_diff > 0
             _ranks[ties] -= (
@@ -206,7 +238,7 @@ class rank_histogram:
         )
 
         # Normalize ranks to [0, 1]
-        _ranks = _ranks / x.shape[0]
+        _ranks = _ranks / ensemble_size
 
         # Compute histogram
         # note: this version of linspace returns self.number_of_bins + 1 bin edges
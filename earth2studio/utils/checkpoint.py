@@ -17,11 +17,13 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 import shutil
 import uuid
 import warnings
 from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextvars import ContextVar, Token
 from dataclasses import MISSING, dataclass, fields, is_dataclass
 from datetime import date, datetime, timedelta, timezone
@@ -36,6 +38,7 @@ T = TypeVar("T")
 CheckpointLevel = Literal[0, 1, 2]
 
 _CHECKPOINT_VERSION = 1
+_RESTORE_CHUNK_BYTES = 64 * 1024 * 1024
 _ACTIVE_SESSION: ContextVar[CheckpointSession | None] = ContextVar(
     "earth2studio_checkpoint_session", default=None
 )
@@ -272,6 +275,10 @@ class NullCheckpoint:
         """Accept a flush request without committing anything."""
         return None
 
+    def wait(self) -> None:
+        """Return immediately; the no-op session never has commits in flight."""
+        return None
+
     def __enter__(self) -> NullCheckpoint:
         return self
 
@@ -359,6 +366,24 @@ class Checkpoint:
     device : str | torch.device, optional
         Device where components should stage live tensor state before it is
         serialized into the checkpoint, by default torch.device("cpu").
+    async_commit : bool, optional
+        Write commits on a background thread. Array state is first copied into
+        reusable (pinned, for CUDA tensors) host buffers, after which ``flush``
+        returns a :class:`~concurrent.futures.Future` of the catalog entry. At
+        most one commit is in flight; the next flush and session exit wait for
+        it, by default False.
+    dedup : bool, optional
+        Store arrays in a content-addressed blob store under the rank path and
+        hard-link them into each commit, so arrays that are unchanged between
+        commits (invariants, normalization statistics, seeds) are written and
+        stored once. Unreferenced blobs are removed when the catalog is updated,
+        by default False.
+    restore_inplace : bool, optional
+        Restore tensor and array fields of bound dataclasses into their existing
+        values when shape and dtype match, instead of replacing them. Data is
+        streamed from a memory map of the commit in bounded chunks, so
+        pre-allocated device tensors are filled without a full host copy, by
+        default False.
     """
 
     def __init__(
@@ -372,6 +397,9 @@ class Checkpoint:
         rank: int | None = None,
         world_size: int | None = None,
         device: str | torch.device = torch.device("cpu"),
+        async_commit: bool = False,
+        dedup: bool = False,
+        restore_inplace: bool = False,
     ) -> None:
         if mode not in ("overwrite", "append"):
             raise ValueError("mode must be 'overwrite' or 'append'.")
@@ -428,8 +456,16 @@ class Checkpoint:
         self.device = torch.device(device)
         self.rank = detected_rank if rank is None else rank
         self.world_size = detected_world_size if world_size is None else world_size
+        self.async_commit = async_commit
+        self.dedup = dedup
+        self.restore_inplace = restore_inplace
         self._catalog: list[CheckpointEntry] | None = None
         self._context_sessions: list[CheckpointSession] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: Future[CheckpointEntry] | None = None
+        self._inflight_commit: tuple[CheckpointSession, _CommitStage] | None = None
+        self._host_buffers: tuple[dict[str, Any], dict[str, Any]] = ({}, {})
+        self._buffer_index = 0
         _CURRENT_CHECKPOINT.set(self)
 
     @property
@@ -455,6 +491,7 @@ class Checkpoint:
 
     def refresh(self) -> None:
         """Refresh the checkpoint catalog from disk."""
+        self.wait()
         self._catalog = _read_catalog(self.rank_path)
 
     def select(self, row: int) -> CheckpointSession:
@@ -537,21 +574,75 @@ class Checkpoint:
         ]
         return "\n".join(lines + ["", header, *body])
 
+    def wait(self) -> CheckpointEntry | None:
+        """Block until the in-flight asynchronous commit, if any, is durable.
+
+        Returns
+        -------
+        CheckpointEntry | None
+            Catalog entry written by the in-flight commit, or ``None`` when no
+            asynchronous commit was pending.
+
+        Raises
+        ------
+        Exception
+            Any error raised while writing the in-flight commit.
+        """
+        future = self._inflight
+        commit = self._inflight_commit
+        if future is None or commit is None:
+            return None
+        try:
+            entry = future.result()
+        finally:
+            if self._inflight is future:
+                self._inflight = None
+                self._inflight_commit = None
+        # Session updates stay on the caller's thread, never the writer thread
+        self._finish_commit(*commit, entry)
+        return entry
+
     def _commit(
         self,
         session: CheckpointSession,
         metadata: Mapping[str, Any],
     ) -> CheckpointEntry:
-        self.rank_path.mkdir(parents=True, exist_ok=True)
-        commits_path = self.rank_path / "commits"
-        commits_path.mkdir(parents=True, exist_ok=True)
+        stage = self._stage_commit(session, metadata, buffers=None)
+        entry = self._write_commit(stage)
+        self._finish_commit(session, stage, entry)
+        return entry
+
+    def _commit_async(
+        self,
+        session: CheckpointSession,
+        metadata: Mapping[str, Any],
+    ) -> Future[CheckpointEntry]:
+        # Host buffers alternate between two sets so the next snapshot can be
+        # taken while the previous commit is still being written from the other.
+        buffers = self._host_buffers[self._buffer_index]
+        stage = self._stage_commit(session, metadata, buffers=buffers)
+        stage.record()
+        self.wait()
+        self._buffer_index = 1 - self._buffer_index
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="earth2studio-checkpoint"
+            )
+        future = self._executor.submit(self._write_commit, stage)
+        self._inflight = future
+        self._inflight_commit = (session, stage)
+        return future
 
+    def _stage_commit(
+        self,
+        session: CheckpointSession,
+        metadata: Mapping[str, Any],
+        buffers: dict[str, Any] | None,
+    ) -> _CommitStage:
         commit_id = f"commit_{session.write_count:08d}_{uuid.uuid4().hex[:12]}"
         tmp_path = self.rank_path / f".tmp_{commit_id}"
-        commit_path = commits_path / commit_id
-        if tmp_path.exists():
-            shutil.rmtree(tmp_path)
-        tmp_path.mkdir(parents=True)
+        blobs = _BlobStore(self.rank_path / "blobs") if self.dedup else None
+        stage = _CommitStage(tmp_path, buffers, blobs)
 
         manifest: dict[str, Any] = {
             "version": _CHECKPOINT_VERSION,
@@ -560,12 +651,13 @@ class Checkpoint:
             "mode": self.mode,
             "rank": self.rank,
             "world_size": self.world_size,
-            "labels": session.labels,
+            "labels": dict(session.labels),
             "metadata": {},
             "write_count": session.write_count,
             "saved_at": datetime.now(timezone.utc).isoformat(),
             "states": {},
         }
+        stage.manifest = manifest
 
         states_path = tmp_path / "states"
         if self.level > 0:
@@ -574,7 +666,6 @@ class Checkpoint:
                 state_path = (
                     states_path / sha256(state_id.encode("utf-8")).hexdigest()[:24]
                 )
-                state_path.mkdir(parents=True, exist_ok=True)
                 state_manifest = {
                     "state_id": state_id,
                     "schema_hash": _schema_hash(dataclass_state),
@@ -583,11 +674,12 @@ class Checkpoint:
                             getattr(dataclass_state, field.name),
                             state_path,
                             (field.name,),
+                            stage,
                         )
                         for field in fields(dataclass_state)
                     },
                 }
-                _write_json(state_path / "metadata.json", state_manifest)
+                stage.add_json(state_path / "metadata.json", state_manifest)
                 manifest["states"][state_id] = {
                     "path": str(state_path.relative_to(tmp_path)),
                     "schema_hash": _schema_hash(dataclass_state),
@@ -595,7 +687,6 @@ class Checkpoint:
 
         if metadata:
             metadata_path = tmp_path / "metadata"
-            metadata_path.mkdir(parents=True, exist_ok=True)
             for name, value in metadata.items():
                 if not isinstance(name, str):
                     raise CheckpointSerializationError(
@@ -606,20 +697,43 @@ class Checkpoint:
                         value,
                         metadata_path,
                         (sha256(name.encode("utf-8")).hexdigest()[:24],),
+                        stage,
                     )
                 except CheckpointSerializationError as exc:
                     raise CheckpointSerializationError(
                         f"Invalid checkpoint metadata {name!r}: {exc}"
                     ) from exc
 
+        stage.prune_buffers()
+        return stage
+
+    def _write_commit(self, stage: _CommitStage) -> CheckpointEntry:
+        self.rank_path.mkdir(parents=True, exist_ok=True)
+        commits_path = self.rank_path / "commits"
+        commits_path.mkdir(parents=True, exist_ok=True)
+
+        manifest = stage.manifest
+        tmp_path = stage.root
+        commit_path = commits_path / manifest["commit_id"]
+        if tmp_path.exists():
+            shutil.rmtree(tmp_path)
+        tmp_path.mkdir(parents=True)
+
+        stage.write()
         _write_json(tmp_path / "manifest.json", manifest)
         tmp_path.rename(commit_path)
 
         entry = _entry_from_manifest(manifest, commit_path)
         self._update_catalog(entry)
+        return entry
+
+    def _finish_commit(
+        self, session: CheckpointSession, stage: _CommitStage, entry: CheckpointEntry
+    ) -> None:
+        manifest = stage.manifest
+        commit_path = self.rank_path / "commits" / manifest["commit_id"]
         session._entry = entry
         session._loaded_states = _load_state_index(commit_path, manifest)
-        return entry
 
     def _update_catalog(self, entry: CheckpointEntry) -> None:
         entries = (
@@ -668,6 +782,7 @@ class Checkpoint:
         for tmp_path in self.rank_path.glob(".tmp_*"):
             if tmp_path.is_dir():
                 shutil.rmtree(tmp_path)
+        _BlobStore(self.rank_path / "blobs").collect()
 
 
 class CheckpointSession:
@@ -815,7 +930,10 @@ class CheckpointSession:
                     dataclass_state,
                     name,
                     _CheckpointCodec.load_value(
-                        payload, loaded_state.path, current_value
+                        payload,
+                        loaded_state.path,
+                        current_value,
+                        inplace=self.catalog.restore_inplace,
                     ),
                 )
 
@@ -853,7 +971,9 @@ class CheckpointSession:
             tuple(item for item in pending if item.checkpoint is not self.catalog)
         )
 
-    def write(self, **metadata: Any) -> CheckpointEntry | None:
+    def write(
+        self, **metadata: Any
+    ) -> CheckpointEntry | Future[CheckpointEntry] | None:
         """Record a safe restart boundary for the active session.
 
         ``write`` increments the session write count and stores the latest
@@ -863,9 +983,10 @@ class CheckpointSession:
 
         Returns
         -------
-        CheckpointEntry | None
-            The committed catalog entry when this call triggers a flush;
-            otherwise ``None``.
+        CheckpointEntry | Future[CheckpointEntry] | None
+            The committed catalog entry (or its future when the checkpoint uses
+            ``async_commit``) when this call triggers a flush; otherwise
+            ``None``.
         """
         sanitized_metadata = _CheckpointCodec.sanitize_metadata(metadata)
         previous_metadata = dict(self._pending_metadata)
@@ -886,7 +1007,9 @@ class CheckpointSession:
                 raise
         return None
 
-    def flush(self, **metadata: Any) -> CheckpointEntry | None:
+    def flush(
+        self, **metadata: Any
+    ) -> CheckpointEntry | Future[CheckpointEntry] | None:
         """Commit the current session state to the checkpoint catalog.
 
         ``flush`` writes an atomic commit directory containing the manifest,
@@ -894,10 +1017,16 @@ class CheckpointSession:
         row for this session. If no write is pending and no metadata overrides
         are supplied, no commit is created.
 
+        When the checkpoint uses ``async_commit``, state is snapshotted before
+        this call returns and the write completes on a background thread. Use
+        :meth:`wait` (called automatically on session exit) to block until it is
+        durable.
+
         Returns
         -------
-        CheckpointEntry | None
-            The committed catalog entry, or ``None`` when there was nothing new to
+        CheckpointEntry | Future[CheckpointEntry] | None
+            The committed catalog entry, a future resolving to it for
+            asynchronous commits, or ``None`` when there was nothing new to
             commit.
         """
         commit_metadata = dict(self._pending_metadata)
@@ -906,11 +1035,26 @@ class CheckpointSession:
         if not self._pending_dirty and not metadata:
             return None
 
-        entry = self.catalog._commit(self, commit_metadata)
+        entry: CheckpointEntry | Future[CheckpointEntry]
+        if self.catalog.async_commit:
+            entry = self.catalog._commit_async(self, commit_metadata)
+        else:
+            entry = self.catalog._commit(self, commit_metadata)
         self._pending_metadata = commit_metadata
         self._pending_dirty = False
         return entry
 
+    def wait(self) -> CheckpointEntry | None:
+        """Block until the in-flight asynchronous commit, if any, is durable.
+
+        Returns
+        -------
+        CheckpointEntry | None
+            Catalog entry written by the in-flight commit, or ``None`` when no
+            asynchronous commit was pending.
+        """
+        return self.catalog.wait()
+
     def __enter__(self) -> CheckpointSession:
         if not self._pending_adopted:
             self._adopt_pending_states()
@@ -919,11 +1063,14 @@ class CheckpointSession:
         return self
 
     def __exit__(self, *args: Any) -> None:
-        if self._tokens:
-            _ACTIVE_SESSION.reset(self._tokens.pop())
-        for state in self.bound_states.values():
-            state._bind_checkpoint(self.catalog)
-            _buffer_pending_state(self.catalog, state, reusable=True)
+        try:
+            self.wait()
+        finally:
+            if self._tokens:
+                _ACTIVE_SESSION.reset(self._tokens.pop())
+            for state in self.bound_states.values():
+                state._bind_checkpoint(self.catalog)
+                _buffer_pending_state(self.catalog, state, reusable=True)
 
     def __bool__(self) -> bool:
         return self.exists
@@ -1123,6 +1270,179 @@ def _schema_hash(state: Any) -> str:
     return sha256("|".join(parts).encode("utf-8")).hexdigest()
 
 
+class _CommitStage:
+    """Snapshot of one checkpoint commit waiting to be written to disk.
+
+    Array payloads are collected while the commit manifest is built. With
+    ``buffers`` set, each array is first copied into a host buffer that is reused
+    by later commits with the same layout, so the live state may keep changing
+    while the files are written from another thread.
+
+    Parameters
+    ----------
+    root : Path
+        Temporary commit directory the staged paths are relative to.
+    buffers : dict[str, Any] | None
+        Reusable host buffers keyed by commit-relative path. If ``None``, arrays
+        are referenced without copying and must be written before the caller
+        resumes.
+    blobs : _BlobStore | None, optional
+        Content-addressed store arrays are linked from instead of being written
+        into the commit directly, by default None.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        buffers: dict[str, Any] | None,
+        blobs: _BlobStore | None = None,
+    ) -> None:
+        self.root = root
+        self.buffers = buffers
+        self.blobs = blobs
+        self.manifest: dict[str, Any] = {}
+        self._arrays: list[tuple[Path, np.ndarray]] = []
+        self._json: list[tuple[Path, dict[str, Any]]] = []
+        self._used: set[str] = set()
+        self._events: list[torch.cuda.Event] = []
+        self._devices: set[torch.device] = set()
+
+    def add_array(self, path: Path, value: torch.Tensor | np.ndarray) -> np.ndarray:
+        """Stage an array for writing and return the host array to be saved."""
+        if self.buffers is None:
+            array = (
+                value.detach().cpu().numpy()
+                if isinstance(value, torch.Tensor)
+                else value
+            )
+            self._arrays.append((path, array))
+            return array
+
+        key = str(path.relative_to(self.root))
+        self._used.add(key)
+        buffer = self.buffers.get(key)
+        if isinstance(value, torch.Tensor):
+            value = value.detach()
+            if (
+                not isinstance(buffer, torch.Tensor)
+                or buffer.shape != value.shape
+                or buffer.dtype != value.dtype
+            ):
+                buffer = torch.empty(
+                    value.shape, dtype=value.dtype, pin_memory=value.is_cuda
+                )
+                self.buffers[key] = buffer
+            buffer.copy_(value, non_blocking=value.is_cuda)
+            if value.is_cuda:
+                self._devices.add(value.device)
+            array = buffer.numpy()
+        else:
+            if (
+                not isinstance(buffer, np.ndarray)
+                or buffer.shape != value.shape
+                or buffer.dtype != value.dtype
+            ):
+                buffer = np.empty_like(value)
+                self.buffers[key] = buffer
+            np.copyto(buffer, value)
+            array = buffer
+        self._arrays.append((path, array))
+        return array
+
+    def add_json(self, path: Path, payload: dict[str, Any]) -> None:
+        """Stage a JSON document for writing."""
+        self._json.append((path, payload))
+
+    def prune_buffers(self) -> None:
+        """Release host buffers that this commit no longer uses."""
+        if self.buffers is None:
+            return
+        for key in set(self.buffers) - self._used:
+            del self.buffers[key]
+
+    def record(self) -> None:
+        """Record completion of the pending device-to-host copies on each device."""
+        for device in self._devices:
+            event = torch.cuda.Event()
+            event.record(torch.cuda.current_stream(device))
+            self._events.append(event)
+
+    def write(self) -> None:
+        """Write the staged arrays and JSON documents under ``root``."""
+        for event in self._events:
+            event.synchronize()
+        for path, array in self._arrays:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self.blobs is not None:
+                self.blobs.link(array, path)
+            else:
+                np.save(path, array, allow_pickle=False)
+        for path, payload in self._json:
+            _write_json(path, payload)
+
+
+class _BlobStore:
+    """Content-addressed ``.npy`` store shared by the commits of one rank.
+
+    Blobs are named by a hash of the array dtype, shape and data and are
+    hard-linked into commit directories, so commits stay self-contained and a
+    blob is unreferenced once its link count drops back to one.
+
+    Parameters
+    ----------
+    root : Path
+        Blob store directory.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @staticmethod
+    def digest(array: np.ndarray) -> str:
+        """Content hash of an array."""
+        hasher = sha256(f"{array.dtype.str}|{array.shape}|".encode("utf-8"))
+        hasher.update(np.ascontiguousarray(array).reshape(-1).view(np.uint8).data)
+        return hasher.hexdigest()
+
+    def link(self, array: np.ndarray, path: Path) -> bool:
+        """Place ``array`` at ``path``, writing a blob only if it is new.
+
+        Returns
+        -------
+        bool
+            Whether a new blob was written.
+        """
+        digest = self.digest(array)
+        blob_path = self.root / digest[:2] / f"{digest}.npy"
+        written = False
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f".{blob_path.name}.{uuid.uuid4().hex}.tmp")
+            with tmp_path.open("wb") as handle:
+                np.save(handle, array, allow_pickle=False)
+            tmp_path.replace(blob_path)
+            written = True
+        try:
+            os.link(blob_path, path)
+        except OSError:
+            # File systems without hard links fall back to a private copy
+            shutil.copyfile(blob_path, path)
+        return written
+
+    def collect(self) -> None:
+        """Remove blobs that are no longer linked from any commit."""
+        if not self.root.exists():
+            return
+        for blob_path in self.root.glob("*/*.npy"):
+            try:
+                if blob_path.stat().st_nlink <= 1:
+                    blob_path.unlink()
+            except FileNotFoundError:
+                continue
+        for tmp_path in self.root.glob("*/.*.tmp"):
+            tmp_path.unlink(missing_ok=True)
+
+
 class _CheckpointCodec:
     """Codec for pickle-free checkpoint metadata and state payloads."""
 
@@ -1131,7 +1451,11 @@ class _CheckpointCodec:
 
     @classmethod
     def dump_value(
-        cls, value: Any, base_path: Path, rel_parts: tuple[str, ...]
+        cls,
+        value: Any,
+        base_path: Path,
+        rel_parts: tuple[str, ...],
+        stage: _CommitStage | None = None,
     ) -> dict[str, Any]:
         if value is None:
             return {"kind": "none"}
@@ -1165,17 +1489,16 @@ class _CheckpointCodec:
         if isinstance(value, np.dtype):
             return {"kind": "np_dtype", "value": str(value)}
         if isinstance(value, np.generic):
-            return cls.dump_value(value.item(), base_path, rel_parts)
+            return cls.dump_value(value.item(), base_path, rel_parts, stage)
         if isinstance(value, torch.Tensor):
-            array = value.detach().cpu().numpy()
-            return cls.dump_array(array, "tensor", base_path, rel_parts)
+            return cls.dump_array(value, "tensor", base_path, rel_parts, stage)
         if isinstance(value, np.ndarray):
-            return cls.dump_array(value, "ndarray", base_path, rel_parts)
+            return cls.dump_array(value, "ndarray", base_path, rel_parts, stage)
         if isinstance(value, list):
             return {
                 "kind": "list",
                 "items": [
-                    cls.dump_value(item, base_path, (*rel_parts, str(index)))
+                    cls.dump_value(item, base_path, (*rel_parts, str(index)), stage)
                     for index, item in enumerate(value)
                 ],
             }
@@ -1183,7 +1506,7 @@ class _CheckpointCodec:
             return {
                 "kind": "tuple",
                 "items": [
-                    cls.dump_value(item, base_path, (*rel_parts, str(index)))
+                    cls.dump_value(item, base_path, (*rel_parts, str(index)), stage)
                     for index, item in enumerate(value)
                 ],
             }
@@ -1198,6 +1521,7 @@ class _CheckpointCodec:
                     item,
                     base_path,
                     (*rel_parts, sha256(key.encode("utf-8")).hexdigest()[:24]),
+                    stage,
                 )
             return {"kind": "dict", "items": payload}
         if is_dataclass(value) and not isinstance(value, type):
@@ -1210,6 +1534,7 @@ class _CheckpointCodec:
                         getattr(value, field.name),
                         base_path,
                         (*rel_parts, field.name),
+                        stage,
                     )
                     for field in fields(value)
                 },
@@ -1220,10 +1545,11 @@ class _CheckpointCodec:
 
     @staticmethod
     def dump_array(
-        array: np.ndarray,
+        array: torch.Tensor | np.ndarray,
         kind: Literal["tensor", "ndarray"],
         base_path: Path,
         rel_parts: tuple[str, ...],
+        stage: _CommitStage | None = None,
     ) -> dict[str, Any]:
         if array.dtype == object:
             raise CheckpointSerializationError(
@@ -1231,8 +1557,13 @@ class _CheckpointCodec:
             )
         rel_path = Path(*rel_parts).with_suffix(".npy")
         full_path = base_path / rel_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        np.save(full_path, array, allow_pickle=False)
+        if stage is not None:
+            array = stage.add_array(full_path, array)
+        else:
+            if isinstance(array, torch.Tensor):
+                array = array.detach().cpu().numpy()
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(full_path, array, allow_pickle=False)
         return {
             "kind": kind,
             "path": str(rel_path),
@@ -1242,7 +1573,11 @@ class _CheckpointCodec:
 
     @classmethod
     def load_value(
-        cls, payload: Mapping[str, Any], base_path: Path, current_value: Any = None
+        cls,
+        payload: Mapping[str, Any],
+        base_path: Path,
+        current_value: Any = None,
+        inplace: bool = False,
     ) -> Any:
         kind = payload["kind"]
         if kind == "none":
@@ -1270,7 +1605,13 @@ class _CheckpointCodec:
         if kind == "np_dtype":
             return np.dtype(payload["value"])
         if kind in ("tensor", "ndarray"):
-            array = np.load(base_path / payload["path"], allow_pickle=False)
+            # Arrays are memory mapped and only read when copied out, either in
+            # chunks into the current value or into a new array.
+            array = np.load(
+                base_path / payload["path"],
+                mmap_mode="r" if math.prod(payload["shape"]) else None,
+                allow_pickle=False,
+            )
             if (
                 list(array.shape) != payload["shape"]
                 or str(array.dtype) != payload["dtype"]
@@ -1278,6 +1619,9 @@ class _CheckpointCodec:
                 raise CheckpointSerializationError(
                     "checkpoint array metadata does not match stored data."
                 )
+            if inplace and cls.restore_into(current_value, array):
+                return current_value
+            array = np.array(array)
             if kind == "tensor":
                 return torch.from_numpy(array)
             return array
@@ -1305,6 +1649,7 @@ class _CheckpointCodec:
                             payload["fields"][field.name],
                             base_path,
                             getattr(current_value, field.name),
+                            inplace,
                         ),
                     )
                 return current_value
@@ -1316,6 +1661,50 @@ class _CheckpointCodec:
             f"Unsupported checkpoint payload kind {kind!r}."
         )
 
+    @staticmethod
+    def restore_into(target: Any, array: np.ndarray) -> bool:
+        """Copy a stored array into ``target`` in place when layouts match.
+
+        Returns
+        -------
+        bool
+            Whether ``target`` was filled; ``False`` leaves it untouched.
+        """
+        flat_target: torch.Tensor | np.ndarray
+        if isinstance(target, torch.Tensor):
+            try:
+                dtype = torch.from_numpy(np.empty(0, dtype=array.dtype)).dtype
+            except TypeError:
+                return False
+            if (
+                tuple(target.shape) != array.shape
+                or target.dtype != dtype
+                or not target.is_contiguous()
+            ):
+                return False
+            flat_target = target.detach().view(-1)
+        elif isinstance(target, np.ndarray):
+            if (
+                target.shape != array.shape
+                or target.dtype != array.dtype
+                or not target.flags.writeable
+                or not target.flags.c_contiguous
+            ):
+                return False
+            flat_target = target.reshape(-1)
+        else:
+            return False
+
+        source = array.reshape(-1)
+        step = max(1, _RESTORE_CHUNK_BYTES // max(array.itemsize, 1))
+        for start in range(0, source.size, step):
+            chunk = np.array(source[start : start + step])
+            if isinstance(flat_target, torch.Tensor):
+                flat_target[start : start + step].copy_(torch.from_numpy(chunk))
+            else:
+                flat_target[start : start + step] = chunk
+        return True
+
     @classmethod
     def encode_json_value(cls, value: Any) -> Any:
         if value is None or isinstance(value, cls.JSON_SCALAR_TYPES):
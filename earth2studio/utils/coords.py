@@ -30,6 +30,11 @@ try:
 except ImportError:
     cp = None
 
+# Memoized nearest index plans used by map_coords, keyed on the input / output
+# coordinate array pair and device
+_NEAREST_INDEX_CACHE: OrderedDict[tuple, torch.Tensor] = OrderedDict()
+_NEAREST_INDEX_CACHE_SIZE = 64
+
 
 def handshake_dim(
     input_coords: CoordSystem,
@@ -298,15 +303,14 @@ def map_coords(
 
         if method == "nearest":
             # Method = nearest
-            c1 = np.repeat(inc[:, np.newaxis], outc.shape[0], axis=1)
-            c2 = np.repeat(outc[np.newaxis, :], inc.shape[0], axis=0)
-            c = np.abs(c1 - c2)
-
-            idx = np.argmin(c, axis=0)
-
-            x = torch.index_select(
-                x, dim, torch.tensor(idx, dtype=torch.int32, device=x.device)
-            )
+            if inc.ndim != 1 or outc.ndim != 1:
+                raise ValueError(
+                    f"Coordinate dim {key} in input or mapped coords is not "
+                    "one-dimensional; please use fetch_data or prep_data_array to "
+                    "regrid/interpolate first."
+                )
+            idx = _cached_nearest_index(inc, outc, x.device)
+            x = torch.index_select(x, dim, idx)
             mapped_coords[key] = outc
             continue
         else:
@@ -318,6 +322,82 @@ def map_coords(
     return x, mapped_coords
 
 
+def _nearest_index(inc: np.ndarray, outc: np.ndarray) -> np.ndarray:
+    """Index of the nearest input coordinate for each output coordinate using a
+    sorted search, O((N + M) log N) instead of a dense N x M distance matrix. Ties are
+    resolved like `np.argmin` over the input, i.e. the lowest input index wins.
+
+    Parameters
+    ----------
+    inc : np.ndarray
+        1D numeric input coordinate
+    outc : np.ndarray
+        1D numeric output coordinate
+
+    Returns
+    -------
+    np.ndarray
+        Indices into inc of shape [len(outc)]
+    """
+    order = np.argsort(inc, kind="stable")
+    sorted_inc = inc[order].astype(np.float64)
+    outc = outc.astype(np.float64)
+    n = sorted_inc.shape[0]
+
+    right = np.clip(np.searchsorted(sorted_inc, outc, side="left"), 0, n - 1)
+    left = np.clip(right - 1, 0, n - 1)
+    # First occurrence of duplicated values has the lowest input index (stable sort)
+    left = np.searchsorted(sorted_inc, sorted_inc[left], side="left")
+
+    left_dist = np.abs(outc - sorted_inc[left])
+    right_dist = np.abs(sorted_inc[right] - outc)
+    use_left = (left_dist < right_dist) | (
+        (left_dist == right_dist) & (order[left] < order[right])
+    )
+    return np.where(use_left, order[left], order[right])
+
+
+def _cached_nearest_index(
+    inc: np.ndarray, outc: np.ndarray, device: torch.device
+) -> torch.Tensor:
+    """Memoized nearest index plan for map_coords. Repeated calls with identical
+    coordinate arrays return the same device index tensor.
+
+    Parameters
+    ----------
+    inc : np.ndarray
+        1D numeric input coordinate
+    outc : np.ndarray
+        1D numeric output coordinate
+    device : torch.device
+        Device of the index tensor
+
+    Returns
+    -------
+    torch.Tensor
+        Index tensor for `torch.index_select`
+    """
+    key = (
+        str(device),
+        inc.dtype.str,
+        inc.shape,
+        inc.tobytes(),
+        outc.dtype.str,
+        outc.shape,
+        outc.tobytes(),
+    )
+    idx = _NEAREST_INDEX_CACHE.get(key)
+    if idx is not None:
+        _NEAREST_INDEX_CACHE.move_to_end(key)
+        return idx
+
+    idx = torch.tensor(_nearest_index(inc, outc), dtype=torch.int32, device=device)
+    _NEAREST_INDEX_CACHE[key] = idx
+    if len(_NEAREST_INDEX_CACHE) > _NEAREST_INDEX_CACHE_SIZE:
+        _NEAREST_INDEX_CACHE.popitem(last=False)
+    return idx
+
+
 def map_coords_xr(
     x: xr.DataArray,
     output_coords: CoordSystem,
@@ -13,6 +13,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import importlib
 import inspect
 import re
 import sys
@@ -186,6 +187,54 @@ def check_optional_dependencies(
     return _decorator
 
 
+def lazy_import_attributes(
+    package: str, registry: dict[str, list[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module level `__getattr__` and `__dir__` functions that import the
+    public objects of a package on first access instead of at package import. This
+    keeps importing a package such as `earth2studio.models.px` cheap when only one of
+    its members, and its optional dependencies, is used.
+
+    Parameters
+    ----------
+    package : str
+        Fully qualified name of the package, typically `__name__`
+    registry : dict[str, list[str]]
+        Relative submodule name (e.g. ".sfno") to the object names it provides
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        Module `__getattr__` and `__dir__` functions
+
+    Example
+    -------
+    >>> __getattr__, __dir__ = lazy_import_attributes(
+    ...     __name__, {".sfno": ["SFNO"]}
+    ... )
+    """
+    lookup = {name: module for module, names in registry.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if name in lookup:
+            value = getattr(importlib.import_module(lookup[name], package), name)
+            # Cache on the package so later lookups skip __getattr__
+            setattr(sys.modules[package], name, value)
+            return value
+        # Submodule attribute access, e.g. earth2studio.data.gfs
+        try:
+            return importlib.import_module(f"{package}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{package}.{name}":
+                raise
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(lookup))
+
+    return __getattr__, __dir__
+
+
 def _find_pyproject_toml() -> Path:
     """Locate pyproject.toml relative to this module.
 
@@ -14,8 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
 import numpy as np
 import torch
+from loguru import logger
 from numpy.typing import ArrayLike
 from torch import Tensor, nn
 
@@ -39,6 +45,11 @@ except ImportError:
     haversine_distance = None
     KDTree = None
 
+# In-process LRU of LatLonInterpolation index maps keyed on the grid content hash
+_INDEX_MAP_CACHE: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+_INDEX_MAP_CACHE_SIZE = 8
+_INDEX_MAP_CACHE_VERSION = "v1"
+
 
 def latlon_interpolation_regular(
     values: torch.Tensor,
@@ -141,6 +152,10 @@ class LatLonInterpolation(nn.Module):
         Tensor [H_out, W_out] of output latitude coordinates
     lon_out : torch.Tensor | ArrayLike
         Tensor [H_out, W_out] of output longitude coordinates
+    cache : bool, optional
+        Reuse index maps previously computed for the same input and output grids,
+        from an in-process LRU and from files stored under the data source cache
+        root. Skips the triangulation entirely on a cache hit, by default True
     """
 
     def __init__(
@@ -149,6 +164,7 @@ class LatLonInterpolation(nn.Module):
         lon_in: torch.Tensor | ArrayLike,
         lat_out: torch.Tensor | ArrayLike,
         lon_out: torch.Tensor | ArrayLike,
+        cache: bool = True,
     ):
         super().__init__()
 
@@ -165,18 +181,13 @@ class LatLonInterpolation(nn.Module):
             lon_out.cpu().numpy() if isinstance(lon_out, Tensor) else np.array(lon_out)
         )
 
-        (i_in, j_in) = np.mgrid[: lat_in.shape[0], : lat_in.shape[1]]
-
-        in_points = np.stack((lat_in.ravel(), lon_in.ravel()), axis=-1)
-        i_interp = LinearNDInterpolator(in_points, i_in.ravel())
-        j_interp = LinearNDInterpolator(in_points, j_in.ravel())
+        if cache:
+            i_map, j_map = _cached_index_maps(lat_in, lon_in, lat_out, lon_out)
+        else:
+            i_map, j_map = _compute_index_maps(lat_in, lon_in, lat_out, lon_out)
 
-        out_points = np.stack((lat_out.ravel(), lon_out.ravel()), axis=-1)
-        i_map = i_interp(out_points).reshape(lat_out.shape)
-        j_map = j_interp(out_points).reshape(lat_out.shape)
-
-        i_map = torch.Tensor(i_map)
-        j_map = torch.Tensor(j_map)
+        i_map = torch.tensor(i_map, dtype=torch.float32)
+        j_map = torch.tensor(j_map, dtype=torch.float32)
 
         self.register_buffer("i_map", i_map)
         self.register_buffer("j_map", j_map)
@@ -214,6 +225,268 @@ class LatLonInterpolation(nn.Module):
         return torch.lerp(f0, f1, i - i0)
 
 
+class RegularGridInterpolation(nn.Module):
+    """Linear or nearest neighbor interpolation from a regular (rectilinear) lat/lon
+    grid onto arbitrary output points using precomputed sparse weights.
+
+    The interpolation is stored as a gather index and weight tensor with a fixed
+    number of source points per output point (4 for linear, 1 for nearest). All
+    leading dimensions of the input, e.g. a stacked [T*L*V, H_in, W_in] tensor, are
+    interpolated in a single batched gather on the device of the module. Results
+    match `xarray.DataArray.interp`, output points outside of the input grid are
+    NaN.
+
+    Parameters
+    ----------
+    lat_in : torch.Tensor | ArrayLike
+        Vector [H_in, ] of input latitude coordinates, increasing or decreasing
+    lon_in : torch.Tensor | ArrayLike
+        Vector [W_in, ] of input longitude coordinates, increasing or decreasing
+    lat_out : torch.Tensor | ArrayLike
+        Tensor [H_out, W_out] of output latitude coordinates
+    lon_out : torch.Tensor | ArrayLike
+        Tensor [H_out, W_out] of output longitude coordinates
+    method : str, optional
+        Interpolation method, "linear" or "nearest", by default "linear"
+    """
+
+    METHODS = ["linear", "nearest"]
+
+    def __init__(
+        self,
+        lat_in: torch.Tensor | ArrayLike,
+        lon_in: torch.Tensor | ArrayLike,
+        lat_out: torch.Tensor | ArrayLike,
+        lon_out: torch.Tensor | ArrayLike,
+        method: str = "linear",
+    ):
+        super().__init__()
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Interpolation method {method} not supported, "
+                f"use one of {self.METHODS}"
+            )
+
+        lat_in, lon_in, lat_out, lon_out = (
+            x.cpu().numpy() if isinstance(x, Tensor) else np.asarray(x)
+            for x in (lat_in, lon_in, lat_out, lon_out)
+        )
+        if lat_in.ndim != 1 or lon_in.ndim != 1:
+            raise ValueError("Input latitude and longitude must be 1D vectors")
+        if lat_out.shape != lon_out.shape:
+            raise ValueError("Output latitude and longitude must have the same shape")
+        self.out_shape = lat_out.shape
+
+        # Separable weights along each axis, combined into flat source indices
+        n_lon = lon_in.shape[0]
+        lat_index, lat_weight, lat_valid = _axis_weights(
+            lat_in, lat_out.ravel(), method
+        )
+        lon_index, lon_weight, lon_valid = _axis_weights(
+            lon_in, lon_out.ravel(), method
+        )
+        index = (lat_index[:, :, None] * n_lon + lon_index[:, None, :]).reshape(
+            lat_index.shape[0], -1
+        )
+        weights = (lat_weight[:, :, None] * lon_weight[:, None, :]).reshape(
+            lat_index.shape[0], -1
+        )
+
+        self.register_buffer("index", torch.tensor(index, dtype=torch.int64))
+        self.register_buffer("weights", torch.tensor(weights, dtype=torch.float32))
+        self.register_buffer("valid", torch.tensor(lat_valid & lon_valid))
+
+    @torch.inference_mode()
+    def forward(self, values: Tensor) -> Tensor:
+        """Perform interpolation for values.
+
+        Parameters
+        ----------
+        values : torch.Tensor
+            Input values of shape [..., H_in, W_in] defined over (lat_in, lon_in)
+            that will be interpolated onto (lat_out, lon_out) grid.
+
+        Returns
+        -------
+        result : torch.Tensor
+            Tensor of shape [..., H_out, W_out] of interpolated values.
+        """
+        values = values.reshape(*values.shape[:-2], -1)
+        weights = self.weights.to(dtype=values.dtype)
+        result = values[..., self.index[:, 0]] * weights[:, 0]
+        for k in range(1, self.index.shape[1]):
+            result += values[..., self.index[:, k]] * weights[:, k]
+        result = torch.where(self.valid, result, torch.nan)
+        return result.reshape(*result.shape[:-1], *self.out_shape)
+
+
+def _axis_weights(
+    coord_in: np.ndarray, coord_out: np.ndarray, method: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Interpolation indices and weights along a single axis of a regular grid
+
+    Parameters
+    ----------
+    coord_in : np.ndarray
+        Input coordinate vector, increasing or decreasing
+    coord_out : np.ndarray
+        Flat array of output coordinates
+    method : str
+        Interpolation method, "linear" or "nearest"
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Indices [N, K] into coord_in, weights [N, K] and validity mask [N] of
+        output coordinates inside the input range
+    """
+    order = np.argsort(coord_in, kind="stable")
+    coord = coord_in[order].astype(np.float64)
+    coord_out = coord_out.astype(np.float64)
+    valid = (coord_out >= coord[0]) & (coord_out <= coord[-1])
+
+    if method == "nearest" or coord.shape[0] == 1:
+        # Ties at the mid-point resolve to the lower coordinate like scipy
+        pos = np.searchsorted(0.5 * (coord[1:] + coord[:-1]), coord_out, side="left")
+        return order[pos][:, None], np.ones((coord_out.shape[0], 1)), valid
+
+    pos = np.clip(np.searchsorted(coord, coord_out, side="right") - 1, 0, None)
+    pos = np.minimum(pos, coord.shape[0] - 2)
+    x0 = coord[pos]
+    x1 = coord[pos + 1]
+    w = np.where(valid, (coord_out - x0) / (x1 - x0), 0.0)
+    index = np.stack((order[pos], order[pos + 1]), axis=-1)
+    weights = np.stack((1.0 - w, w), axis=-1)
+    return index, weights, valid
+
+
+def _compute_index_maps(
+    lat_in: np.ndarray,
+    lon_in: np.ndarray,
+    lat_out: np.ndarray,
+    lon_out: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute fractional input grid indices of each output grid point using a
+    linear interpolation over the Delaunay triangulation of the input grid
+
+    Parameters
+    ----------
+    lat_in : np.ndarray
+        Array [H_in, W_in] of input latitude coordinates
+    lon_in : np.ndarray
+        Array [H_in, W_in] of input longitude coordinates
+    lat_out : np.ndarray
+        Array [H_out, W_out] of output latitude coordinates
+    lon_out : np.ndarray
+        Array [H_out, W_out] of output longitude coordinates
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Row (i) and column (j) index maps of shape [H_out, W_out]
+    """
+    (i_in, j_in) = np.mgrid[: lat_in.shape[0], : lat_in.shape[1]]
+
+    in_points = np.stack((lat_in.ravel(), lon_in.ravel()), axis=-1)
+    # Both index maps share a single triangulation of the input points
+    ij_in = np.stack((i_in.ravel(), j_in.ravel()), axis=-1)
+    interp = LinearNDInterpolator(in_points, ij_in)
+
+    out_points = np.stack((lat_out.ravel(), lon_out.ravel()), axis=-1)
+    ij_map = interp(out_points)
+    i_map = ij_map[:, 0].reshape(lat_out.shape).astype(np.float32)
+    j_map = ij_map[:, 1].reshape(lat_out.shape).astype(np.float32)
+    return i_map, j_map
+
+
+def _index_map_key(*grids: np.ndarray) -> str:
+    """Content hash of the input and output grids used as index map cache key
+
+    Parameters
+    ----------
+    *grids : np.ndarray
+        Coordinate arrays defining the interpolation
+
+    Returns
+    -------
+    str
+        Hex digest identifying the grids
+    """
+    digest = hashlib.sha256(_INDEX_MAP_CACHE_VERSION.encode())
+    for grid in grids:
+        grid = np.ascontiguousarray(grid, dtype=np.float64)
+        digest.update(str(grid.shape).encode())
+        digest.update(grid.tobytes())
+    return digest.hexdigest()
+
+
+def _cached_index_maps(
+    lat_in: np.ndarray,
+    lon_in: np.ndarray,
+    lat_out: np.ndarray,
+    lon_out: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Index maps of LatLonInterpolation looked up from the in-process LRU, then
+    the on-disk cache, before being computed and stored in both
+
+    Parameters
+    ----------
+    lat_in : np.ndarray
+        Array [H_in, W_in] of input latitude coordinates
+    lon_in : np.ndarray
+        Array [H_in, W_in] of input longitude coordinates
+    lat_out : np.ndarray
+        Array [H_out, W_out] of output latitude coordinates
+    lon_out : np.ndarray
+        Array [H_out, W_out] of output longitude coordinates
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Row (i) and column (j) index maps of shape [H_out, W_out]
+    """
+    # Avoid circular import, data utilities depend on this module
+    from earth2studio.data.utils import datasource_cache_root
+
+    key = _index_map_key(lat_in, lon_in, lat_out, lon_out)
+    if key in _INDEX_MAP_CACHE:
+        _INDEX_MAP_CACHE.move_to_end(key)
+        return _INDEX_MAP_CACHE[key]
+
+    cache_path = os.path.join(datasource_cache_root(), "interp", f"latlon_{key}.npz")
+    maps = None
+    if os.path.isfile(cache_path):
+        try:
+            with np.load(cache_path) as data:
+                maps = (data["i_map"], data["j_map"])
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to read cached index maps {cache_path}: {e}")
+
+    if maps is None:
+        maps = _compute_index_maps(lat_in, lon_in, lat_out, lon_out)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see
+            # a partially written cache entry
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".npz", dir=os.path.dirname(cache_path)
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, i_map=maps[0], j_map=maps[1])
+                os.replace(tmp_path, cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache index maps to {cache_path}: {e}")
+
+    _INDEX_MAP_CACHE[key] = maps
+    while len(_INDEX_MAP_CACHE) > _INDEX_MAP_CACHE_SIZE:
+        _INDEX_MAP_CACHE.popitem(last=False)
+    return maps
+
+
 @check_optional_dependencies()
 class NearestNeighborInterpolator(nn.Module):
     """Nearest-neighbor interpolation between arbitrary lat/lon grids.
@@ -14,10 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import weakref
+from collections import OrderedDict
 from contextlib import nullcontext
 from datetime import datetime
 from functools import reduce
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -49,6 +51,186 @@ except ImportError:
         LinearNDInterpolator = None
 
 
+# Sort permutations of recently used frames, keyed by (id(frame), time column),
+# holding a weak reference to the frame and the address of its time values
+_TimeOrderEntry = tuple[Any, int, np.ndarray | None]
+_TIME_ORDER_CACHE: OrderedDict[tuple[int, str], _TimeOrderEntry] = OrderedDict()
+_TIME_ORDER_CACHE_SIZE = 8
+
+
+def _request_times_ns(
+    request_time: np.datetime64 | datetime | str | TimeArray,
+) -> np.ndarray:
+    """Request time(s) as a datetime64[ns] array"""
+    if isinstance(request_time, np.ndarray) and request_time.ndim >= 1:
+        return request_time.astype("datetime64[ns]")
+    return np.array([np.datetime64(request_time, "ns")])
+
+
+def _ensure_time_column(df: pd.DataFrame, time_column: str) -> pd.DataFrame:
+    """Check the time column exists and is datetime64[ns], converting a copy of the
+    frame if needed"""
+    if time_column not in df.columns:
+        raise KeyError(
+            f"Time column '{time_column}' not found in DataFrame. "
+            f"Available columns: {list(df.columns)}"
+        )
+
+    time_series = df[time_column]
+    if time_series.dtype != "datetime64[ns]":
+        df = df.copy()
+        # Use cudf methods if it's a cudf DataFrame, otherwise use pandas
+        if cudf is not None and isinstance(df, cudf.DataFrame):
+            df[time_column] = cudf.to_datetime(time_series).astype("datetime64[ns]")
+        else:
+            df[time_column] = pd.to_datetime(time_series).astype("datetime64[ns]")
+    return df
+
+
+def _sorted_time_values(
+    df: pd.DataFrame, time_column: str
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Sorted time values of a frame in integer nanoseconds together with the sort
+    permutation, which is None if the column is already sorted. Permutations are
+    cached per frame and revalidated on use.
+    """
+    values = df[time_column].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    key = (id(df), time_column)
+    pointer = values.__array_interface__["data"][0]
+
+    cached = _TIME_ORDER_CACHE.get(key)
+    if cached is not None and cached[0]() is df and cached[1] == pointer:
+        order = cached[2]
+        sorted_values = values if order is None else values[order]
+        # Guard against in place modification of the time column
+        if len(sorted_values) == len(values) and np.all(
+            sorted_values[:-1] <= sorted_values[1:]
+        ):
+            _TIME_ORDER_CACHE.move_to_end(key)
+            return sorted_values, order
+
+    if np.all(values[:-1] <= values[1:]):
+        order, sorted_values = None, values
+    else:
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+    try:
+        _TIME_ORDER_CACHE[key] = (weakref.ref(df), pointer, order)
+    except TypeError:
+        return sorted_values, order
+    _TIME_ORDER_CACHE.move_to_end(key)
+    while len(_TIME_ORDER_CACHE) > _TIME_ORDER_CACHE_SIZE:
+        _TIME_ORDER_CACHE.popitem(last=False)
+    return sorted_values, order
+
+
+def merge_time_windows(
+    request_time: np.datetime64 | datetime | str | TimeArray,
+    tolerance: tuple[np.timedelta64, np.timedelta64],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge the tolerance windows of request times into disjoint intervals.
+
+    Parameters
+    ----------
+    request_time : np.datetime64 | datetime | str | TimeArray
+        Reference time(s) of the windows
+    tolerance : tuple[np.timedelta64, np.timedelta64]
+        Tuple of (lower_bound, upper_bound) time deltas defining the tolerance window.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Sorted start and end times (datetime64[ns]) of the merged closed intervals
+    """
+    times_ns = _request_times_ns(request_time)
+    lower_bound, upper_bound = tolerance
+    starts = np.sort(times_ns + lower_bound)
+    ends = np.maximum.accumulate(np.sort(times_ns) + upper_bound)
+    # An interval starts wherever a window begins after all previous windows ended
+    new = np.ones(len(starts), dtype=bool)
+    new[1:] = starts[1:] > ends[:-1]
+    last = np.append(np.flatnonzero(new)[1:] - 1, len(starts) - 1)
+    return starts[new], ends[last]
+
+
+def time_window_rows(
+    df: pd.DataFrame,
+    request_time: np.datetime64 | datetime | str | TimeArray,
+    tolerance: tuple[np.timedelta64, np.timedelta64],
+    time_column: str = "time",
+) -> list[np.ndarray]:
+    """Row positions of a DataFrame falling within the tolerance window of each
+    request time.
+
+    Rows are located with binary searches over the sorted time column, so the cost
+    is a single sort of the frame (cached and skipped for sorted frames) plus the
+    size of the output, rather than a full mask per request time.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Pandas DataFrame to select rows from
+    request_time : np.datetime64 | datetime | str | TimeArray
+        Reference time(s) of the windows
+    tolerance : tuple[np.timedelta64, np.timedelta64]
+        Tuple of (lower_bound, upper_bound) time deltas defining the tolerance window.
+    time_column : str, optional
+        Name of the time column in the DataFrame, by default "time"
+
+    Returns
+    -------
+    list[np.ndarray]
+        Sorted integer row positions of each request time, usable with ``df.iloc``
+    """
+    df = _ensure_time_column(df, time_column)
+    sorted_values, order = _sorted_time_values(df, time_column)
+    times_ns = _request_times_ns(request_time)
+    lower_bound, upper_bound = tolerance
+    lo = np.searchsorted(
+        sorted_values, (times_ns + lower_bound).view(np.int64), side="left"
+    )
+    hi = np.searchsorted(
+        sorted_values, (times_ns + upper_bound).view(np.int64), side="right"
+    )
+    if order is None:
+        return [np.arange(a, b) for a, b in zip(lo, hi)]
+    return [np.sort(order[a:b]) for a, b in zip(lo, hi)]
+
+
+def partition_time_range(
+    df: pd.DataFrame,
+    request_time: np.datetime64 | datetime | str | TimeArray,
+    tolerance: tuple[np.timedelta64, np.timedelta64],
+    time_column: str = "time",
+) -> list[pd.DataFrame]:
+    """Split a DataFrame into the rows within the tolerance window of each request
+    time, equivalent to calling :func:`filter_time_range` for every time but in a
+    single pass over the frame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame | cudf.DataFrame
+        DataFrame to partition. Can be pandas or cudf DataFrame.
+    request_time : np.datetime64 | datetime | str | TimeArray
+        Reference time(s) of the windows
+    tolerance : tuple[np.timedelta64, np.timedelta64]
+        Tuple of (lower_bound, upper_bound) time deltas defining the tolerance window.
+    time_column : str, optional
+        Name of the time column in the DataFrame, by default "time"
+
+    Returns
+    -------
+    list[pd.DataFrame | cudf.DataFrame]
+        DataFrame of each request time, rows keep their original order
+    """
+    times_ns = _request_times_ns(request_time)
+    if cudf is not None and isinstance(df, cudf.DataFrame):
+        return [filter_time_range(df, t, tolerance, time_column) for t in times_ns]
+    df = _ensure_time_column(df, time_column)
+    rows = time_window_rows(df, times_ns, tolerance, time_column)
+    return [df.iloc[r] for r in rows]
+
+
 def filter_time_range(
     df: pd.DataFrame,
     request_time: np.datetime64 | datetime | str | TimeArray,
@@ -60,7 +242,9 @@ def filter_time_range(
     Filters the DataFrame to include only rows where the time column value is within
     [request_time + lower_bound, request_time + upper_bound]. When *request_time* is a
     :class:`~numpy.ndarray` of datetime64 values, a row is kept if it falls within the
-    tolerance window of **any** of the provided times.
+    tolerance window of **any** of the provided times. Overlapping windows are merged
+    first and, for pandas DataFrames, rows are located with binary searches over the
+    sorted time column.
 
     Parameters
     ----------
@@ -86,34 +270,26 @@ def filter_time_range(
     KeyError
         If the time_column is not present in the DataFrame
     """
-    if time_column not in df.columns:
-        raise KeyError(
-            f"Time column '{time_column}' not found in DataFrame. "
-            f"Available columns: {list(df.columns)}"
-        )
-
-    # Ensure time column is datetime64[ns]
-    time_series = df[time_column]
-    if time_series.dtype != "datetime64[ns]":
-        df = df.copy()
-        # Use cudf methods if it's a cudf DataFrame, otherwise use pandas
-        if cudf is not None and isinstance(df, cudf.DataFrame):
-            df[time_column] = cudf.to_datetime(time_series).astype("datetime64[ns]")
+    df = _ensure_time_column(df, time_column)
+    starts, ends = merge_time_windows(request_time, tolerance)
+
+    if cudf is not None and isinstance(df, cudf.DataFrame):
+        masks = [
+            (df[time_column] >= start) & (df[time_column] <= end)
+            for start, end in zip(starts, ends)
+        ]
+        return df[reduce(lambda a, b: a | b, masks)]
+
+    sorted_values, order = _sorted_time_values(df, time_column)
+    lo = np.searchsorted(sorted_values, starts.view(np.int64), side="left")
+    hi = np.searchsorted(sorted_values, ends.view(np.int64), side="right")
+    mask = np.zeros(len(df), dtype=bool)
+    for a, b in zip(lo, hi):
+        if order is None:
+            mask[a:b] = True
         else:
-            df[time_column] = pd.to_datetime(time_series).astype("datetime64[ns]")
-    # Ensure request_time is datetime64[ns] array
-    if isinstance(request_time, np.ndarray) and request_time.ndim >= 1:
-        times_ns = request_time.astype("datetime64[ns]")
-    else:
-        times_ns = np.array([np.datetime64(request_time, "ns")])
-
-    lower_bound, upper_bound = tolerance
-    masks = [
-        (df[time_column] >= t + lower_bound) & (df[time_column] <= t + upper_bound)
-        for t in times_ns
-    ]
-    time_mask = reduce(lambda a, b: a | b, masks)
-    return df[time_mask]
+            mask[order[a:b]] = True
+    return df[mask]
 
 
 @check_optional_dependencies("linear")
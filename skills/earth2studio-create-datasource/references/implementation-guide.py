@@ -481,8 +481,10 @@ class SourceName:
 # ===========================================================================
 #
 # 1. earth2studio/data/__init__.py
-#    Add in alphabetical order:
+#    Add in alphabetical order to the TYPE_CHECKING block:
 #      from .source_name import SourceName
+#    and to the lazy import registry:
+#      ".source_name": ["SourceName"],
 #
 # 2. earth2studio/lexicon/__init__.py
 #    Add in alphabetical order:
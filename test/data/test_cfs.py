@@ -24,6 +24,7 @@ import numpy as np
 import pytest
 
 from earth2studio.data import CFS_FX, CFS_FX_Flux
+from earth2studio.data.cfs import CFSAsyncTask
 
 # Recent AWS-archived cycle used by the slow fetch tests.  Picked to be well
 # inside the 2023-04-22+ AWS history bound and well outside the NOMADS rolling
@@ -291,6 +292,7 @@ def test_cfs_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch(
             "earth2studio.data.cfs._decode_cfs_grib",
             return_value=fake_grid,
@@ -332,6 +334,7 @@ def test_cfs_nomads_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.cfs._decode_cfs_grib", return_value=fake_grid),
     ):
         # Bypass real store by stubbing it to a truthy sentinel.
@@ -367,6 +370,7 @@ def test_cfs_flux_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch(
             "earth2studio.data.cfs._decode_cfs_grib",
             return_value=fake_grid,
@@ -408,6 +412,7 @@ def test_cfs_missing_variable_returns_nan(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.cfs._decode_cfs_grib", return_value=fake_grid),
     ):
         ds.store = object()  # type: ignore[assignment]
@@ -418,6 +423,30 @@ def test_cfs_missing_variable_returns_nan(tmp_path, monkeypatch):
     assert np.isnan(data.sel(variable="z500").values).all()
 
 
+def test_cfs_prefetch_coalesced(tmp_path, monkeypatch):
+    # Vector siblings share one byte range, which is prefetched only once
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path))
+    ds = CFS_FX(source="aws", cache=True)
+    ds.store = object()  # type: ignore[assignment]
+
+    tasks = [
+        CFSAsyncTask((0, 0, k), "noaa-cfs-pds/a", offset, length, submsg, lambda x: x)
+        for k, (offset, length, submsg) in enumerate(
+            [(0, 100, 1), (0, 100, 2), (100, 50, 1), (150, -1, 1)]
+        )
+    ]
+    fetch = AsyncMock(return_value=[])
+    with patch("earth2studio.data.cfs.obstore_fetch_ranges_to_cache", new=fetch):
+        asyncio.run(ds._prefetch_tasks(tasks))
+
+    fetch.assert_awaited_once()
+    assert fetch.await_args.args[1] == "a"
+    assert fetch.await_args.args[3] == [(0, 100), (100, 50)]
+    assert fetch.await_args.kwargs["cache_keys"][1] == (
+        hashlib.sha256(("noaa-cfs-pds/a" + "100").encode()).hexdigest()
+    )
+
+
 @pytest.mark.timeout(10)
 def test_cfs_fetch_remote_file_obstore_routing(tmp_path, monkeypatch):
     # The obstore path must strip the bucket prefix to a store-relative key
@@ -37,18 +37,27 @@ from earth2studio.data import (
     prep_data_array,
 )
 from earth2studio.data.utils import (
+    CacheManager,
     async_retry,
+    cached_grib_index,
     cancellable_to_thread,
+    coalesce_byte_ranges,
+    configure_grib_decode_pool,
     datasource_cache_root,
     ensure_utc,
     gather_with_concurrency,
     managed_session,
+    obstore_fetch_ranges_to_cache,
     obstore_fetch_to_cache,
     obstore_read_range,
     obstore_store_from_url,
     obstore_zarr_store,
+    plan_partition_fetches,
     prep_data_inputs,
     prep_forecast_inputs,
+    run_grib_decode,
+    sort_by_time,
+    time_window_slice,
 )
 
 
@@ -202,6 +211,50 @@ def test_fetch_data(time, lead_time, device):
     assert not torch.isnan(x).any()
 
 
+def test_fetch_data_deduplicated_request():
+    class CountingSource:
+        def __init__(self):
+            self.requests = []
+
+        def __call__(self, time, variable):
+            time = np.asarray(time, dtype="datetime64[ns]")
+            self.requests.append(time)
+            hours = (time - np.datetime64("2000-01-01", "ns")) / np.timedelta64(1, "h")
+            data = np.broadcast_to(
+                hours[:, None, None, None], (len(time), len(variable), 2, 3)
+            )
+            return xr.DataArray(
+                data=data.copy(),
+                dims=["time", "variable", "lat", "lon"],
+                coords={
+                    "time": time,
+                    "variable": variable,
+                    "lat": np.arange(2),
+                    "lon": np.arange(3),
+                },
+            )
+
+    source = CountingSource()
+    time = np.array(
+        [np.datetime64("2000-01-01T06:00"), np.datetime64("2000-01-01T00:00")]
+    )
+    lead_time = np.array([np.timedelta64(0, "h"), np.timedelta64(6, "h")])
+    variable = np.array(["a", "b"])
+
+    x, coords = fetch_data(source, time, variable, lead_time)
+
+    # Overlapping valid times are requested once in a single call
+    assert len(source.requests) == 1
+    assert len(source.requests[0]) == 3
+    assert x.shape == (2, 2, 2, 2, 3)
+    assert list(coords) == ["time", "lead_time", "variable", "lat", "lon"]
+    assert np.all(coords["time"] == time)
+    assert np.all(coords["lead_time"] == lead_time)
+    expected = torch.tensor([[6.0, 12.0], [0.0, 6.0]], dtype=x.dtype)
+    assert torch.equal(x[:, :, 0, 0, 0], expected)
+    assert torch.equal(x[:, :, 1, 1, 2], expected)
+
+
 @pytest.mark.parametrize(
     "device",
     [
@@ -314,6 +367,25 @@ def test_fetch_dataframe(time, lead_time, device):
     assert not df.isnull().any().any()
 
 
+@pytest.mark.parametrize("interp_method", ["linear", "nearest"])
+def test_prep_data_array_regular(equilinear_data_array, interp_method):
+    pytest.importorskip("scipy", reason="scipy not installed")
+    target_coords = OrderedDict(
+        {"_lat": np.linspace(-60, 60, 17), "_lon": np.linspace(10, 150, 31)}
+    )
+    out, coords = prep_data_array(
+        equilinear_data_array, interp_to=target_coords, interp_method=interp_method
+    )
+    expected = equilinear_data_array.interp(
+        lat=xr.DataArray(target_coords["_lat"], dims=["_lat"]),
+        lon=xr.DataArray(target_coords["_lon"], dims=["_lon"]),
+        method=interp_method,
+    )
+    assert out.shape == (2, 1, 17, 31)
+    assert np.array_equal(coords["_lat"], target_coords["_lat"])
+    assert np.allclose(out.numpy(), expected.values, atol=1e-6)
+
+
 @pytest.mark.parametrize(
     "time",
     [
@@ -498,6 +570,102 @@ def test_datasource_to_file(time, lead_time, backend, tmp_path):
     assert not torch.isnan(x).any()
 
 
+@pytest.mark.parametrize(
+    "fetch_chunks,max_workers",
+    [({"time": 1}, 1), ({"time": 2, "variable": 1}, 3)],
+)
+def test_datasource_to_file_streaming(fetch_chunks, max_workers, tmp_path):
+    time = np.datetime64("2001-06-04T00:00") + np.arange(5) * np.timedelta64(6, "h")
+    variable = np.array(["a", "b", "c"])
+    domain = OrderedDict({"lat": np.random.randn(16), "lon": np.random.randn(32)})
+    ds = Random(domain)
+
+    calls = []
+
+    class FlakySource:
+        def __init__(self, fail_on=None):
+            self.fail_on = fail_on
+
+        def __call__(self, time, variable):
+            if np.datetime64(time[0]) == self.fail_on:
+                raise OSError("Fetch failed")
+            calls.append(np.datetime64(time[0]))
+            da = ds(time, variable)
+            # Deterministic values to check chunks land in the right region
+            hours = (time - np.datetime64("2001-06-04T00:00")) // np.timedelta64(1, "h")
+            codes = np.array(["abc".index(v) for v in variable])
+            da[:] = hours[:, None, None, None] * 10 + codes[None, :, None, None]
+            return da
+
+    file_name = str(tmp_path / "temp.zarr")
+    # Interrupted run leaves a manifest of completed chunks
+    with pytest.raises(OSError):
+        datasource_to_file(
+            file_name,
+            FlakySource(fail_on=time[-1]),
+            time=time,
+            variable=variable,
+            backend="zarr",
+            fetch_chunks=fetch_chunks,
+            max_workers=1,
+        )
+    n_time = -(-len(time) // fetch_chunks["time"])
+    n_variable = -(-len(variable) // fetch_chunks.get("variable", len(variable)))
+    assert os.path.exists(file_name + ".manifest.json")
+    assert len(calls) == (n_time - 1) * n_variable
+
+    # Resumed run only fetches the remaining chunks
+    calls.clear()
+    datasource_to_file(
+        file_name,
+        FlakySource(),
+        time=time,
+        variable=variable,
+        backend="zarr",
+        fetch_chunks=fetch_chunks,
+        max_workers=max_workers,
+    )
+    assert len(calls) == n_variable
+    assert all(t == time[-1] for t in calls)
+
+    da = xr.open_dataarray(file_name, engine="zarr")
+    assert np.all(da.coords["time"].values == time)
+    assert np.all(da.coords["variable"].values == variable)
+    assert np.all(da.coords["lat"].values == domain["lat"])
+    hours = np.arange(len(time)) * 6
+    expected = hours[:, None] * 10 + np.arange(len(variable))[None, :]
+    assert np.all(da.values == expected[:, :, None, None])
+
+    # Mismatched inputs cannot resume from the manifest
+    with pytest.raises(ValueError):
+        datasource_to_file(
+            file_name,
+            FlakySource(),
+            time=time[:2],
+            variable=variable,
+            backend="zarr",
+            fetch_chunks=fetch_chunks,
+        )
+    with pytest.raises(ValueError):
+        datasource_to_file(
+            str(tmp_path / "temp.nc"),
+            ds,
+            time=time,
+            variable=variable,
+            fetch_chunks=fetch_chunks,
+        )
+    with pytest.raises(ValueError):
+        datasource_to_file(
+            str(tmp_path / "misaligned.zarr"),
+            ds,
+            time=time,
+            variable=variable,
+            backend="zarr",
+            chunks={"time": 4},
+            fetch_chunks={"time": 2},
+        )
+
+
 def test_datasource_cache(tmp_path, monkeypatch):
 
     # Test with data-specific cache environment variable
@@ -636,6 +804,49 @@ def test_prep_data_inputs_utc_conversion(time):
     assert time_list[0].hour == 12  # All should convert to 12:00 UTC
 
 
+def test_plan_partition_fetches():
+    time = [
+        datetime.datetime(2024, 1, 1, 1),
+        datetime.datetime(2024, 1, 1, 2),
+        datetime.datetime(2024, 6, 1),
+    ]
+    plan = plan_partition_fetches(
+        ["b", "a", "b"], time, -datetime.timedelta(hours=3), datetime.timedelta(0)
+    )
+    # Windows crossing the year boundary include the previous year
+    assert plan == [("a", 2023), ("a", 2024), ("b", 2023), ("b", 2024)]
+
+    plan = plan_partition_fetches(
+        ["a"], time, -datetime.timedelta(hours=1), datetime.timedelta(hours=1)
+    )
+    assert plan == [("a", 2024)]
+
+
+def test_time_window_slice():
+    dates = pd.to_datetime(
+        ["2024-01-01 03:00", "2024-01-01 00:00", "2024-01-01 02:00", "2024-01-01 01:00"]
+    )
+    df = sort_by_time(pd.DataFrame({"DATE": dates, "value": [3, 0, 2, 1]}))
+    assert df["value"].tolist() == [0, 1, 2, 3]
+    assert sort_by_time(df) is df
+    assert sort_by_time(pd.DataFrame()).empty
+
+    window = time_window_slice(
+        df, datetime.datetime(2024, 1, 1, 1), datetime.datetime(2024, 1, 1, 2)
+    )
+    assert window["value"].tolist() == [1, 2]
+    window = time_window_slice(
+        df, datetime.datetime(2024, 1, 2), datetime.datetime(2024, 1, 3)
+    )
+    assert window.empty
+    assert time_window_slice(pd.DataFrame(), 0, 1).empty
+
+    # String dates, e.g. YYYYMMDD
+    df = sort_by_time(pd.DataFrame({"DATE": ["20240103", "20240101", "20240102"]}))
+    window = time_window_slice(df, "20240102", "20240103")
+    assert window["DATE"].tolist() == ["20240102", "20240103"]
+
+
 def test_ensure_utc():
     # Naive datetime passes through unchanged
     naive = datetime.datetime(2020, 1, 1, 12, 0)
@@ -721,6 +932,74 @@ async def test_cancellable_to_thread():
     assert result == 3
 
 
+@pytest.mark.asyncio
+@pytest.mark.timeout(60)
+async def test_run_grib_decode(monkeypatch):
+    import math
+
+    import earth2studio.data.utils as data_utils
+
+    monkeypatch.setattr(data_utils, "_GRIB_DECODE_POOL", None)
+    monkeypatch.setattr(data_utils, "_GRIB_DECODE_POOL_CONFIGURED", False)
+    try:
+        configure_grib_decode_pool(max_workers=2, start_method="spawn")
+        out = await run_grib_decode(np.full, (4, 8), 2.5, timeout=30.0)
+        assert out.shape == (4, 8)
+        assert np.all(out == 2.5)
+        # Non array results are returned as is
+        assert await run_grib_decode(math.hypot, 3.0, 4.0, timeout=30.0) == 5.0
+        assert (await run_grib_decode(np.zeros, (0,), timeout=30.0)).shape == (0,)
+    finally:
+        configure_grib_decode_pool(max_workers=0)
+
+    # Without a pool decodes run in a thread
+    out = await run_grib_decode(np.full, (2,), 1.0)
+    assert np.all(out == 1.0)
+    with pytest.raises(ValueError):
+        configure_grib_decode_pool(max_workers=-1)
+
+
+def _slow_full(seconds, shape, value):
+    import time
+
+    time.sleep(seconds)
+    return np.full(shape, value)
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(60)
+async def test_run_grib_decode_timeout(monkeypatch):
+    from multiprocessing import shared_memory
+
+    import earth2studio.data.utils as data_utils
+
+    monkeypatch.setattr(data_utils, "_GRIB_DECODE_POOL", None)
+    monkeypatch.setattr(data_utils, "_GRIB_DECODE_POOL_CONFIGURED", False)
+    released = []
+    read_shared_memory = data_utils._read_shared_memory
+
+    def _record_release(result):
+        released.append(result)
+        return read_shared_memory(result)
+
+    monkeypatch.setattr(data_utils, "_read_shared_memory", _record_release)
+    try:
+        configure_grib_decode_pool(max_workers=1, start_method="spawn")
+        with pytest.raises(asyncio.TimeoutError):
+            await run_grib_decode(_slow_full, 1.0, (4, 8), 2.5, timeout=0.1)
+        # The abandoned decode finishes in the worker and releases its block
+        for _ in range(400):
+            if released:
+                break
+            await asyncio.sleep(0.1)
+    finally:
+        configure_grib_decode_pool(max_workers=0)
+
+    assert len(released) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=released[0].name)
+
+
 def test_obstore_store_from_url():
     import obstore.store
 
@@ -795,6 +1074,213 @@ async def test_obstore_fetch_to_cache(tmp_path):
     )
     assert Path(path).read_bytes() == payload
 
+    # Files of temporary cache directories are written but not tracked
+    tmp_cache = tmp_path / "tmp_cache"
+    path = await obstore_fetch_to_cache(
+        store, "some/key", str(tmp_cache), byte_offset=0, managed=False
+    )
+    assert Path(path).read_bytes() == b"changed"
+    assert not (tmp_cache / CacheManager.INDEX_NAME).exists()
+
+
+def test_cached_grib_index(tmp_path, monkeypatch):
+    import earth2studio.data.utils as data_utils
+
+    monkeypatch.setattr(data_utils, "_GRIB_INDEX_CACHE", OrderedDict())
+    index_file = tmp_path / "file.idx"
+    index_file.write_text("1:0:a\n2:10:b\n3:30:c\n")
+
+    calls = []
+
+    def _parse(path):
+        calls.append(path)
+        lines = [line.split(":") for line in Path(path).read_text().splitlines()]
+        table = {}
+        for i, line in enumerate(lines):
+            end = int(lines[i + 1][1]) if i + 1 < len(lines) else None
+            table[line[2]] = (int(line[1]), None if end is None else end - int(line[1]))
+        return table
+
+    expected = {"a": (0, 10), "b": (10, 20), "c": (30, None)}
+    assert cached_grib_index(str(index_file), _parse) == expected
+    assert cached_grib_index(str(index_file), _parse) == expected
+    assert len(calls) == 1
+    assert os.path.isfile(str(index_file) + ".parsed.json")
+
+    # Parsed table persists on disk, returned tables are copies
+    data_utils._GRIB_INDEX_CACHE.clear()
+    table = cached_grib_index(str(index_file), _parse)
+    assert table == expected
+    assert len(calls) == 1
+    table.pop("a")
+    assert cached_grib_index(str(index_file), _parse) == expected
+
+    # Changed index files are parsed again
+    index_file.write_text("1:0:a\n2:5:b\n")
+    assert cached_grib_index(str(index_file), _parse) == {"a": (0, 5), "b": (5, None)}
+    assert len(calls) == 2
+
+
+def test_coalesce_byte_ranges():
+    ranges = [(100, 50), (0, 100), (160, 40), (150, 5), (400, 10)]
+    assert coalesce_byte_ranges(ranges) == [
+        (0, 155, [1, 0, 3]),
+        (160, 40, [2]),
+        (400, 10, [4]),
+    ]
+    assert coalesce_byte_ranges(ranges, max_gap=10) == [
+        (0, 200, [1, 0, 3, 2]),
+        (400, 10, [4]),
+    ]
+    assert coalesce_byte_ranges(ranges, max_gap=10, max_span=120) == [
+        (0, 100, [1]),
+        (100, 100, [0, 3, 2]),
+        (400, 10, [4]),
+    ]
+    # Overlapping and oversized ranges
+    assert coalesce_byte_ranges([(0, 100), (50, 10)], max_span=20) == [(0, 100, [0, 1])]
+    assert coalesce_byte_ranges([]) == []
+
+
+@pytest.mark.asyncio
+async def test_obstore_fetch_ranges_to_cache(tmp_path, monkeypatch):
+    from hashlib import sha256
+
+    from obstore.store import MemoryStore
+
+    import earth2studio.data.utils as data_utils
+
+    store = MemoryStore()
+    payload = bytes(range(256))
+    await obs.put_async(store, "some/key", payload)
+
+    reads = []
+    read_range = data_utils.obstore_read_range
+
+    async def _read_range(store, key, byte_offset=0, byte_length=None):
+        reads.append((byte_offset, byte_length))
+        return await read_range(store, key, byte_offset, byte_length)
+
+    monkeypatch.setattr(data_utils, "obstore_read_range", _read_range)
+
+    # Warm cache for one range, the rest is fetched in coalesced spans
+    await obstore_fetch_to_cache(
+        store, "some/key", str(tmp_path), byte_offset=16, byte_length=16
+    )
+    reads.clear()
+    ranges = [(32, 16), (0, 16), (16, 16), (100, 8), (112, 8)]
+    paths = await obstore_fetch_ranges_to_cache(
+        store, "some/key", str(tmp_path), ranges, max_gap=4
+    )
+    assert reads == [(0, 16), (32, 16), (100, 20)]
+    for (offset, length), path in zip(ranges, paths):
+        assert os.path.basename(path) == (
+            sha256(("some/key" + str(offset)).encode()).hexdigest()
+        )
+        assert Path(path).read_bytes() == payload[offset : offset + length]
+
+    reads.clear()
+    await obstore_fetch_ranges_to_cache(store, "some/key", str(tmp_path), ranges)
+    assert reads == []
+
+    # Prefetches leave the hit / miss counters untouched
+    before = CacheManager.for_path(str(tmp_path)).stats()
+    await obstore_fetch_ranges_to_cache(
+        store, "some/key", str(tmp_path), ranges, record=False
+    )
+    after = CacheManager.for_path(str(tmp_path)).stats()
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_managers(monkeypatch):
+    # Process-wide cache managers must not leak tmp roots and budgets across tests
+    monkeypatch.setattr(CacheManager, "_managers", {})
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_cache_manager(policy, tmp_path, monkeypatch):
+    # Files not written through the manager are never tracked nor evicted
+    (tmp_path / "old").write_bytes(b"0" * 10)
+    manager = CacheManager(str(tmp_path), max_bytes=20, policy=policy, grace_period=0)
+    assert manager.stats()["entries"] == 0
+
+    os.makedirs(tmp_path / "src")
+    for name in ["a", "b"]:
+        manager.write(str(tmp_path / "src" / name), name.encode() * 10)
+    assert manager.stats()["bytes"] == 20
+    assert not any(p.name.startswith(".tmp-") for p in (tmp_path / "src").iterdir())
+
+    # "b" is both the least recently and least frequently used file
+    assert manager.lookup(str(tmp_path / "old"))
+    assert not manager.lookup(str(tmp_path / "a"))
+    assert not manager.lookup(str(tmp_path / "missing"))
+    assert manager.lookup(str(tmp_path / "src" / "a"))
+    assert manager.lookup(str(tmp_path / "src" / "a"))
+
+    manager.write(str(tmp_path / "src" / "c"), b"c" * 10)
+    stats = manager.stats()
+    assert stats["bytes"] == 20
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 2
+    assert not (tmp_path / "src" / "b").exists()
+    assert (tmp_path / "old").exists()
+    assert (tmp_path / "src" / "c").exists()
+
+    # Index and counters persist across managers, entries of files removed outside
+    # of the manager are dropped instead of evicting other files
+    (tmp_path / "src" / "c").unlink()
+    manager = CacheManager(str(tmp_path), max_bytes=10, policy=policy, grace_period=0)
+    assert manager.stats()["hits"] == 3
+    assert manager.evict() == 0
+    assert manager.stats()["entries"] == 1
+    assert (tmp_path / "src" / "a").exists()
+
+    # Recently accessed files are not evicted
+    manager.grace_period = 60
+    manager.write(str(tmp_path / "src" / "d"), b"d" * 10)
+    assert manager.stats()["entries"] == 2
+
+    # Without a budget, lookups do not access the index until it is queried
+    unbounded = CacheManager(str(tmp_path), policy=policy)
+    with monkeypatch.context() as m:
+        m.setattr(unbounded, "_connect", lambda: pytest.fail("index accessed"))
+        assert unbounded.lookup(str(tmp_path / "src" / "a"))
+        assert not unbounded.lookup(str(tmp_path / "src" / "b"))
+    stats = unbounded.stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 3
+
+    assert CacheManager.get(str(tmp_path)) is CacheManager.get(str(tmp_path))
+    with pytest.raises(ValueError):
+        CacheManager(str(tmp_path), policy="fifo")
+
+
+@pytest.mark.asyncio
+async def test_obstore_fetch_to_cache_budget(tmp_path):
+    from obstore.store import MemoryStore
+
+    store = MemoryStore()
+    await obs.put_async(store, "some/key", bytes(range(64)))
+
+    manager = CacheManager.get(str(tmp_path))
+    manager.max_bytes = 32
+    manager.grace_period = 0
+    for offset in [0, 16, 32]:
+        await obstore_fetch_to_cache(
+            store, "some/key", str(tmp_path), byte_offset=offset, byte_length=16
+        )
+    await obstore_fetch_to_cache(
+        store, "some/key", str(tmp_path), byte_offset=32, byte_length=16
+    )
+    stats = manager.stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 1
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 32
+
 
 @pytest.fixture
 def local_zarr_array(tmp_path):
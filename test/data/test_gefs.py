@@ -24,6 +24,7 @@ import numpy as np
 import pytest
 
 from earth2studio.data import GEFS_FX, GEFS_FX_721x1440
+from earth2studio.data.gefs import GEFSAsyncTask
 
 
 @pytest.mark.slow
@@ -342,6 +343,7 @@ def test_gefs_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gefs._decode_gefs_grib", return_value=fake_grid),
     ):
         # Bypass real store by stubbing it to a truthy sentinel.
@@ -381,6 +383,7 @@ def test_gefs_call_mock_trailing_record(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gefs._decode_gefs_grib", return_value=fake_grid),
     ):
         ds.store = object()  # type: ignore[assignment]
@@ -414,6 +417,7 @@ def test_gefs_0p25_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gefs._decode_gefs_grib", return_value=fake_grid),
     ):
         ds.store = object()  # type: ignore[assignment]
@@ -428,6 +432,33 @@ def test_gefs_0p25_call_mock(tmp_path, monkeypatch):
         np.testing.assert_allclose(data.values[0, j, 0], fake_grid)
 
 
+def test_gefs_prefetch_coalesced(tmp_path, monkeypatch):
+    # Messages of one grib file are prefetched with a single coalesced call,
+    # open ended ranges of the last record are left to fetch_wrapper
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path))
+    ds = GEFS_FX(cache=True, verbose=False)
+    ds.store = object()  # type: ignore[assignment]
+
+    tasks = [
+        GEFSAsyncTask((0, 0, k), uri, offset, length, lambda x: x)
+        for k, (uri, offset, length) in enumerate(
+            [
+                ("noaa-gefs-pds/a", 0, 100),
+                ("noaa-gefs-pds/a", 100, 50),
+                ("noaa-gefs-pds/a", 150, None),
+            ]
+        )
+    ]
+    fetch = AsyncMock(return_value=[])
+    with patch("earth2studio.data.gefs.obstore_fetch_ranges_to_cache", new=fetch):
+        asyncio.run(ds._prefetch_tasks(tasks))
+
+    fetch.assert_awaited_once()
+    assert fetch.await_args.args[1] == "a"
+    assert fetch.await_args.args[3] == [(0, 100), (100, 50)]
+    assert fetch.await_args.kwargs["record"] is False
+
+
 @pytest.mark.timeout(15)
 def test_gefs_fetch_remote_file_key_and_cache(tmp_path, monkeypatch):
     """The obstore fetch must receive the store-relative key while the cache
@@ -442,13 +473,20 @@ def test_gefs_fetch_remote_file_key_and_cache(tmp_path, monkeypatch):
     captured = {}
 
     async def _fake_fetch_to_cache(
-        store, key, cache_dir, byte_offset=0, byte_length=None, cache_key=None
+        store,
+        key,
+        cache_dir,
+        byte_offset=0,
+        byte_length=None,
+        cache_key=None,
+        managed=True,
     ):
         captured.update(
             key=key,
             byte_offset=byte_offset,
             byte_length=byte_length,
             cache_key=cache_key,
+            managed=managed,
         )
         return str(tmp_path / "cached")
 
@@ -472,3 +510,4 @@ def test_gefs_fetch_remote_file_key_and_cache(tmp_path, monkeypatch):
     # compatibility with the pre-obstore implementation
     expected = hashlib.sha256((path + "123").encode()).hexdigest()
     assert captured["cache_key"] == expected
+    assert captured["managed"]
@@ -15,15 +15,18 @@
 # limitations under the License.
 
 import asyncio
+import hashlib
 import pathlib
 import shutil
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
 
 from earth2studio.data import GFS, GFS_FX
+from earth2studio.data.gfs import GFSAsyncTask
 
 
 @pytest.mark.slow
@@ -294,6 +297,7 @@ def test_gfs_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gfs._decode_gfs_grib", return_value=fake_grid),
     ):
         # Bypass real store by stubbing it to a truthy sentinel.
@@ -329,6 +333,7 @@ def test_gfs_fx_call_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gfs._decode_gfs_grib", return_value=fake_grid),
     ):
         ds.store = object()  # type: ignore[assignment]
@@ -364,6 +369,7 @@ def test_gfs_missing_variable_mock(tmp_path, monkeypatch):
         patch.object(ds, "_async_init", new=AsyncMock(return_value=None)),
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.gfs._decode_gfs_grib", return_value=fake_grid),
     ):
         ds.store = object()  # type: ignore[assignment]
@@ -372,3 +378,77 @@ def test_gfs_missing_variable_mock(tmp_path, monkeypatch):
     np.testing.assert_allclose(data.sel(variable="t2m").values[0], fake_grid)
     # Skipped variable keeps the zero fill.
     assert (data.sel(variable="z500").values == 0.0).all()
+
+
+@pytest.mark.timeout(15)
+def test_gfs_prefetch_coalesced(tmp_path, monkeypatch):
+    # Messages of one grib file are prefetched with a single coalesced call
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path))
+    ds = GFS(source="aws", cache=True, verbose=False)
+    ds.store = object()  # type: ignore[assignment]
+
+    tasks = [
+        GFSAsyncTask((0, 0, k), uri, offset, length, lambda x: x)
+        for k, (uri, offset, length) in enumerate(
+            [
+                ("noaa-gfs-bdp-pds/a", 100, 50),
+                ("noaa-gfs-bdp-pds/a", 0, 100),
+                ("noaa-gfs-bdp-pds/b", 0, 10),
+            ]
+        )
+    ]
+    fetch = AsyncMock(return_value=[])
+    with patch("earth2studio.data.gfs.obstore_fetch_ranges_to_cache", new=fetch):
+        asyncio.run(ds._prefetch_tasks(tasks))
+
+    assert fetch.await_count == 2
+    calls = {c.args[1]: c for c in fetch.await_args_list}
+    assert calls["a"].args[3] == [(100, 50), (0, 100)]
+    assert calls["b"].args[3] == [(0, 10)]
+    # Prefetches are counted when read, not when fetched
+    assert calls["a"].kwargs["record"] is False
+    # Cache file names match the single range fetch
+    assert calls["a"].kwargs["cache_keys"][1] == (
+        hashlib.sha256(("noaa-gfs-bdp-pds/a" + "0").encode()).hexdigest()
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(60)
+def test_gfs_index_cache_benchmark(tmp_path, monkeypatch):
+    # Parsed index cache on a realistic 700 record pgrb2 index
+    import earth2studio.data.utils as data_utils
+
+    monkeypatch.setattr(data_utils, "_GRIB_INDEX_CACHE", OrderedDict())
+    levels = [f"{p} mb" for p in range(10, 1010, 10)]
+    fields = ["HGT", "TMP", "RH", "UGRD", "VGRD", "VVEL", "ABSV"]
+    lines = []
+    offset = 0
+    for field in fields:
+        for level in levels:
+            lines.append(f"{len(lines) + 1}:{offset}:d=2024010100:{field}:{level}:anl:")
+            offset += 400000 + len(lines)
+    idx_path = tmp_path / "gfs.t00z.pgrb2.0p25.f000.idx"
+    idx_path.write_text("\n".join(lines) + "\n")
+
+    ds = GFS(cache=False)
+
+    async def _fake_fetch(uri):
+        return str(idx_path)
+
+    table = ds._parse_index(str(idx_path))
+    assert len(table) == 699
+
+    with patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch):
+        assert asyncio.run(ds._fetch_index("dummy-uri")) == table
+
+    # Memory and disk cache hits never parse the index again
+    parse = MagicMock(side_effect=ds._parse_index)
+    for _ in range(50):
+        cached = data_utils.cached_grib_index(str(idx_path), parse)
+    data_utils._GRIB_INDEX_CACHE.clear()
+    disk = data_utils.cached_grib_index(str(idx_path), parse)
+
+    assert cached == table
+    assert disk == table
+    parse.assert_not_called()
@@ -18,7 +18,7 @@ import asyncio
 import pathlib
 import shutil
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import numpy as np
 import pytest
@@ -335,6 +335,7 @@ def test_hrrr_call_mock(source, tmp_path, monkeypatch):
     with (
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.hrrr._decode_hrrr_grib", return_value=fake_grid),
     ):
         data = ds(datetime(2024, 1, 1), ["t2m", "z500"])
@@ -372,6 +373,7 @@ def test_hrrr_fx_call_mock(tmp_path, monkeypatch):
     with (
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.hrrr._decode_hrrr_grib", return_value=fake_grid),
     ):
         data = ds(
@@ -405,6 +407,7 @@ def test_hrrr_missing_variable_mock(tmp_path, monkeypatch):
     with (
         patch.object(ds, "_fetch_index", side_effect=_fake_fetch_index),
         patch.object(ds, "_fetch_remote_file", side_effect=_fake_fetch_remote_file),
+        patch.object(ds, "_fetch_remote_ranges", new=AsyncMock(return_value=[])),
         patch("earth2studio.data.hrrr._decode_hrrr_grib", return_value=fake_grid),
     ):
         data = ds(datetime(2024, 1, 1), ["t2m", "z500"])
@@ -17,6 +17,7 @@
 import pathlib
 import shutil
 from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pandas as pd
@@ -79,6 +80,28 @@ def test_isd_fetch(stations, time, variable, tol):
     assert time_union["time"].all()
 
 
+def test_isd_fetch_plan(tmp_path, monkeypatch):
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path))
+    monkeypatch.delenv("EARTH2STUDIO_DATA_CACHE", raising=False)
+    ds = ISD(
+        stations=["72788324220", "72063800224"],
+        time_tolerance=timedelta(hours=1),
+        cache=False,
+        verbose=False,
+    )
+    ds.fs = MagicMock()
+    ds.fs.set_session = AsyncMock(return_value=MagicMock(close=AsyncMock()))
+    ds._fetch_station_year = AsyncMock(return_value=pd.DataFrame())
+
+    # Hourly times in one year are fetched once per station-year
+    time = [datetime(2022, 1, 1, 6) + timedelta(hours=h) for h in range(24)]
+    df = ds(time, ["t2m"])
+    assert df.empty
+    assert list(df.columns) == ds.SCHEMA.names
+    calls = sorted(call.args for call in ds._fetch_station_year.call_args_list)
+    assert calls == [("72063800224", 2022), ("72788324220", 2022)]
+
+
 @pytest.mark.slow
 @pytest.mark.xfail
 @pytest.mark.timeout(30)
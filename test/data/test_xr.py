@@ -15,9 +15,11 @@
 # limitations under the License.
 
 import datetime
+import json
 import os
 import pathlib
 import shutil
+import tempfile
 
 import numpy as np
 import pytest
@@ -213,6 +215,78 @@ def test_data_array_sources(time, variable, data_source_type):
     )
 
 
+def test_data_array_directory_lazy(tmp_path, monkeypatch):
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path / "cache"))
+    base_dir = tmp_path / "data"
+    test_data = {}
+    for month in [1, 2, 3]:
+        times = [
+            datetime.datetime(year=2018, month=month, day=1),
+            datetime.datetime(year=2018, month=month, day=8),
+        ]
+        test_data[month] = foo_dat_arr(times)
+        year_dir = base_dir / "2018"
+        os.makedirs(year_dir, exist_ok=True)
+        test_data[month].to_netcdf(year_dir / f"2018_{month:02d}.nc")
+    # Unreadable file in the same month is skipped
+    with open(base_dir / "2018" / "2018_01.txt", "w") as f:
+        f.write("not a data array")
+
+    data_source = DataArrayDirectory(str(base_dir), max_open_files=2)
+    assert len(data_source._handles) == 0
+    # The index is written once per request, not once per opened file
+    index_dir = os.path.dirname(data_source._index_path)
+    writes = []
+    mkstemp = tempfile.mkstemp
+
+    def _mkstemp(*args, **kwargs):
+        writes.append(kwargs.get("dir"))
+        return mkstemp(*args, **kwargs)
+
+    monkeypatch.setattr(tempfile, "mkstemp", _mkstemp)
+
+    # Out of order times across files, returned in request order
+    time = [
+        datetime.datetime(year=2018, month=3, day=8),
+        datetime.datetime(year=2018, month=1, day=1),
+        datetime.datetime(year=2018, month=3, day=1),
+        datetime.datetime(year=2018, month=2, day=8),
+    ]
+    data = data_source(time, ["u10m", "v10m"])
+    assert data.shape[:2] == (4, 2)
+    for i, tt in enumerate(time):
+        target = test_data[tt.month].sel(
+            time=np.datetime64(tt), variable=["u10m", "v10m"]
+        )
+        assert np.all(target.values == data.isel(time=i).values)
+    # Only the most recently used files stay open
+    assert len(data_source._handles) == 2
+    assert len(data_source._index) == 3
+    assert writes.count(index_dir) == 1
+
+    # Persisted index resolves times without opening other files
+    data_source = DataArrayDirectory(str(base_dir), max_open_files=2)
+    assert len(data_source._index) == 3
+    data = data_source(datetime.datetime(year=2018, month=2, day=1), "u10m")
+    assert list(data_source._handles) == [str(base_dir / "2018" / "2018_02.nc")]
+
+    with pytest.raises(KeyError):
+        data_source(datetime.datetime(year=2018, month=2, day=2), "u10m")
+    with pytest.raises(KeyError):
+        data_source(datetime.datetime(year=2019, month=1, day=1), "u10m")
+    with pytest.raises(ValueError):
+        DataArrayDirectory(str(base_dir), max_open_files=0)
+
+    # Failed index writes leave no temporary files behind
+    def _dump(*args, **kwargs):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(json, "dump", _dump)
+    data_source._index_dirty = True
+    data_source._write_index()
+    assert os.listdir(index_dir) == [os.path.basename(data_source._index_path)]
+
+
 def test_data_array_path_list_exceptions(tmp_path):
     # Test 1: Missing dimensions
     time = [datetime.datetime(year=2018, month=1, day=1)]
@@ -551,3 +551,36 @@ def test_netcdf4_write_uninitialized_array(tmp_path: str) -> None:
     assert "newvar" in ds.data_vars
     assert np.allclose(ds["init"].isel(lon=slice(0, 2)).values, 0.0)
     assert np.allclose(ds["newvar"].isel(lon=slice(0, 5)).values, 1.0)
+
+
+def test_netcdf4_write_index_plan(tmp_path: str) -> None:
+    time = np.array(
+        [np.datetime64("2024-01-01T00") + np.timedelta64(6 * i, "h") for i in range(4)]
+    )
+    lead_time = np.array([np.timedelta64(6 * i, "h") for i in range(5)])
+    coords = OrderedDict(
+        {"time": time, "lead_time": lead_time, "lat": np.arange(3), "lon": np.arange(6)}
+    )
+
+    nc = NetCDF4Backend(tmp_path / "index_plan.nc", backend_kwargs={"mode": "w"})
+    nc.add_array(coords, "fields", data=torch.zeros(4, 5, 3, 6))
+    truth = np.zeros((4, 5, 3, 6), dtype=np.float32)
+
+    # Contiguous (slice) and non-contiguous (index) writes, with time coordinates
+    # passed in different units than stored
+    writes = [
+        (time[1:3].astype("datetime64[s]"), lead_time[2:3], np.arange(3), [1, 2]),
+        (time[[0, 3]], lead_time[[0, 2, 4]], np.array([0, 2]), [0, 3]),
+    ]
+    for t, lt, lat, t_idx in writes:
+        lt_idx = np.where(np.isin(lead_time, lt))[0]
+        x = torch.randn(len(t), len(lt), len(lat), 6)
+        nc.write(
+            x,
+            OrderedDict({"time": t, "lead_time": lt, "lat": lat, "lon": np.arange(6)}),
+            "fields",
+        )
+        truth[np.ix_(t_idx, lt_idx, lat, np.arange(6))] = x.numpy()
+
+    assert np.allclose(nc["fields"][:], truth)
+    nc.close()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024-2026 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-FileCopyrightText: All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+import torch
+
+from earth2studio.io import KVBackend
+from earth2studio.io.utils import (
+    BackgroundWriter,
+    cached_coord_indices,
+    contiguous_selection,
+    coord_index_map,
+    coord_indices,
+)
+
+
+def test_coord_indices():
+    values = np.array(
+        [np.datetime64("2024-01-01T00") + np.timedelta64(i, "h") for i in range(6)]
+    )
+    index_map = coord_index_map(values)
+    request = values[[4, 1, 2]].astype("datetime64[s]")
+    indices = coord_indices(values, request, index_map)
+    assert np.array_equal(indices, np.where(np.isin(values, request))[0])
+    assert np.array_equal(indices, [1, 2, 4])
+    assert np.array_equal(contiguous_selection(indices), [1, 2, 4])
+    assert contiguous_selection(np.array([2, 3, 4])) == slice(2, 5)
+    assert isinstance(contiguous_selection(np.array([1, 3])), np.ndarray)
+
+    # Duplicate coordinate values fall back to np.isin
+    duplicated = np.array([0, 1, 1, 2])
+    assert coord_index_map(duplicated) is None
+    assert np.array_equal(
+        coord_indices(duplicated, np.array([1]), None), np.array([1, 2])
+    )
+
+
+def test_cached_coord_indices():
+    coords = OrderedDict({"lat": np.arange(4.0), "lon": np.arange(3.0)})
+    cache = {}
+    indices = cached_coord_indices(coords, cache, "lat", np.array([2.0, 0.0]))
+    assert np.array_equal(indices, [0, 2])
+    index_map = cache["lat"][1]
+    cached_coord_indices(coords, cache, "lat", np.array([1.0]))
+    assert cache["lat"][1] is index_map
+
+    # Replaced store coordinates rebuild the index map
+    coords["lat"] = np.arange(4.0, 8.0)
+    indices = cached_coord_indices(coords, cache, "lat", np.array([5.0, 7.0]))
+    assert np.array_equal(indices, [1, 3])
+    assert cache["lat"][0] is coords["lat"]
+
+
+def test_background_writer():
+    coords = OrderedDict({"a": np.arange(8), "b": np.arange(3)})
+    io = KVBackend()
+    io.add_array(coords, "x")
+
+    x = torch.zeros(1, 3)
+    with BackgroundWriter(io, max_queue_size=2) as writer:
+        for i in range(8):
+            x.fill_(i)
+            # In place updates after submitting must not affect queued snapshots
+            writer.write(x, OrderedDict({"a": np.array([i]), "b": np.arange(3)}), "x")
+
+    assert torch.equal(
+        torch.as_tensor(io["x"]), torch.arange(8.0)[:, None].repeat(1, 3)
+    )
+
+
+def test_background_writer_backpressure():
+    class SlowIO:
+        def __init__(self):
+            self.event = threading.Event()
+            self.count = 0
+
+        def write(self, x, coords, array_name):
+            self.event.wait()
+            self.count += 1
+
+    io = SlowIO()
+    writer = BackgroundWriter(io, max_queue_size=1)
+    writer.write(torch.zeros(1), OrderedDict({"a": np.arange(1)}), "x")
+    writer.write(torch.zeros(1), OrderedDict({"a": np.arange(1)}), "x")
+
+    # Queue is full, so the next submission blocks until the backend proceeds
+    blocked = threading.Thread(
+        target=writer.write,
+        args=(torch.zeros(1), OrderedDict({"a": np.arange(1)}), "x"),
+    )
+    blocked.start()
+    time.sleep(0.1)
+    assert blocked.is_alive()
+
+    io.event.set()
+    blocked.join(timeout=5)
+    writer.close()
+    assert io.count == 3
+
+
+def test_background_writer_error():
+    class FailingIO:
+        def write(self, x, coords, array_name):
+            raise OSError("disk full")
+
+    writer = BackgroundWriter(FailingIO())
+    writer.write(torch.zeros(1), OrderedDict({"a": np.arange(1)}), "x")
+    with pytest.raises(OSError, match="disk full"):
+        writer.drain()
+    writer.close()
+
+    with pytest.raises(ValueError):
+        BackgroundWriter(FailingIO(), max_queue_size=0)
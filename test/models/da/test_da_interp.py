@@ -94,7 +94,7 @@ def small_grid():
 
 @pytest.mark.parametrize(
     "interp_method",
-    ["nearest", "smolyak"],
+    ["nearest", "idw", "smolyak"],
 )
 def test_interp_init(interp_method, small_grid):
     lat, lon = small_grid
@@ -106,6 +106,60 @@ def test_interp_init(interp_method, small_grid):
     with pytest.raises(ValueError, match="interp_method must be one of"):
         InterpEquirectangular(interp_method="invalid")
 
+    with pytest.raises(ValueError, match="n_neighbors must be at least 1"):
+        InterpEquirectangular(interp_method="idw", n_neighbors=0)
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        "cpu",
+        pytest.param(
+            "cuda:0",
+            marks=pytest.mark.skipif(
+                not torch.cuda.is_available(), reason="cuda missing"
+            ),
+        ),
+    ],
+)
+@pytest.mark.parametrize("interp_method", ["nearest", "idw"])
+def test_interp_indexed_values(device, interp_method):
+    lat = np.array([-10.0, 0.0, 10.0], dtype=np.float32)
+    lon = np.array([0.0, 90.0, 180.0, 270.0], dtype=np.float32)
+    model = InterpEquirectangular(
+        lat=lat, lon=lon, interp_method=interp_method, n_neighbors=3
+    ).to(device)
+    model.QUERY_CHUNK_SIZE = 5  # Force multiple query chunks
+
+    time = np.datetime64("2024-01-01T12:00:00")
+    # Observations on grid points, one across the anti-meridian in -180,180 range
+    df = pd.DataFrame(
+        {
+            "time": [time, time, time],
+            "lat": [0.0, 10.0, -10.0],
+            "lon": [90.0, 180.0, -0.5],
+            "observation": [1.0, 2.0, 3.0],
+            "variable": ["t2m", "t2m", "t2m"],
+        }
+    )
+    df.attrs = {"request_time": np.array([time])}
+    da = model(df)
+    data = da.sel(variable="t2m").values[0]
+    if cp is not None and isinstance(data, cp.ndarray):
+        data = cp.asnumpy(data)
+
+    # Observations located on grid points are reproduced exactly
+    assert data[1, 1] == pytest.approx(1.0)
+    assert data[2, 2] == pytest.approx(2.0)
+    assert not np.any(np.isnan(data))
+    if interp_method == "nearest":
+        # Nearest on the sphere wraps across 0/360 longitude
+        assert data[0, 0] == pytest.approx(3.0)
+        assert set(np.unique(data)) <= {1.0, 2.0, 3.0}
+    else:
+        assert data[0, 0] == pytest.approx(3.0, abs=1e-3)
+        assert np.all((data >= 1.0) & (data <= 3.0))
+
 
 @pytest.mark.parametrize(
     "device",
@@ -121,7 +175,7 @@ def test_interp_init(interp_method, small_grid):
 )
 @pytest.mark.parametrize(
     "interp_method",
-    ["nearest", "smolyak"],
+    ["nearest", "idw", "smolyak"],
 )
 def test_interp_call_pandas(
     sample_observations_pandas, small_grid, device, interp_method
@@ -176,7 +230,7 @@ def test_interp_call_pandas(
 )
 @pytest.mark.parametrize(
     "interp_method",
-    ["nearest", "smolyak"],
+    ["nearest", "idw", "smolyak"],
 )
 def test_interp_call_cudf(sample_observations_cudf, small_grid, device, interp_method):
     if cudf is None:
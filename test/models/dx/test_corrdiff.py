@@ -865,6 +865,76 @@ class TestCorrDiffForward:
         out_both, _ = model_both(x, coords)
         assert out_both.shape == (1, 1, 4, 320, 320)
 
+    @pytest.mark.parametrize("sample_batch_size", [1, 3, 8])
+    def test_corrdiff_sample_batching(
+        self,
+        sample_batch_size,
+        mock_residual_model,
+        mock_regression_model,
+        sample_model_params,
+    ):
+        """Test micro-batched diffusion sampling keeps per-sample seeds."""
+        calls = []
+
+        def fake_diffusion_step(rank_batches, img_lr, mean_hr, **kwargs):
+            seeds = rank_batches[0]
+            calls.append(len(seeds))
+            assert img_lr.shape[0] == len(seeds)
+            assert mean_hr.shape[0] == len(seeds)
+            return torch.stack(
+                [torch.full((4, 320, 320), float(seed)) for seed in seeds]
+            ) + img_lr[:, :1].mean(dim=(-1, -2), keepdim=True)
+
+        x = torch.randn(2, 4, 36, 40)
+        lat_grid, lon_grid = (
+            sample_model_params["lat_input_grid"].cpu().numpy(),
+            sample_model_params["lon_input_grid"].cpu().numpy(),
+        )
+        coords = OrderedDict(
+            {
+                "batch": np.ones(2),
+                "variable": np.array(sample_model_params["input_variables"]),
+                "lat": lat_grid,
+                "lon": lon_grid,
+            }
+        )
+
+        outputs = []
+        for batch_size in [1, sample_batch_size]:
+            calls.clear()
+            model = CorrDiff(
+                residual_model=mock_residual_model,
+                regression_model=mock_regression_model,
+                number_of_samples=4,
+                inference_mode="diffusion",
+                seed=7,
+                sample_batch_size=batch_size,
+                **sample_model_params,
+            )
+            with patch(
+                "earth2studio.models.dx.corrdiff.diffusion_step", fake_diffusion_step
+            ):
+                out, out_coords = model(x, coords)
+            assert out.shape == (2, 4, 4, 320, 320)
+            assert sum(calls) == 8
+            assert len(calls) == -(-8 // batch_size)
+            assert max(calls) <= batch_size
+            outputs.append(out)
+
+        torch.testing.assert_close(outputs[0], outputs[1])
+        # Sample j of every batch member is seeded with seed + j
+        expected = torch.arange(7, 11, dtype=torch.float32).view(1, 4, 1, 1, 1)
+        out = outputs[0]
+        assert torch.allclose(out - out[:, :1], expected - expected[:, :1])
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            CorrDiff(
+                residual_model=mock_residual_model,
+                regression_model=mock_regression_model,
+                sample_batch_size=0,
+                **sample_model_params,
+            )
+
 
 class TestCorrDiffLoadModel:
     @patch("earth2studio.models.dx.corrdiff.PhysicsNemoModule", MockPhysicsNemoModule)
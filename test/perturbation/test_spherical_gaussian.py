@@ -19,7 +19,11 @@ from collections import OrderedDict
 import pytest
 import torch
 
-from earth2studio.perturbation import CorrelatedSphericalGaussian, SphericalGaussian
+from earth2studio.perturbation import (
+    CorrelatedSphericalGaussian,
+    SphericalGaussian,
+    spherical,
+)
 
 
 @pytest.mark.parametrize(
@@ -69,6 +73,46 @@ def test_spherical_gaussian(x, coords, amplitude, alpha, tau, sigma, device):
     assert dx.device == x.device
 
 
+def test_spherical_gaussian_sampler_cache(monkeypatch):
+    monkeypatch.setattr(spherical, "_SAMPLER_CACHE", OrderedDict())
+    monkeypatch.setattr(spherical, "_SAMPLER_CACHE_SIZE", 2)
+    coords = OrderedDict([("variable", []), ("lat", []), ("lon", [])])
+
+    prtb = SphericalGaussian(1.0)
+    prtb(torch.randn(2, 16, 32), coords)
+    sampler = next(iter(spherical._SAMPLER_CACHE.values()))
+    # Same grid and odd lat count share the sampler
+    prtb(torch.randn(3, 16, 32), coords)
+    xout, _ = prtb(torch.randn(3, 17, 32), coords)
+    assert xout.shape == (3, 17, 32)
+    assert len(spherical._SAMPLER_CACHE) == 1
+    assert next(iter(spherical._SAMPLER_CACHE.values())) is sampler
+
+    # Double precision and other grids get their own sampler, oldest is evicted
+    xout, _ = prtb(torch.randn(2, 16, 32, dtype=torch.float64), coords)
+    assert xout.dtype == torch.float64
+    prtb(torch.randn(2, 8, 16), coords)
+    assert len(spherical._SAMPLER_CACHE) == 2
+    assert all(s is not sampler for s in spherical._SAMPLER_CACHE.values())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8])
+def test_spherical_gaussian_generate(chunk_size):
+    prtb = SphericalGaussian(0.5)
+    chunks = list(prtb.generate((2, 17, 32), 7, chunk_size=chunk_size))
+
+    assert len(chunks) == -(-7 // chunk_size)
+    assert all(chunk.shape[0] <= chunk_size for chunk in chunks)
+    noise = torch.cat(chunks)
+    assert noise.shape == (7, 2, 17, 32)
+    assert noise.dtype == torch.float32
+    assert torch.equal(noise[..., -1, :], noise[..., -2, :])
+    assert torch.std(noise) > 0
+
+    with pytest.raises(ValueError):
+        next(prtb.generate((2, 16, 32), 7, chunk_size=0))
+
+
 @pytest.mark.parametrize(
     "x, coords, error",
     [
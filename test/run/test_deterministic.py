@@ -112,3 +112,28 @@ def test_deterministic_output_coords(output_coords, device):
     del output_coords["variable"]
     for key, value in output_coords.items():
         assert np.array_equal(io[key], value)
+
+
+@pytest.mark.parametrize("pipeline_depth", [1, 3])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_run_deterministic_pipelined(pipeline_depth, device):
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+    nsteps = 6
+    time = ["2024-01-01"]
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = ZarrBackend()
+
+    io = run.deterministic(
+        time, nsteps, model, data, io, device=device, pipeline_depth=pipeline_depth
+    )
+
+    for var in variable:
+        assert io[var].shape == (len(time), nsteps + 1, 10, 20)
+        out = io[var][:]
+        assert not np.any(np.isnan(out))
+        # Persistence, so every queued snapshot matches the initial state
+        for i in range(1, nsteps + 1):
+            assert np.array_equal(out[:, i], out[:, 0])
@@ -143,3 +143,35 @@ def test_ensemble_output_coords(output_coords, device):
     del output_coords["variable"]
     for key, value in output_coords.items():
         assert np.array_equal(io[key], value)
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_run_ensemble_pipelined(device):
+    coords = OrderedDict([("lat", np.arange(10)), ("lon", np.arange(20))])
+    variable = ["u10m", "v10m"]
+    nsteps = 4
+    nensemble = 5
+
+    data = Random(domain_coords=coords)
+    model = TestPersistence(variable, coords, target_device=device)
+    io = ZarrBackend()
+
+    io = run.ensemble(
+        ["2024-01-01"],
+        nsteps,
+        nensemble,
+        model,
+        data,
+        io,
+        Gaussian(),
+        batch_size=2,
+        device=device,
+        pipeline_depth=2,
+    )
+
+    for var in variable:
+        assert io[var].shape == (nensemble, 1, nsteps + 1, 10, 20)
+        out = io[var][:]
+        assert not np.any(np.isnan(out))
+        for i in range(1, nsteps + 1):
+            assert np.array_equal(out[:, :, i], out[:, :, 0])
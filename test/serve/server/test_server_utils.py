@@ -21,13 +21,18 @@ from fastapi import HTTPException
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from earth2studio.serve.server.utils import (
+    FileRangeResponse,
+    create_file_response,
     create_file_stream,
+    create_multipart_file_stream,
     get_inference_request_metadata_key,
     get_inference_request_output_path_key,
     get_inference_request_zip_key,
     get_results_zip_dir_key,
     get_signed_url_key,
+    multipart_byteranges_length,
     parse_azure_blob_container_url,
+    parse_byte_ranges,
     parse_range_header,
     queue_next_stage,
 )
@@ -76,6 +81,38 @@ class TestParseRangeHeader:
         assert exc_info.value.status_code == 416
 
 
+class TestParseByteRanges:
+    """Tests for parse_byte_ranges."""
+
+    def test_no_range_returns_empty(self):
+        assert parse_byte_ranges(None, 100) == []
+
+    def test_multiple_ranges_in_request_order(self):
+        assert parse_byte_ranges("bytes=50-59, 0-1,-5", 100) == [
+            (50, 59),
+            (0, 1),
+            (95, 99),
+        ]
+
+    def test_clamps_end_and_skips_unsatisfiable(self):
+        assert parse_byte_ranges("bytes=90-200,150-160", 100) == [(90, 99)]
+
+    @pytest.mark.parametrize(
+        "header",
+        ["items=0-1", "bytes=abc-def", "bytes=5-1", "bytes=200-300", "bytes=0"],
+    )
+    def test_invalid_raises_416(self, header):
+        with pytest.raises((HTTPException, StarletteHTTPException)) as exc_info:
+            parse_byte_ranges(header, 100)
+        assert exc_info.value.status_code == 416
+
+    def test_too_many_ranges_raises_416(self):
+        header = "bytes=" + ",".join(f"{i}-{i}" for i in range(65))
+        with pytest.raises((HTTPException, StarletteHTTPException)) as exc_info:
+            parse_byte_ranges(header, 100)
+        assert exc_info.value.status_code == 416
+
+
 class TestParseAzureBlobContainerUrl:
     """Tests for parse_azure_blob_container_url."""
 
@@ -173,6 +210,186 @@ class TestCreateFileStream:
         assert "Error streaming desc" in caplog.text
 
 
+class TestFileResponses:
+    """Tests for seek-based, zero-copy and multipart file responses."""
+
+    @pytest.mark.asyncio
+    async def test_range_stream_seeks_instead_of_reading(self, tmp_path):
+        p = tmp_path / "f.bin"
+        p.write_bytes(bytes(range(256)) * 16)
+        mock_file = MagicMock()
+        mock_file.seek = AsyncMock(return_value=4000)
+        mock_file.read = AsyncMock(side_effect=[b"abc", b""])
+        mock_cm = MagicMock()
+        mock_cm.__aenter__ = AsyncMock(return_value=mock_file)
+        mock_cm.__aexit__ = AsyncMock(return_value=None)
+        with patch(
+            "earth2studio.serve.server.utils.aiofiles.open", return_value=mock_cm
+        ):
+            chunks = [part async for part in create_file_stream(p, 4000, 10)]
+        assert chunks == [b"abc"]
+        mock_file.seek.assert_awaited_once_with(4000)
+        mock_file.read.assert_awaited_with(7)
+
+    @pytest.mark.asyncio
+    async def test_multipart_stream_matches_length(self, tmp_path):
+        p = tmp_path / "f.bin"
+        data = bytes(range(100))
+        p.write_bytes(data)
+        ranges = [(90, 99), (0, 4)]
+        body = b"".join(
+            [
+                part
+                async for part in create_multipart_file_stream(
+                    p, ranges, "sep", "application/octet-stream"
+                )
+            ]
+        )
+        assert len(body) == multipart_byteranges_length(
+            ranges, "sep", "application/octet-stream", 100
+        )
+        parts = body.split(b"--sep")
+        assert parts[-1] == b"--\r\n"
+        assert b"Content-Range: bytes 90-99/100\r\n\r\n" + data[90:] in parts[1]
+        assert b"Content-Range: bytes 0-4/100\r\n\r\n" + data[:5] in parts[2]
+
+    def test_create_file_response_http(self, tmp_path):
+        from fastapi import FastAPI, Request
+        from fastapi.testclient import TestClient
+
+        p = tmp_path / "f.bin"
+        data = bytes(range(256)) * 4
+        p.write_bytes(data)
+        app = FastAPI()
+
+        @app.get("/file")
+        async def get_file(request: Request):
+            return create_file_response(
+                p, request.headers.get("Range"), "application/octet-stream"
+            )
+
+        with TestClient(app) as client:
+            response = client.get("/file")
+            assert response.status_code == 200
+            assert response.content == data
+
+            response = client.get("/file", headers={"Range": "bytes=1000-"})
+            assert response.status_code == 206
+            assert response.content == data[1000:]
+            assert response.headers["content-range"] == "bytes 1000-1023/1024"
+
+            response = client.get("/file", headers={"Range": "bytes=0-9,-4"})
+            assert response.status_code == 206
+            content_type = response.headers["content-type"]
+            assert content_type.startswith("multipart/byteranges; boundary=")
+            assert int(response.headers["content-length"]) == len(response.content)
+            assert data[:10] in response.content
+            assert data[-4:] in response.content
+
+            response = client.get("/file", headers={"Range": "bytes=2000-"})
+            assert response.status_code == 416
+
+    @pytest.mark.asyncio
+    async def test_zerocopy_extension_uses_file_descriptor(self, tmp_path):
+        import os
+
+        p = tmp_path / "f.bin"
+        data = bytes(range(256))
+        p.write_bytes(data)
+        response = create_file_response(p, "bytes=100-149", "application/zip")
+        assert isinstance(response, FileRangeResponse)
+
+        messages = []
+
+        async def send(message):
+            if message["type"] == "http.response.zerocopy":
+                fd = message["file"].fileno()
+                message = {
+                    **message,
+                    "body": os.pread(fd, message["count"], message["offset"]),
+                }
+            messages.append(message)
+
+        scope = {"type": "http", "extensions": {"http.response.zerocopy": {}}}
+        await response(scope, AsyncMock(), send)
+        assert messages[0]["status"] == 206
+        assert (b"content-length", b"50") in messages[0]["headers"]
+        assert messages[1]["type"] == "http.response.zerocopy"
+        assert messages[1]["body"] == data[100:150]
+
+        messages.clear()
+        response = create_file_response(p, None, "application/zip")
+        scope = {"type": "http", "extensions": {"http.response.pathsend": {}}}
+        await response(scope, AsyncMock(), send)
+        assert messages[1] == {
+            "type": "http.response.pathsend",
+            "path": str(p.resolve()),
+        }
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(60)
+    def test_range_requests_local_server(self, tmp_path):
+        # Full, tail range and multipart range reads through a local uvicorn server
+        import os
+        import socket
+        import threading
+        import time
+
+        import httpx
+        import uvicorn
+        from fastapi import FastAPI, Request
+
+        p = tmp_path / "results.bin"
+        size = 16 * 1024 * 1024
+        data = os.urandom(size)
+        p.write_bytes(data)
+        app = FastAPI()
+
+        @app.get("/file")
+        async def get_file(request: Request):
+            return create_file_response(
+                p, request.headers.get("Range"), "application/octet-stream"
+            )
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        try:
+            deadline = time.monotonic() + 10.0
+            while not server.started:
+                if not thread.is_alive() or time.monotonic() > deadline:
+                    pytest.fail("Local uvicorn server did not start")
+                time.sleep(0.01)
+            url = f"http://127.0.0.1:{port}/file"
+            chunk = 256 * 1024
+            with httpx.Client(timeout=30) as client:
+                assert client.get(url).content == data
+
+                for index in range(16):
+                    offset = size - (index + 1) * chunk
+                    response = client.get(
+                        url, headers={"Range": f"bytes={offset}-{offset + chunk - 1}"}
+                    )
+                    assert response.status_code == 206
+                    assert response.content == data[offset : offset + chunk]
+
+                ranges = ",".join(
+                    f"{size - (i + 1) * chunk}-{size - i * chunk - 1}"
+                    for i in range(16)
+                )
+                response = client.get(url, headers={"Range": f"bytes={ranges}"})
+                assert response.status_code == 206
+                assert data[size - chunk :] in response.content
+        finally:
+            server.should_exit = True
+            thread.join(timeout=10.0)
+
+
 class TestRedisKeyFunctions:
     """Tests for Redis key helper functions."""
 
@@ -173,3 +173,128 @@ def test_crps_accuracy(device: str, rtol: float = 1e-2, atol: float = 1e-2) -> N
         rtol=rtol,
         atol=atol,
     )
+
+
+@pytest.mark.parametrize("fair", [True, False])
+@pytest.mark.parametrize("reduction_dimensions", [None, ["lat", "lon"]])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_crps_batch_update(
+    fair: bool, reduction_dimensions: list[str] | None, device: str
+) -> None:
+    x = torch.randn((12, 2, 16, 32), device=device, dtype=torch.float64)
+
+    x_coords = OrderedDict(
+        {
+            "variable": np.array(["t2m", "tcwv"]),
+            "ensemble": np.arange(12),
+            "lat": np.linspace(-90.0, 90.0, 16),
+            "lon": np.linspace(0.0, 360.0, 32, endpoint=False),
+        }
+    )
+    x = x.transpose(0, 1)
+    y_coords = copy.deepcopy(x_coords)
+    y_coords.pop("ensemble")
+    y = torch.randn((2, 16, 32), device=device, dtype=torch.float64)
+
+    z_full, c_full = crps(
+        "ensemble", reduction_dimensions=reduction_dimensions, fair=fair
+    )(x, x_coords, y, y_coords)
+
+    # Exact while the sketch holds every member, approximate beyond
+    for sketch_size, tol in [(12, 1e-8), (4, 5e-2)]:
+        CRPS = crps(
+            "ensemble",
+            reduction_dimensions=reduction_dimensions,
+            fair=fair,
+            batch_update=True,
+            sketch_size=sketch_size,
+        )
+        for i in range(0, 12, 5):
+            batch_coords = x_coords.copy()
+            batch_coords["ensemble"] = x_coords["ensemble"][i : i + 5]
+            z, c = CRPS(x[:, i : i + 5], batch_coords, y, y_coords)
+
+        assert CRPS.n == 12
+        assert CRPS.sketch.shape[0] <= sketch_size
+        for ci in c_full:
+            handshake_coords(c, c_full, ci)
+        if tol < 1e-4:
+            assert torch.allclose(z, z_full, rtol=tol, atol=tol)
+        else:
+            assert torch.mean(torch.abs(z - z_full)) < tol * torch.mean(z_full) + tol
+
+    with pytest.raises(ValueError):
+        crps("ensemble", batch_update=True, sketch_size=0)
+
+
+def _crps_reference_loop(
+    ensemble: torch.Tensor, truth: torch.Tensor, dim: int = 0
+) -> torch.Tensor:
+    # Per-member interval integration of [F(x) - H(x - y)]^2
+    n = ensemble.shape[dim]
+    ensemble, _ = torch.sort(torch.movedim(ensemble, dim, 0), dim=0)
+    ans = torch.clamp(ensemble[0] - truth, min=0.0)
+    for i in range(n - 1):
+        x0, x1 = ensemble[i], ensemble[i + 1]
+        cdf = (i + 1) / n
+        ans = ans + torch.where(truth < x0, (x1 - x0) * (cdf - 1) ** 2, 0.0)
+        mask = (truth >= x0) & (truth <= x1)
+        val = (truth - x0) * cdf**2 + (x1 - truth) * (cdf - 1) ** 2
+        ans = ans + torch.where(mask, val, 0.0)
+        ans = ans + torch.where(truth > x1, (x1 - x0) * cdf**2, 0.0)
+    return ans + torch.clamp(truth - ensemble[n - 1], min=0.0)
+
+
+@pytest.mark.parametrize("dim", [0, 2])
+@pytest.mark.parametrize("chunk_size", [None, 100, 10_000])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_crps_empirical_cdf_vectorized(
+    dim: int, chunk_size: int | None, device: str
+) -> None:
+    x = torch.randn((12, 8, 16, 32), device=device, dtype=torch.float64)
+    # Include ties between members and the observation
+    x[3] = x[4]
+    x = torch.movedim(x, 0, dim)
+    y = torch.randn((12, 8, 16, 32), device=device, dtype=torch.float64)
+    y = torch.movedim(y, 0, dim).select(dim, 0)
+    y[0, 0] = torch.movedim(x, dim, 0)[3, 0, 0]
+
+    c = _crps_from_empirical_cdf(x, y, dim=dim, chunk_size=chunk_size)
+    expected = _crps_reference_loop(x, y, dim=dim)
+    assert c.shape == y.shape
+    assert torch.allclose(c, expected, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_crps_chunk_size(device: str) -> None:
+    x = torch.randn((10, 2, 18, 36), device=device, dtype=torch.float64)
+    y = torch.randn((2, 18, 36), device=device, dtype=torch.float64)
+    x_coords = OrderedDict(
+        {
+            "ensemble": np.arange(10),
+            "variable": np.array(["t2m", "tcwv"]),
+            "lat": np.linspace(-90.0, 90.0, 18),
+            "lon": np.linspace(0.0, 360.0, 36, endpoint=False),
+        }
+    )
+    y_coords = copy.deepcopy(x_coords)
+    y_coords.pop("ensemble")
+
+    z, _ = crps("ensemble", chunk_size=100)(x, x_coords, y, y_coords)
+    z_full, _ = crps("ensemble")(x, x_coords, y, y_coords)
+    assert torch.allclose(z, z_full, rtol=1e-10, atol=1e-10)
+
+    with pytest.raises(ValueError):
+        crps("ensemble", chunk_size=0)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("n_members", [50, 200, 1000])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_crps_empirical_cdf_benchmark(n_members: int, device: str) -> None:
+    x = torch.randn((n_members, 2, 90, 180), device=device)
+    y = torch.randn((2, 90, 180), device=device)
+
+    c = _crps_from_empirical_cdf(x, y)
+    expected = _crps_reference_loop(x, y)
+    assert torch.allclose(c, expected, rtol=1e-3, atol=1e-3)
@@ -266,6 +266,95 @@ def test_batch_var_std(device) -> None:
             handshake_coords(out_test_coords, c, ci)
 
 
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_moments_accumulator(device) -> None:
+    x = torch.randn((64, 8, 4), device=device, dtype=torch.float64) + 1000.0
+    weights = torch.rand((64, 1, 1), device=device, dtype=torch.float64)
+
+    full = moments.MomentsAccumulator().update(x, weights, [0])
+    mean = torch.sum(weights * x, dim=0) / weights.sum()
+    var = torch.sum(weights * (x - mean) ** 2, dim=0) / (weights.sum() - 1)
+    assert torch.allclose(full.mean, mean)
+    assert torch.allclose(full.variance(), var)
+
+    # Merging accumulators of separate streams matches a single pass
+    first = moments.MomentsAccumulator().update(x[:20], weights[:20], [0])
+    second = moments.MomentsAccumulator().update(x[20:], weights[20:], [0])
+    merged = moments.MomentsAccumulator().merge(first).merge(second)
+    assert torch.allclose(merged.mean, mean)
+    assert torch.allclose(merged.variance(), var)
+    assert merged.merge(moments.MomentsAccumulator()) is merged
+
+    # State round trip
+    restored = moments.MomentsAccumulator()
+    restored.load_state_dict(first.state_dict())
+    restored.merge(second)
+    assert torch.allclose(restored.variance(), var)
+    restored.load_state_dict(moments.MomentsAccumulator().state_dict())
+    assert restored.empty
+    with pytest.raises(ValueError):
+        restored.variance()
+
+    # All-reduce is a no-op without torch.distributed
+    assert torch.allclose(full.all_reduce().mean, mean)
+
+
+def test_moments_accumulator_all_reduce(monkeypatch) -> None:
+    # Emulate two ranks holding identical accumulators
+    x = torch.randn((16, 8), dtype=torch.float64)
+    acc = moments.MomentsAccumulator().update(x, torch.ones((16, 1)), [0])
+    expected = moments.MomentsAccumulator().merge(acc).merge(acc)
+
+    monkeypatch.setattr(moments.dist, "is_available", lambda: True)
+    monkeypatch.setattr(moments.dist, "is_initialized", lambda: True)
+    monkeypatch.setattr(moments.dist, "get_world_size", lambda group=None: 2)
+    monkeypatch.setattr(moments.dist, "get_backend", lambda group=None: "gloo")
+    monkeypatch.setattr(
+        moments.dist, "all_reduce", lambda tensor, group=None: tensor.mul_(2)
+    )
+    acc.all_reduce()
+    assert torch.allclose(acc.weight, expected.weight)
+    assert torch.allclose(acc.mean, expected.mean)
+    assert torch.allclose(acc.variance(), expected.variance())
+    # No rank holds data
+    assert moments.MomentsAccumulator().all_reduce().empty
+
+    # Emulate an empty rank reducing with a rank holding acc
+    acc = moments.MomentsAccumulator().update(x, torch.ones((16, 1)), [0])
+    assert acc.weight.dtype == acc.mean.dtype
+
+    def _reduce_with(contributions):
+        def _all_reduce(tensor, group=None):
+            tensor.add_(next(contributions))
+
+        monkeypatch.setattr(moments.dist, "all_reduce", _all_reduce)
+
+    _reduce_with(iter([torch.tensor([0.0, 0.0])]))
+    with pytest.raises(ValueError):
+        moments.MomentsAccumulator().all_reduce()
+
+    _reduce_with(
+        iter([torch.tensor([0.0, 0.0]), acc.weight, acc.mean * acc.weight, acc.m2])
+    )
+    empty = moments.MomentsAccumulator().all_reduce(like=acc.mean)
+    assert torch.allclose(empty.weight, acc.weight)
+    assert torch.allclose(empty.mean, acc.mean)
+    assert torch.allclose(empty.variance(), acc.variance())
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_batch_var_float32_stream(device) -> None:
+    # Long float32 streams with a large offset keep their precision
+    torch.manual_seed(0)
+    big_x = torch.randn((2000, 4), device=device, dtype=torch.float64) + 1e4
+    coords = OrderedDict({"ensemble": np.arange(10), "lat": np.arange(4)})
+    var = moments.variance(["ensemble"], batch_update=True)
+    for inds in range(0, 2000, 10):
+        y, _ = var(big_x[inds : inds + 10].float(), coords)
+    expected = torch.var(big_x.float().double(), dim=0)
+    assert torch.allclose(y.double(), expected, rtol=1e-2)
+
+
 @pytest.mark.parametrize("device", ["cpu", "cuda:0"])
 def test_moments_failures(device) -> None:
     # Test weights not the same shape as reduction dimensions
@@ -193,3 +193,61 @@ def test_rank_histogram_accuracy(
         reduction_dimension**2 / number_of_bins * torch.ones_like(z[1, :]),
         rtol=2.0 * number_of_bins / reduction_dimension,
     )
+
+
+@pytest.mark.parametrize("number_of_bins", [7, None])
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+def test_rank_histogram_batch_update(number_of_bins: int | None, device: str) -> None:
+    x = torch.randn((12, 2, 32, 64), device=device)
+
+    x_coords = OrderedDict(
+        {
+            "ensemble": np.arange(12),
+            "variable": np.array(["t2m", "tcwv"]),
+            "lat": np.linspace(-90.0, 90.0, 32),
+            "lon": np.linspace(0.0, 360.0, 64, endpoint=False),
+        }
+    )
+    y_coords = copy.deepcopy(x_coords)
+    y_coords.pop("ensemble")
+    y = torch.randn((2, 32, 64), device=device)
+
+    RH = rank_histogram(
+        "ensemble",
+        ["lat", "lon"],
+        number_of_bins=number_of_bins,
+        randomize_ties=False,
+    )
+    z_full, c_full = RH(x, x_coords, y, y_coords)
+
+    RH_batch = rank_histogram(
+        "ensemble",
+        ["lat", "lon"],
+        number_of_bins=number_of_bins,
+        randomize_ties=False,
+        batch_update=True,
+    )
+    for i in range(0, 12, 5):
+        batch_coords = x_coords.copy()
+        batch_coords["ensemble"] = x_coords["ensemble"][i : i + 5]
+        z, c = RH_batch(x[i : i + 5], batch_coords, y, y_coords)
+
+    assert RH_batch.n == 12
+    assert z.shape == z_full.shape
+    for ci in c_full:
+        handshake_coords(c, c_full, ci)
+    assert torch.allclose(z, z_full)
+
+    # Randomized ties are resolved from the accumulated counts
+    RH_batch = rank_histogram(
+        "ensemble", ["lat", "lon"], number_of_bins=number_of_bins, batch_update=True
+    )
+    x = torch.round(x)
+    y = torch.round(y)
+    for i in range(0, 12, 5):
+        batch_coords = x_coords.copy()
+        batch_coords["ensemble"] = x_coords["ensemble"][i : i + 5]
+        z, c = RH_batch(x[i : i + 5], batch_coords, y, y_coords)
+    assert RH_batch.n == 12
+    assert z.shape == z_full.shape
+    assert torch.all(z[1] >= 0)
@@ -16,7 +16,9 @@
 
 import json
 import sys
+import threading
 from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta, timezone
 from types import ModuleType
@@ -315,6 +317,213 @@ def test_append_history_size_and_positional_selection(tmp_path):
         assert ckpt.labels == {}
 
 
+def test_async_commit_snapshots_state_and_waits_on_exit(tmp_path, monkeypatch):
+    checkpoint = Checkpoint(
+        "forecast",
+        path=tmp_path,
+        mode="append",
+        flush_interval=1,
+        history_size=3,
+        async_commit=True,
+    )
+    # Session updates must be applied on the caller's thread
+    threads = []
+    finish_commit = checkpoint._finish_commit
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        finish_commit(*args)
+
+    monkeypatch.setattr(checkpoint, "_finish_commit", record_thread)
+
+    with checkpoint as ckpt:
+        state = bind_checkpoint_state(ToyState())
+        state.rng = torch.zeros(4)
+        futures = []
+        buffers = []
+        for hours in (6, 12, 18, 24):
+            state.calls = hours
+            state.rng.fill_(hours)
+            state.weights[:] = hours
+            futures.append(ckpt.write(lead_time=_lead_time(hours)))
+            buffers.append(checkpoint._host_buffers[len(futures) % 2 == 0])
+            # Mutating live state after flush must not leak into the commit
+            state.rng.fill_(-1)
+            state.weights[:] = -1
+        assert all(isinstance(future, Future) for future in futures)
+        assert ckpt.wait() is not None
+        assert ckpt.wait() is None
+
+    assert len(threads) == 4
+    assert all(thread is threading.current_thread() for thread in threads)
+    # Buffers alternate between two sets and are reused once allocated
+    assert buffers[0] is buffers[2] and buffers[1] is buffers[3]
+    assert buffers[0] is not buffers[1]
+    assert len(checkpoint.catalog) == 3
+    entries = [future.result() for future in futures]
+    assert [entry.commit_id for entry in checkpoint.catalog] == [
+        entry.commit_id for entry in entries[1:]
+    ]
+    assert not list(checkpoint.rank_path.glob(".tmp_*"))
+
+    for row, hours in zip((-3, -2, -1), (12, 18, 24)):
+        with checkpoint.select(row) as ckpt:
+            restored = bind_checkpoint_state(ToyState())
+            assert ckpt.lead_time == _lead_time(hours)
+            assert restored.calls == hours
+            assert torch.equal(restored.rng, torch.full((4,), float(hours)))
+            assert np.array_equal(restored.weights, np.full(2, hours, dtype=np.float32))
+
+
+def test_async_commit_failure_surfaces_on_wait(tmp_path, monkeypatch):
+    checkpoint = Checkpoint("forecast", path=tmp_path, async_commit=True)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        with checkpoint as ckpt:
+            monkeypatch.setattr(checkpoint, "_write_commit", fail)
+            future = ckpt.flush(lead_time=_lead_time(0))
+            assert isinstance(future, Future)
+    assert ckpt.wait() is None
+    assert not ckpt.is_active
+
+
+@dataclass
+class LargeState:
+    step: int = 0
+    invariant: np.ndarray = field(
+        default_factory=lambda: np.arange(1 << 18, dtype=np.float32)
+    )
+    forecast: torch.Tensor = field(default_factory=lambda: torch.zeros(1 << 14))
+
+
+def _disk_usage(path):
+    inodes = {}
+    for item in path.rglob("*"):
+        if item.is_file():
+            stat = item.stat()
+            inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+    return sum(inodes.values())
+
+
+@pytest.mark.parametrize("async_commit", [False, True])
+def test_dedup_links_unchanged_arrays_and_collects_blobs(tmp_path, async_commit):
+    checkpoint = Checkpoint(
+        "forecast",
+        path=tmp_path,
+        mode="append",
+        history_size=2,
+        dedup=True,
+        async_commit=async_commit,
+    )
+
+    with checkpoint as ckpt:
+        state = bind_checkpoint_state(LargeState())
+        for step in range(4):
+            state.step = step
+            state.forecast.fill_(step)
+            ckpt.write(lead_time=_lead_time(step))
+
+    entries = checkpoint.catalog
+    assert len(entries) == 2
+
+    def state_file(entry, name):
+        (path,) = (checkpoint.rank_path / "commits" / entry.commit_id).rglob(
+            f"{name}.npy"
+        )
+        return path.stat()
+
+    first, second = (state_file(entry, "invariant") for entry in entries)
+    assert (first.st_dev, first.st_ino) == (second.st_dev, second.st_ino)
+    first, second = (state_file(entry, "forecast") for entry in entries)
+    assert first.st_ino != second.st_ino
+
+    # One invariant blob and one blob per retained field value remain
+    blobs = list((checkpoint.rank_path / "blobs").glob("*/*.npy"))
+    assert len(blobs) == 3
+    assert all(blob.stat().st_nlink > 1 for blob in blobs)
+
+    with checkpoint.select(-2):
+        restored = bind_checkpoint_state(LargeState())
+        assert restored.step == 2
+        assert torch.equal(restored.forecast, torch.full((1 << 14,), 2.0))
+        assert np.array_equal(restored.invariant, np.arange(1 << 18, dtype=np.float32))
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+def test_dedup_checkpoint_benchmark(tmp_path):
+    # 100 flushes of a 16 MB static array and a 1 MB evolving field
+    usage = {}
+    for dedup in (False, True):
+        checkpoint = Checkpoint(
+            "forecast",
+            path=tmp_path / f"dedup_{dedup}",
+            mode="append",
+            history_size=10,
+            dedup=dedup,
+        )
+        with checkpoint as ckpt:
+            state = bind_checkpoint_state(
+                LargeState(
+                    invariant=np.random.rand(1 << 22).astype(np.float32),
+                    forecast=torch.zeros(1 << 18),
+                )
+            )
+            for step in range(100):
+                state.step = step
+                state.forecast.add_(1.0)
+                ckpt.flush(lead_time=_lead_time(step))
+        usage[dedup] = _disk_usage(checkpoint.rank_path)
+        assert len(checkpoint.catalog) == 10
+
+    # The static array is stored once instead of once per retained commit
+    assert usage[True] < usage[False] / 4
+
+
+def test_restore_inplace_streams_into_existing_arrays(tmp_path, monkeypatch):
+    import earth2studio.utils.checkpoint as checkpoint_module
+
+    with Checkpoint("forecast", path=tmp_path) as ckpt:
+        state = bind_checkpoint_state(LargeState())
+        state.step = 3
+        state.invariant = np.linspace(0, 1, 1000, dtype=np.float32)
+        state.forecast = torch.arange(100, dtype=torch.float32)
+        ckpt.flush(lead_time=_lead_time(0))
+
+    # Default restore returns new, writable arrays rather than memory maps
+    with Checkpoint("forecast", path=tmp_path):
+        restored = bind_checkpoint_state(LargeState())
+        assert type(restored.invariant) is np.ndarray
+        assert restored.invariant.flags.writeable
+        assert torch.equal(restored.forecast, torch.arange(100, dtype=torch.float32))
+
+    monkeypatch.setattr(checkpoint_module, "_RESTORE_CHUNK_BYTES", 64)
+    invariant = np.zeros(1000, dtype=np.float32)
+    forecast = torch.zeros(100, requires_grad=True)
+    with Checkpoint("forecast", path=tmp_path, restore_inplace=True):
+        restored = bind_checkpoint_state(
+            LargeState(invariant=invariant, forecast=forecast)
+        )
+        assert restored.step == 3
+        assert restored.invariant is invariant
+        assert restored.forecast is forecast
+        assert np.array_equal(invariant, np.linspace(0, 1, 1000, dtype=np.float32))
+        assert torch.equal(forecast.detach(), torch.arange(100, dtype=torch.float32))
+
+    # Mismatched layouts fall back to replacing the field value
+    forecast = torch.zeros(10)
+    with Checkpoint("forecast", path=tmp_path, restore_inplace=True):
+        restored = bind_checkpoint_state(
+            LargeState(invariant=invariant.astype(np.float64), forecast=forecast)
+        )
+        assert restored.forecast is not forecast
+        assert restored.forecast.shape == (100,)
+        assert restored.invariant.dtype == np.float32
+
+
 def test_bind_before_new_session_is_adopted_on_enter(tmp_path):
     checkpoint = Checkpoint("forecast", path=tmp_path, flush_interval=2, level=1)
 
@@ -27,6 +27,8 @@ from earth2studio.utils import (
     handshake_size,
 )
 from earth2studio.utils.coords import (
+    _NEAREST_INDEX_CACHE,
+    _nearest_index,
     cat_coords,
     map_coords,
     split_coords,
@@ -157,6 +159,38 @@ def test_map_nearest(device):
     assert torch.allclose(out, data[:, :2])
 
 
+@pytest.mark.parametrize(
+    "inc,outc",
+    [
+        (np.linspace(-90, 90, 721), np.linspace(20, 55, 141)),
+        (np.linspace(90, -90, 721), np.linspace(-1.3, 60.7, 51)),
+        (np.array([3, 1, 2, 1, 5]), np.array([0.0, 1.5, 1.0, 4.0, 9.0])),
+        (np.random.default_rng(0).uniform(0, 360, 200), np.arange(0, 360, 0.7)),
+    ],
+)
+def test_map_nearest_index(inc, outc):
+    dist = np.abs(inc[:, np.newaxis] - outc[np.newaxis, :])
+    assert np.array_equal(_nearest_index(inc, outc), np.argmin(dist, axis=0))
+
+
+def test_map_nearest_cache():
+    coords = OrderedDict([("lat", np.linspace(-90, 90, 181))])
+    out_coords = OrderedDict([("lat", np.linspace(20.2, 50.2, 31))])
+    data = torch.randn(181)
+
+    _NEAREST_INDEX_CACHE.clear()
+    out0, _ = map_coords(data, coords, out_coords)
+    assert len(_NEAREST_INDEX_CACHE) == 1
+    idx = next(iter(_NEAREST_INDEX_CACHE.values()))
+
+    out1, outc = map_coords(data, coords, out_coords)
+    assert len(_NEAREST_INDEX_CACHE) == 1
+    assert next(iter(_NEAREST_INDEX_CACHE.values())) is idx
+    assert torch.equal(out0, out1)
+    assert torch.equal(out1, data[110:141])
+    assert np.all(outc["lat"] == out_coords["lat"])
+
+
 def test_map_roll_condition():
     input_coords = OrderedDict({"lon": np.array([0, 90, 180, 270])})
     output_coords = OrderedDict({"lon": np.array([180, 270, 0, 90])})
@@ -14,6 +14,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
+import subprocess
+import sys
+
 import pytest
 
 from earth2studio.utils.imports import (
@@ -23,6 +27,7 @@ from earth2studio.utils.imports import (
     _get_group_packages,
     _parse_optional_dependencies,
     check_optional_dependencies,
+    lazy_import_attributes,
     pytest_require,
 )
 
@@ -314,3 +319,63 @@ class TestPytestRequire:
         """Test that no requirements means no skip."""
         marker = pytest_require()
         assert marker.args[0] is False
+
+
+def test_lazy_import_attributes():
+    import earth2studio.utils as utils_pkg
+
+    getattr_fn, dir_fn = lazy_import_attributes(
+        "earth2studio.utils", {".time": ["normalize_time_tolerance"]}
+    )
+    from earth2studio.utils.time import normalize_time_tolerance
+
+    assert getattr_fn("normalize_time_tolerance") is normalize_time_tolerance
+    assert "normalize_time_tolerance" in dir_fn()
+    # Submodule access
+    assert getattr_fn("coords") is utils_pkg.coords
+    with pytest.raises(AttributeError, match="has no attribute"):
+        getattr_fn("not_a_real_attribute")
+
+
+@pytest.mark.parametrize(
+    "package,member",
+    [
+        ("earth2studio.models.px", "Persistence"),
+        ("earth2studio.models.dx", "Identity"),
+        ("earth2studio.models.da", "InterpEquirectangular"),
+        ("earth2studio.data", "Random"),
+    ],
+)
+def test_lazy_package_registry(package, member):
+    module = __import__(package, fromlist=[member])
+    assert member in dir(module)
+    obj = getattr(module, member)
+    assert obj.__name__ == member
+    # Resolved members are cached on the package
+    assert vars(module)[member] is obj
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        "earth2studio.models.px",
+        "earth2studio.models.dx",
+        "earth2studio.models.da",
+        "earth2studio.data",
+    ],
+)
+def test_lazy_package_import(package):
+    # Importing the package in a fresh interpreter must not import its submodules
+    script = (
+        "import json, sys\n"
+        f"import {package}\n"
+        f"print(json.dumps([m for m in sys.modules if m.startswith('{package}.')]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(json.loads(result.stdout.splitlines()[-1]))
+    assert loaded <= {f"{package}.base"}, f"Eagerly imported {loaded}"
@@ -17,8 +17,14 @@
 import numpy as np
 import pytest
 import torch
+import xarray as xr
 
-from earth2studio.utils.interp import LatLonInterpolation, NearestNeighborInterpolator
+from earth2studio.utils import interp as interp_module
+from earth2studio.utils.interp import (
+    LatLonInterpolation,
+    NearestNeighborInterpolator,
+    RegularGridInterpolation,
+)
 
 
 @pytest.mark.parametrize("device", ["cpu", "cuda:0"])
@@ -82,6 +88,84 @@ def test_interpolation_analytical(device):
     assert (abs(y - y_correct) < epsilon).all()
 
 
+@pytest.mark.parametrize("device", ["cpu", "cuda:0"])
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+@pytest.mark.parametrize("target", ["1d", "2d"])
+def test_regular_grid_interpolation(device, method, target):
+    lat_in = np.linspace(90, -90, 37)
+    lon_in = np.linspace(0, 360, 72, endpoint=False)
+    da = xr.DataArray(
+        np.random.rand(3, 2, 37, 72),
+        dims=["time", "variable", "lat", "lon"],
+        coords={"lat": lat_in, "lon": lon_in},
+    )
+
+    lat = np.linspace(60.3, -20.1, 25)
+    # Includes points outside of the input longitude range
+    lon = np.linspace(130.7, 359.0, 40)
+    if target == "1d":
+        target_lat = xr.DataArray(lat, dims=["_lat"])
+        target_lon = xr.DataArray(lon, dims=["_lon"])
+        lat_out, lon_out = np.meshgrid(lat, lon, indexing="ij")
+    else:
+        lat_out, lon_out = np.meshgrid(lat, lon, indexing="ij")
+        lat_out = lat_out + 0.1 * np.sin(lon_out)
+        target_lat = xr.DataArray(lat_out, dims=["y", "x"])
+        target_lon = xr.DataArray(lon_out, dims=["y", "x"])
+    expected = da.interp(lat=target_lat, lon=target_lon, method=method).values
+
+    interp = RegularGridInterpolation(lat_in, lon_in, lat_out, lon_out, method)
+    interp.to(device=device)
+    x = torch.tensor(da.values, device=device)
+    y = interp(x)
+
+    assert y.shape == (3, 2, 25, 40)
+    assert y.device == x.device
+    assert torch.isnan(y[..., -1]).all()
+    assert np.allclose(y.cpu().numpy(), expected, equal_nan=True)
+
+    with pytest.raises(ValueError):
+        RegularGridInterpolation(lat_in, lon_in, lat_out, lon_out, "cubic")
+
+
+def test_interpolation_index_map_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("EARTH2STUDIO_CACHE", str(tmp_path))
+    monkeypatch.delenv("EARTH2STUDIO_DATA_CACHE", raising=False)
+    monkeypatch.setattr(interp_module, "_INDEX_MAP_CACHE", interp_module.OrderedDict())
+
+    (lat_in, lon_in) = np.meshgrid(
+        np.arange(35.0, 38.0, 0.25), np.arange(5.0, 8.0, 0.25), indexing="ij"
+    )
+    (lat_out, lon_out) = np.meshgrid(
+        np.arange(36.0, 37.0, 0.1), np.arange(6.0, 7.0, 0.1), indexing="ij"
+    )
+
+    reference = LatLonInterpolation(lat_in, lon_in, lat_out, lon_out, cache=False)
+    assert not (tmp_path / "interp").exists()
+
+    interp = LatLonInterpolation(lat_in, lon_in, lat_out, lon_out)
+    assert len(list((tmp_path / "interp").glob("latlon_*.npz"))) == 1
+    assert len(interp_module._INDEX_MAP_CACHE) == 1
+    assert torch.equal(interp.i_map, reference.i_map)
+    assert torch.equal(interp.j_map, reference.j_map)
+
+    def _fail(*args):
+        raise AssertionError("Index maps should be loaded from cache")
+
+    # In-process hit, then on-disk hit once the LRU is cleared
+    monkeypatch.setattr(interp_module, "_compute_index_maps", _fail)
+    interp = LatLonInterpolation(lat_in, lon_in, lat_out, lon_out)
+    assert torch.equal(interp.i_map, reference.i_map)
+    interp_module._INDEX_MAP_CACHE.clear()
+    interp = LatLonInterpolation(lat_in, lon_in, lat_out, lon_out)
+    assert torch.equal(interp.i_map, reference.i_map)
+    assert torch.equal(interp.j_map, reference.j_map)
+
+    # Different output grid is a new cache entry
+    with pytest.raises(AssertionError):
+        LatLonInterpolation(lat_in, lon_in, lat_out + 0.05, lon_out)
+
+
 @pytest.mark.parametrize("device", ["cpu", "cuda:0"])
 def test_nearest_neighbor_interpolator_1d_correctness(device):
     source_lats = torch.tensor([0.0, 45.0])
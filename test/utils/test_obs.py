@@ -19,7 +19,13 @@ import pandas as pd
 import pytest
 import torch
 
-from earth2studio.utils.obs import ObsGridMapping
+from earth2studio.utils.obs import (
+    ObsGridMapping,
+    filter_time_range,
+    merge_time_windows,
+    partition_time_range,
+    time_window_rows,
+)
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -396,3 +402,101 @@ def test_obs_to_grid_irregular(device):
     assert y is not None
     assert mask.sum().item() >= 1
     assert y.device.type == torch.device(device).type
+
+
+# ---------------------------------------------------------------------------
+# Time window filtering
+# ---------------------------------------------------------------------------
+
+
+def _time_frame(n: int, sort: bool, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    offsets = rng.integers(0, 48 * 3600, size=n).astype("timedelta64[s]")
+    if sort:
+        offsets = np.sort(offsets)
+    return pd.DataFrame(
+        {
+            "time": np.datetime64("2024-01-01T00:00:00", "ns") + offsets,
+            "observation": np.arange(n, dtype=np.float32),
+        }
+    )
+
+
+def _mask_filter(df, times, tolerance):
+    mask = np.zeros(len(df), dtype=bool)
+    for t in times:
+        mask |= (df["time"] >= t + tolerance[0]).to_numpy() & (
+            df["time"] <= t + tolerance[1]
+        ).to_numpy()
+    return df[mask]
+
+
+def test_merge_time_windows():
+    times = np.array(
+        ["2024-01-01T06", "2024-01-01T00", "2024-01-01T01", "2024-01-01T12"],
+        dtype="datetime64[ns]",
+    )
+    tolerance = (np.timedelta64(-30, "m"), np.timedelta64(30, "m"))
+    starts, ends = merge_time_windows(times, tolerance)
+    np.testing.assert_array_equal(
+        starts,
+        np.array(
+            ["2023-12-31T23:30", "2024-01-01T05:30", "2024-01-01T11:30"],
+            dtype="datetime64[ns]",
+        ),
+    )
+    np.testing.assert_array_equal(
+        ends,
+        np.array(
+            ["2024-01-01T01:30", "2024-01-01T06:30", "2024-01-01T12:30"],
+            dtype="datetime64[ns]",
+        ),
+    )
+
+
+@pytest.mark.parametrize("sort", [True, False])
+def test_filter_time_range_sorted_engine(sort):
+    df = _time_frame(5000, sort)
+    times = np.datetime64("2024-01-01T00", "ns") + np.arange(0, 48, 5).astype(
+        "timedelta64[h]"
+    )
+    tolerance = (np.timedelta64(-3, "h"), np.timedelta64(1, "h"))
+
+    expected = _mask_filter(df, times, tolerance)
+    for _ in range(2):  # second pass uses the cached sort permutation
+        result = filter_time_range(df, times, tolerance)
+        pd.testing.assert_frame_equal(result, expected)
+
+    rows = time_window_rows(df, times, tolerance)
+    parts = partition_time_range(df, times, tolerance)
+    assert len(rows) == len(parts) == len(times)
+    for t, r, part in zip(times, rows, parts):
+        expected = filter_time_range(df, t, tolerance)
+        np.testing.assert_array_equal(df.index[r], expected.index)
+        pd.testing.assert_frame_equal(part, expected)
+
+    # Replacing the time column invalidates the cached order
+    df["time"] = df["time"].to_numpy()[::-1]
+    pd.testing.assert_frame_equal(
+        filter_time_range(df, times, tolerance), _mask_filter(df, times, tolerance)
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+@pytest.mark.parametrize("sort", [True, False])
+def test_filter_time_range_benchmark(sort):
+    # 10M row frame, comparable to a day of NNJA / ISD observations
+    df = _time_frame(10_000_000, sort)
+    times = np.datetime64("2024-01-01T00", "ns") + np.arange(0, 48, 1).astype(
+        "timedelta64[h]"
+    )
+    tolerance = (np.timedelta64(-30, "m"), np.timedelta64(30, "m"))
+
+    expected = [_mask_filter(df, [t], tolerance) for t in times]
+    parts = partition_time_range(df, times, tolerance)
+    union = filter_time_range(df, times, tolerance)
+
+    for part, exp in zip(parts, expected):
+        assert len(part) == len(exp)
+    assert max(len(part) for part in parts) <= len(union) <= len(df)